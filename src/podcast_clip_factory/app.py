@@ -15,13 +15,23 @@ from podcast_clip_factory.application.pipeline_executor import PipelineExecutor
 from podcast_clip_factory.domain.clip_rules import ClipRuleConfig, ClipRuleEngine
 from podcast_clip_factory.infrastructure.llm.fallback_client import HeuristicClipAnalyzer
 from podcast_clip_factory.infrastructure.llm.gemini_client import GeminiClipAnalyzer
+from podcast_clip_factory.infrastructure.render.encoder_probe import EncoderProbe
 from podcast_clip_factory.infrastructure.render.ffmpeg_builder import FFmpegCommandBuilder
 from podcast_clip_factory.infrastructure.render.local_renderer import LocalFFmpegRenderer
+from podcast_clip_factory.infrastructure.render.output_validator import RenderedOutputValidator
+from podcast_clip_factory.infrastructure.render.overlay_image_cache import OverlayImageCache
+from podcast_clip_factory.infrastructure.render.render_cache import RenderCache
 from podcast_clip_factory.infrastructure.render.subtitle_generator import SubtitleGenerator
 from podcast_clip_factory.infrastructure.storage.artifact_store import ArtifactStore
+from podcast_clip_factory.infrastructure.storage.media_probe_cache import MediaProbeCache
 from podcast_clip_factory.infrastructure.storage.sqlite_repo import SQLiteJobRepository
-from podcast_clip_factory.infrastructure.transcriber.faster_whisper import FasterWhisperTranscriber
+from podcast_clip_factory.infrastructure.storage.transcript_cache import TranscriptCache
+from podcast_clip_factory.infrastructure.transcriber.faster_whisper import (
+    FasterWhisperOptions,
+    FasterWhisperTranscriber,
+)
 from podcast_clip_factory.infrastructure.transcriber.mlx_whisper import MLXWhisperTranscriber
+from podcast_clip_factory.infrastructure.transcriber.worker import TranscriptionWorkerClient
 from podcast_clip_factory.presentation.main_view import MainView
 from podcast_clip_factory.utils.config import load_settings
 from podcast_clip_factory.utils.logger import configure_logger, get_logger
@@ -35,14 +45,37 @@ def build_orchestrator(root_dir: Path) -> AppOrchestrator:
 
     repo = SQLiteJobRepository(root_dir / "runs" / "jobs.db")
     store = ArtifactStore(root_dir / "runs")
-
+    probe_cache = MediaProbeCache(root_dir / "runs" / "media_cache.db")
+
+    transcribe_worker = None
+    if settings.transcribe.resident_worker:
+        transcribe_worker = TranscriptionWorkerClient(
+            socket_path=(
+                Path(settings.transcribe.worker_socket).expanduser()
+                if settings.transcribe.worker_socket
+                else None
+            ),
+            idle_timeout_sec=settings.transcribe.worker_idle_minutes * 60.0,
+        )
     primary_transcriber = MLXWhisperTranscriber(
         model=settings.transcribe.mlx_model,
         word_timestamps=settings.transcribe.word_timestamps,
+        worker=transcribe_worker,
     )
     fallback_transcriber = FasterWhisperTranscriber(
         model=settings.transcribe.faster_model,
         word_timestamps=settings.transcribe.word_timestamps,
+        chunk_sec=settings.transcribe.chunk_minutes * 60.0,
+        chunk_workers=settings.transcribe.chunk_workers,
+        chunk_cpu_threads=settings.transcribe.chunk_cpu_threads,
+        worker=transcribe_worker,
+        options=FasterWhisperOptions(
+            compute_type=settings.transcribe.faster_compute_type,
+            cpu_threads=settings.transcribe.faster_cpu_threads,
+            num_workers=settings.transcribe.faster_num_workers,
+            batch_size=settings.transcribe.faster_batch_size,
+            beam_size=settings.transcribe.faster_beam_size,
+        ),
     )
 
     llm_analyzer = GeminiClipAnalyzer(
@@ -63,11 +96,31 @@ def build_orchestrator(root_dir: Path) -> AppOrchestrator:
         )
     )
 
+    base_layer_cache = None
+    if settings.app.base_layer_cache_max_gb > 0:
+        base_layer_cache = RenderCache(
+            root_dir / "runs" / "base_layer_cache",
+            max_bytes=int(settings.app.base_layer_cache_max_gb * 1024**3),
+            suffix=FFmpegCommandBuilder.BASE_LAYER_SUFFIX,
+        )
+
+    overlay_images = None
+    if settings.render.text_overlay_images:
+        overlay_images = OverlayImageCache(root_dir / "runs" / "overlay_cache")
+
     renderer = LocalFFmpegRenderer(
         app_config=settings.app,
-        command_builder=FFmpegCommandBuilder(settings.render),
+        command_builder=FFmpegCommandBuilder(settings.render, overlay_images=overlay_images),
         subtitle_generator=SubtitleGenerator(settings.subtitle),
         enable_subtitles=settings.subtitle.enable_subtitles,
+        probe_cache=probe_cache,
+        logger=logger,
+        encoder_probe=EncoderProbe(root_dir / "runs" / "encoder_cache.json"),
+        render_cache=RenderCache(
+            root_dir / "runs" / "render_cache",
+            max_bytes=int(settings.app.render_cache_max_gb * 1024**3),
+        ),
+        base_layer_cache=base_layer_cache,
     )
 
     executor = PipelineExecutor(
@@ -81,6 +134,20 @@ def build_orchestrator(root_dir: Path) -> AppOrchestrator:
         rule_engine=rule_engine,
         renderer=renderer,
         logger=logger,
+        probe_cache=probe_cache,
+        validator=(
+            RenderedOutputValidator(max_workers=settings.app.validation_parallelism)
+            if settings.app.validation_parallelism > 0
+            else None
+        ),
+        transcript_cache=(
+            TranscriptCache(
+                root_dir / "runs" / "transcript_cache",
+                max_bytes=int(settings.transcribe.cache_max_gb * 1024**3),
+            )
+            if settings.transcribe.cache_max_gb > 0
+            else None
+        ),
     )
 
     return AppOrchestrator(executor=executor, repo=repo, store=store, logger=logger)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import shutil
 from pathlib import Path
 
 from podcast_clip_factory.domain.models import (
@@ -13,7 +12,7 @@ from podcast_clip_factory.domain.models import (
 )
 from podcast_clip_factory.infrastructure.storage.artifact_store import ArtifactStore
 from podcast_clip_factory.infrastructure.storage.sqlite_repo import SQLiteJobRepository
-from podcast_clip_factory.utils.paths import sanitize_filename
+from podcast_clip_factory.utils.paths import link_or_copy, sanitize_filename
 
 
 class AppOrchestrator:
@@ -26,6 +25,9 @@ class AppOrchestrator:
     def run_pipeline(self, input_video: Path, on_progress=None, on_log=None):
         return self.executor.run(input_video=input_video, on_progress=on_progress, on_log=on_log)
 
+    def resume_pipeline(self, job_id: str, on_progress=None, on_log=None):
+        return self.executor.resume(job_id=job_id, on_progress=on_progress, on_log=on_log)
+
     def request_stop(self) -> None:
         self.executor.request_stop()
 
@@ -43,6 +45,21 @@ class AppOrchestrator:
     def get_review_rows(self, job_id: str) -> list[dict]:
         return self.repo.get_review_rows(job_id)
 
+    def overlay_preview_image(
+        self,
+        kind: str,
+        text: str,
+        style: TitleOverlayStyle | ImpactOverlayStyle,
+    ) -> Path | None:
+        preview_of = getattr(self.executor.renderer, "overlay_preview_image", None)
+        if not callable(preview_of):
+            return None
+        try:
+            return preview_of(kind, text, style)
+        except Exception as exc:
+            self.logger.warning("review.overlay_preview_failed", kind=kind, error=str(exc)[-300:])
+            return None
+
     def finalize_review(
         self,
         job_id: str,
@@ -87,7 +104,13 @@ class AppOrchestrator:
             if on_log:
                 on_log("確定出力レンダリングを開始します")
 
-            def _on_render_event(kind: str, idx: int, total: int, title: str) -> None:
+            def _on_render_event(
+                kind: str,
+                idx: int,
+                total: int,
+                title: str,
+                fraction: float = 0.0,
+            ) -> None:
                 if not on_log:
                     return
                 if kind == "started":
@@ -97,22 +120,43 @@ class AppOrchestrator:
                 elif kind == "failed":
                     on_log(f"確定出力レンダリング失敗 {idx}/{total}: {title}")
 
-            rendered = self.executor.renderer.render(
-                input_video=job.input_path,
-                output_dir=render_output_dir,
-                candidates=candidates,
-                transcript=transcript,
-                title_style=title_style,
-                impact_style=impact_style,
-                on_event=_on_render_event,
-                cancel_event=self.executor.cancel_event,
-            )
+            renderer = self.executor.renderer
+            video_paths: dict[str, Path] = {}
+            to_render: list[ClipCandidate] = []
+            for candidate, row in zip(candidates, selected_rows, strict=True):
+                if self._preview_is_current(renderer, candidate, row, title_style, impact_style):
+                    video_paths[candidate.clip_id] = Path(row["video_path"])
+                else:
+                    to_render.append(candidate)
+
+            if on_log and len(to_render) < len(candidates):
+                reused = len(candidates) - len(to_render)
+                on_log(f"変更のない {reused}本 はプレビュー出力を再利用します")
+
+            if to_render:
+                rendered = renderer.render(
+                    input_video=job.input_path,
+                    output_dir=render_output_dir,
+                    candidates=to_render,
+                    transcript=transcript,
+                    title_style=title_style,
+                    impact_style=impact_style,
+                    on_event=_on_render_event,
+                    cancel_event=self.executor.cancel_event,
+                    silence_map=self.executor.load_silence_map(job_id),
+                )
+                for clip in rendered:
+                    video_paths[clip.clip_id] = clip.video_path
 
             for idx, row in enumerate(selected_rows, start=1):
+                src = video_paths.get(str(row["clip_id"]))
+                if src is None:
+                    if on_log:
+                        on_log(f"確定出力に失敗したためスキップします: {row['title']}")
+                    continue
                 safe_title = sanitize_filename(row["title"])
                 dst = final_dir / f"clip_{idx:02d}_{safe_title}.mp4"
-                src = rendered[idx - 1].video_path
-                shutil.copy2(src, dst)
+                link_or_copy(src, dst)
                 exported.append(
                     {
                         "clip_id": row["clip_id"],
@@ -121,6 +165,7 @@ class AppOrchestrator:
                         "end_sec": row["end_sec"],
                         "score": row["score"],
                         "final_path": str(dst),
+                        "rerendered": any(c.clip_id == row["clip_id"] for c in to_render),
                     }
                 )
 
@@ -147,6 +192,21 @@ class AppOrchestrator:
         self.logger.info("job.completed", job_id=job_id, selected_count=len(exported))
         return payload
 
+    def _preview_is_current(
+        self,
+        renderer,
+        candidate: ClipCandidate,
+        row: dict,
+        title_style: TitleOverlayStyle | None,
+        impact_style: ImpactOverlayStyle | None,
+    ) -> bool:
+        signature_of = getattr(renderer, "overlay_signature", None)
+        stored = str(row.get("render_signature") or "")
+        preview = Path(str(row.get("video_path") or ""))
+        if not callable(signature_of) or not stored or not preview.is_file():
+            return False
+        return signature_of(candidate, title_style, impact_style) == stored
+
     def _resolve_export_dir(self, job_id: str) -> Path:
         base = Path(self.executor.settings.app.default_media_dir).expanduser()
         target = base / f"shorts_{job_id}"
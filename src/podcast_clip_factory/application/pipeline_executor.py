@@ -1,22 +1,52 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import asdict
 from pathlib import Path
-from threading import Event, Thread
+from threading import Event, Lock, Thread
 from time import monotonic
 
 from podcast_clip_factory.application.retry_policy import retry
 from podcast_clip_factory.domain.clip_rules import ClipRuleEngine
-from podcast_clip_factory.domain.models import JobStatus, PipelineResult, Transcript
+from podcast_clip_factory.domain.compacted_timeline import CompactedTimeline
+from podcast_clip_factory.domain.models import JobStatus, PipelineResult, RenderedClip, Transcript
 from podcast_clip_factory.domain.protocols import ClipAnalyzer
+from podcast_clip_factory.domain.silence_map import SilenceMap
+from podcast_clip_factory.infrastructure.render.output_validator import RenderedOutputValidator
 from podcast_clip_factory.infrastructure.storage.artifact_store import ArtifactStore
+from podcast_clip_factory.infrastructure.storage.media_probe_cache import MediaProbeCache
 from podcast_clip_factory.infrastructure.storage.sqlite_repo import SQLiteJobRepository
+from podcast_clip_factory.infrastructure.storage.transcript_cache import TranscriptCache
+from podcast_clip_factory.infrastructure.storage.transcript_checkpoint import TranscriptCheckpoint
 from podcast_clip_factory.utils.config import Settings
-from podcast_clip_factory.utils.media import extract_audio, ffprobe_media
+from podcast_clip_factory.utils.media import (
+    audio_content_hash,
+    detect_silence,
+    extract_audio,
+    ffprobe_media,
+    parse_silencedetect,
+    stream_audio_pcm,
+    write_wav,
+    write_wav_async,
+)
 
 ProgressCallback = Callable[[str, float], None]
 LogCallback = Callable[[str], None]
 
+# Failed jobs, or jobs a crash left mid-pipeline; finished and in-review jobs are never
+# re-rendered over their reviewed outputs.
+RESUMABLE_STATUSES = frozenset(
+    {
+        JobStatus.FAILED,
+        JobStatus.PREPROCESSING,
+        JobStatus.TRANSCRIBING,
+        JobStatus.SELECTING,
+        JobStatus.PREPARING,
+        JobStatus.RENDERING,
+        JobStatus.VALIDATING,
+    }
+)
+
 
 class PipelineExecutor:
     def __init__(
@@ -31,6 +61,9 @@ class PipelineExecutor:
         rule_engine: ClipRuleEngine,
         renderer,
         logger,
+        probe_cache: MediaProbeCache | None = None,
+        validator: RenderedOutputValidator | None = None,
+        transcript_cache: TranscriptCache | None = None,
     ) -> None:
         self.settings = settings
         self.repo = repo
@@ -42,6 +75,9 @@ class PipelineExecutor:
         self.rule_engine = rule_engine
         self.renderer = renderer
         self.logger = logger
+        self.probe_cache = probe_cache
+        self.validator = validator
+        self.transcript_cache = transcript_cache
         self._cancel_event = Event()
 
     def request_stop(self) -> None:
@@ -75,13 +111,14 @@ class PipelineExecutor:
                 on_progress,
                 on_log,
             )
-            media_info = ffprobe_media(input_video)
+            media_info = self._probe_media(input_video)
             audio_path = self.store.audio_path(job.job_id)
             self._emit_log(
                 on_log,
                 (
                     f"入力動画: {media_info.duration_sec / 60:.1f}分 / "
-                    f"{media_info.width}x{media_info.height} / {media_info.fps:.2f}fps"
+                    f"{media_info.width}x{media_info.height} / {media_info.fps:.2f}fps / "
+                    f"{media_info.video_codec or '?'}+{media_info.audio_codec or '?'}"
                 ),
             )
             self._emit_log(
@@ -90,8 +127,20 @@ class PipelineExecutor:
             )
             self._ensure_cloud_available(on_log=on_log)
             self._check_cancel(job.job_id, on_log)
-            extract_audio(input_video, audio_path, cancel_event=self._cancel_event)
-            self._emit_log(on_log, "音声抽出が完了しました")
+            audio_samples = None
+            wav_writer = None
+            if self.settings.transcribe.stream_audio:
+                audio_samples, wav_writer, silence_map = self._stream_audio(
+                    job.job_id,
+                    input_video,
+                    audio_path,
+                    media_info.duration_sec,
+                    on_log=on_log,
+                )
+            else:
+                extract_audio(input_video, audio_path, cancel_event=self._cancel_event)
+                self._emit_log(on_log, "音声抽出が完了しました")
+                silence_map = self._build_silence_map(job.job_id, audio_path, on_log=on_log)
 
             self._check_cancel(job.job_id, on_log)
             self._update_status(
@@ -102,12 +151,24 @@ class PipelineExecutor:
                 on_progress,
                 on_log,
             )
+            checkpoint = TranscriptCheckpoint(self.store.partial_transcript_path(job.job_id))
             transcript = self._run_with_heartbeat(
-                operation=lambda: self._transcribe(audio_path, on_log=on_log),
+                operation=lambda: self._transcribe(
+                    audio_path,
+                    on_log=on_log,
+                    audio_samples=audio_samples,
+                    wav_writer=wav_writer,
+                    silence_map=silence_map,
+                    checkpoint=checkpoint,
+                ),
                 phase_label="文字起こし",
                 base_progress=0.24,
                 on_progress=on_progress,
                 on_log=on_log,
+                progress_span=0.22,
+                phase_fraction=lambda: self._transcribed_fraction(
+                    checkpoint, media_info.duration_sec
+                ),
             )
             if transcript.duration_sec <= 0:
                 transcript.duration_sec = media_info.duration_sec
@@ -145,102 +206,365 @@ class PipelineExecutor:
                 ),
             )
             self.repo.save_candidates(job.job_id, final_candidates)
+            self.store.save_candidates(job.job_id, final_candidates, selection_source)
+            return self._render_and_review(
+                job,
+                input_video,
+                media_info,
+                transcript,
+                silence_map,
+                final_candidates,
+                selection_source,
+                on_progress,
+                on_log,
+            )
+        except Exception as exc:
+            self._fail_job(job.job_id, exc, on_log)
+            raise
+
+    def resume(
+        self,
+        job_id: str,
+        on_progress: ProgressCallback | None = None,
+        on_log: LogCallback | None = None,
+    ) -> PipelineResult:
+        """Re-enter an interrupted job at the render stage in its own job directory.
+
+        The saved transcript, silence map and candidate list are reused, and clips that the
+        interrupted run already finished are skipped by the renderer's completion manifest.
+        """
+        self.clear_stop()
+        job = self.repo.get_job(job_id)
+        if job.status not in RESUMABLE_STATUSES:
+            raise RuntimeError(
+                f"ジョブ {job_id} は再開できる状態ではありません（{job.status.value}）"
+            )
+        self._emit_log(on_log, f"ジョブ再開: {job_id}（レンダリングから）")
+        try:
+            saved = self.store.load_candidates(job_id)
+            transcript_path = self.store.transcript_path(job_id)
+            if saved is None or not transcript_path.exists():
+                raise RuntimeError(
+                    f"ジョブ {job_id} は候補抽出前に停止したため再開できません。再実行してください"
+                )
+            final_candidates, selection_source = saved
+            media_info = self._probe_media(job.input_path)
+            transcript = self.store.load_transcript(transcript_path)
+            silence_map = self.load_silence_map(job_id)
+            return self._render_and_review(
+                job,
+                job.input_path,
+                media_info,
+                transcript,
+                silence_map,
+                final_candidates,
+                selection_source,
+                on_progress,
+                on_log,
+            )
+        except Exception as exc:
+            self._fail_job(job_id, exc, on_log)
+            raise
+
+    def _fail_job(self, job_id: str, exc: Exception, on_log: LogCallback | None) -> None:
+        self.repo.update_status(job_id, JobStatus.FAILED, str(exc))
+        self.logger.exception("job.failed", job_id=job_id, error=str(exc))
+        self._emit_log(on_log, f"ジョブ失敗: {exc}")
 
+    def _render_and_review(
+        self,
+        job,
+        input_video: Path,
+        media_info,
+        transcript: Transcript,
+        silence_map: SilenceMap | None,
+        final_candidates,
+        selection_source: str,
+        on_progress: ProgressCallback | None,
+        on_log: LogCallback | None,
+    ) -> PipelineResult:
+        self._check_cancel(job.job_id, on_log)
+        self._update_status(
+            job.job_id,
+            JobStatus.RENDERING,
+            "レンダリング中（1本あたり 1-2分）",
+            0.64,
+            on_progress,
+            on_log,
+        )
+        rendered = self._render_with_progress(
+            input_video=input_video,
+            job_id=job.job_id,
+            candidates=final_candidates,
+            transcript=transcript,
+            on_progress=on_progress,
+            on_log=on_log,
+            silence_map=silence_map,
+        )
+        self.repo.save_rendered(job.job_id, rendered)
+        self._emit_log(on_log, "レンダリングを保存しました")
+
+        if self.validator is not None:
             self._check_cancel(job.job_id, on_log)
             self._update_status(
                 job.job_id,
-                JobStatus.RENDERING,
-                "レンダリング中（1本あたり 1-2分）",
-                0.64,
+                JobStatus.VALIDATING,
+                "出力ファイルを検証中",
+                0.96,
                 on_progress,
                 on_log,
             )
-            rendered = self._render_with_progress(
+            rendered = self._validate_rendered(
                 input_video=input_video,
                 job_id=job.job_id,
                 candidates=final_candidates,
+                rendered=rendered,
                 transcript=transcript,
+                expect_audio=media_info.audio_stream_count > 0,
                 on_progress=on_progress,
                 on_log=on_log,
+                silence_map=silence_map,
             )
-            self.repo.save_rendered(job.job_id, rendered)
-            self._emit_log(on_log, "レンダリングを保存しました")
 
-            self._check_cancel(job.job_id, on_log)
-            metadata = {
-                "job_id": job.job_id,
-                "input_video": str(input_video),
-                "media_info": {
-                    "duration_sec": media_info.duration_sec,
-                    "width": media_info.width,
-                    "height": media_info.height,
-                    "fps": media_info.fps,
-                },
-                "selection_source": selection_source,
-                "candidates": [
-                    {
-                        "clip_id": c.clip_id,
-                        "start_sec": c.start_sec,
-                        "end_sec": c.end_sec,
-                        "title": c.title,
-                        "hook": c.hook,
-                        "reason": c.reason,
-                        "score": c.score,
-                    }
-                    for c in final_candidates
-                ],
-                "rendered": [
-                    {
-                        "clip_id": r.clip_id,
-                        "video_path": str(r.video_path),
-                        "subtitle_path": str(r.subtitle_path) if r.subtitle_path else "",
-                    }
-                    for r in rendered
-                ],
-            }
-            self.store.write_json(self.store.metadata_path(job.job_id), metadata)
+        self._check_cancel(job.job_id, on_log)
+        metadata = {
+            "job_id": job.job_id,
+            "input_video": str(input_video),
+            "media_info": asdict(media_info),
+            "selection_source": selection_source,
+            "candidates": [
+                {
+                    "clip_id": c.clip_id,
+                    "start_sec": c.start_sec,
+                    "end_sec": c.end_sec,
+                    "title": c.title,
+                    "hook": c.hook,
+                    "reason": c.reason,
+                    "score": c.score,
+                }
+                for c in final_candidates
+            ],
+            "rendered": [
+                {
+                    "clip_id": r.clip_id,
+                    "video_path": str(r.video_path),
+                    "subtitle_path": str(r.subtitle_path) if r.subtitle_path else "",
+                    "preroll_sec": r.preroll_sec,
+                    "cache_hit": r.cache_hit,
+                    "output_duration_sec": r.expected_duration_sec,
+                    "speech_intervals": [list(pair) for pair in r.speech_intervals or []],
+                    "chapters": self._clip_chapters(r, transcript),
+                }
+                for r in rendered
+            ],
+        }
+        self.store.write_json(self.store.metadata_path(job.job_id), metadata)
+
+        self._update_status(
+            job.job_id,
+            JobStatus.REVIEW_PENDING,
+            "最終チェック待ち",
+            0.98,
+            on_progress,
+            on_log,
+        )
+        job = self.repo.get_job(job.job_id)
+        if on_progress:
+            on_progress("最終チェック待ち", 1.0)
+        self._emit_log(on_log, "最終チェック画面へ進んでください")
+
+        self.logger.info("job.review_pending", job_id=job.job_id, clips=len(rendered))
+        return PipelineResult(
+            job=job,
+            media_info=media_info,
+            transcript=transcript,
+            rendered_clips=rendered,
+            candidates=final_candidates,
+        )
 
-            self._update_status(
-                job.job_id,
-                JobStatus.REVIEW_PENDING,
-                "最終チェック待ち",
-                0.98,
-                on_progress,
-                on_log,
-            )
-            job = self.repo.get_job(job.job_id)
-            if on_progress:
-                on_progress("最終チェック待ち", 1.0)
-            self._emit_log(on_log, "最終チェック画面へ進んでください")
+    def _probe_media(self, input_video: Path):
+        if self.probe_cache is None:
+            return ffprobe_media(input_video)
+        return self.probe_cache.probe(input_video)
 
-            self.logger.info("job.review_pending", job_id=job.job_id, clips=len(rendered))
-            return PipelineResult(
-                job=job,
-                media_info=media_info,
-                transcript=transcript,
-                rendered_clips=rendered,
-                candidates=final_candidates,
-            )
-        except Exception as exc:
-            self.repo.update_status(job.job_id, JobStatus.FAILED, str(exc))
-            self.logger.exception("job.failed", job_id=job.job_id, error=str(exc))
-            self._emit_log(on_log, f"ジョブ失敗: {exc}")
-            raise
+    def _transcribe(
+        self,
+        audio_path: Path,
+        on_log: LogCallback | None = None,
+        audio_samples=None,
+        wav_writer=None,
+        silence_map: SilenceMap | None = None,
+        checkpoint: TranscriptCheckpoint | None = None,
+    ) -> Transcript:
+        def call(transcriber) -> Transcript:
+            extra = {}
+            if silence_map is not None and getattr(transcriber, "accepts_silences", False):
+                extra["silences"] = silence_map.intervals
+            if checkpoint is not None and getattr(transcriber, "streams_segments", False):
+                # Segments hit disk as they are decoded; a retry on the fallback starts over.
+                extra["on_segment"] = checkpoint.open().append
+            if audio_samples is not None and getattr(transcriber, "accepts_samples", False):
+                return transcriber.transcribe(
+                    audio_path,
+                    cancel_event=self._cancel_event,
+                    samples=audio_samples,
+                    **extra,
+                )
+            self._ensure_audio_file(audio_path, audio_samples, wav_writer)
+            try:
+                return transcriber.transcribe(audio_path, cancel_event=self._cancel_event, **extra)
+            except TypeError:
+                return transcriber.transcribe(audio_path)
+
+        cache_keys = self._transcript_cache_keys(audio_path, audio_samples)
+        for name, transcriber in (
+            ("mlx-whisper", self.primary_transcriber),
+            ("faster-whisper", self.fallback_transcriber),
+        ):
+            key = cache_keys.get(id(transcriber))
+            cached = self.transcript_cache.get(key) if key is not None else None
+            if cached is not None:
+                self.logger.info("transcribe.cache", hit=True, transcriber=name)
+                self._emit_log(on_log, f"文字起こしキャッシュ: ヒット ({name}) 再利用します")
+                return cached
+        if cache_keys:
+            self.logger.info("transcribe.cache", hit=False)
+            self._emit_log(on_log, "文字起こしキャッシュ: ミス")
+
+        def call_and_store(transcriber) -> Transcript:
+            transcript = call(transcriber)
+            key = cache_keys.get(id(transcriber))
+            if key is not None and transcript.segments:
+                self.transcript_cache.put(key, transcript)
+            return transcript
 
-    def _transcribe(self, audio_path: Path, on_log: LogCallback | None = None) -> Transcript:
         try:
             self._emit_log(on_log, "文字起こし: mlx-whisper を使用します")
-            try:
-                return self.primary_transcriber.transcribe(audio_path, cancel_event=self._cancel_event)
-            except TypeError:
-                return self.primary_transcriber.transcribe(audio_path)
+            return call_and_store(self.primary_transcriber)
         except Exception as primary_error:
             self.logger.warning("transcribe.primary_failed", error=str(primary_error))
             self._emit_log(on_log, f"mlx-whisper失敗。faster-whisperに切替: {primary_error}")
-            try:
-                return self.fallback_transcriber.transcribe(audio_path, cancel_event=self._cancel_event)
-            except TypeError:
-                return self.fallback_transcriber.transcribe(audio_path)
+            return call_and_store(self.fallback_transcriber)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+    def _transcript_cache_keys(self, audio_path: Path, audio_samples) -> dict[int, str]:
+        """Cache key per transcriber (by id), empty when caching is off or impossible."""
+        if self.transcript_cache is None:
+            return {}
+        try:
+            if audio_samples is not None:
+                digest = audio_content_hash(samples=audio_samples)
+            else:
+                digest = audio_content_hash(audio_path)
+        except Exception as exc:
+            self.logger.warning("transcribe.cache_hash_failed", error=str(exc))
+            return {}
+        keys: dict[int, str] = {}
+        for transcriber in (self.primary_transcriber, self.fallback_transcriber):
+            identity_of = getattr(transcriber, "cache_identity", None)
+            if callable(identity_of):
+                keys[id(transcriber)] = self.transcript_cache.key(digest, identity_of())
+        return keys
+
+    def _transcribed_fraction(self, checkpoint: TranscriptCheckpoint, duration_sec: float) -> float:
+        if duration_sec <= 0:
+            return 0.0
+        return checkpoint.transcribed_until / duration_sec
+
+    def load_silence_map(self, job_id: str) -> SilenceMap | None:
+        """The job's saved silence map, or None if compaction is off or its settings changed."""
+        if not self.settings.app.enable_silence_compaction:
+            return None
+        silence_map = self.store.load_silence_map(job_id)
+        if silence_map is None or not silence_map.matches(*self._silence_params()):
+            return None
+        return silence_map
+
+    def _silence_params(self) -> tuple[float, float]:
+        noise_db = float(self.settings.app.silence_detect_noise_db)
+        min_silence = max(0.05, float(self.settings.app.silence_detect_min_sec))
+        return noise_db, min_silence
+
+    def _build_silence_map(
+        self,
+        job_id: str,
+        audio_path: Path,
+        on_log: LogCallback | None = None,
+    ) -> SilenceMap | None:
+        if not self.settings.app.enable_silence_compaction:
+            return None
+        noise_db, min_silence = self._silence_params()
+        try:
+            intervals, duration = detect_silence(
+                audio_path, noise_db, min_silence, cancel_event=self._cancel_event
+            )
+        except Exception as exc:
+            if self._cancel_event.is_set():
+                raise
+            self.logger.warning("silence_map.failed", error=str(exc))
+            self._emit_log(on_log, f"無音解析に失敗。クリップ単位の検出に切替: {exc}")
+            return None
+        return self._save_silence_map(job_id, intervals, duration, on_log=on_log)
+
+    def _save_silence_map(
+        self,
+        job_id: str,
+        intervals: list[tuple[float, float]],
+        duration: float,
+        on_log: LogCallback | None = None,
+    ) -> SilenceMap:
+        noise_db, min_silence = self._silence_params()
+        silence_map = SilenceMap(
+            intervals=intervals,
+            noise_db=noise_db,
+            min_silence_sec=min_silence,
+            duration_sec=duration,
+        )
+        self.store.save_silence_map(job_id, silence_map)
+        self._emit_log(on_log, f"無音解析が完了しました（{len(silence_map.intervals)}区間）")
+        return silence_map
+
+    def _stream_audio(
+        self,
+        job_id: str,
+        input_video: Path,
+        audio_path: Path,
+        duration_hint_sec: float,
+        on_log: LogCallback | None = None,
+    ):
+        # silencedetect runs in the same ffmpeg process: the silence map costs no extra decode.
+        silence_filter = None
+        if self.settings.app.enable_silence_compaction:
+            noise_db, min_silence = self._silence_params()
+            silence_filter = f"silencedetect=noise={noise_db:.1f}dB:d={min_silence:.2f}"
+        samples, stderr = stream_audio_pcm(
+            input_video,
+            duration_hint_sec,
+            cancel_event=self._cancel_event,
+            audio_filter=silence_filter,
+        )
+        duration = len(samples) / 16000.0
+        self._emit_log(on_log, f"音声ストリーム取得が完了しました（{duration / 60:.1f}分）")
+        wav_writer = None
+        if self.settings.transcribe.persist_audio_wav:
+            wav_writer = write_wav_async(samples, audio_path)
+        silence_map = None
+        if silence_filter:
+            silence_map = self._save_silence_map(
+                job_id,
+                parse_silencedetect(stderr, duration),
+                duration,
+                on_log=on_log,
+            )
+        return samples, wav_writer, silence_map
+
+    def _ensure_audio_file(self, audio_path: Path, audio_samples, wav_writer) -> None:
+        if wav_writer is not None:
+            wav_writer.join()
+        if audio_samples is not None and not audio_path.exists():
+            write_wav(audio_samples, audio_path)
 
     def _select_candidates(self, transcript: Transcript, media_info, on_log: LogCallback | None = None):
         def primary_call():
@@ -277,6 +601,83 @@ class PipelineExecutor:
             )
             return fallback_candidates, "heuristic"
 
+    def _validate_rendered(
+        self,
+        input_video: Path,
+        job_id: str,
+        candidates,
+        rendered: list[RenderedClip],
+        transcript: Transcript,
+        expect_audio: bool,
+        on_progress: ProgressCallback | None,
+        on_log: LogCallback | None,
+        silence_map: SilenceMap | None = None,
+    ) -> list[RenderedClip]:
+        results = self.validator.validate(rendered, expect_audio=expect_audio)
+        failed = {r.clip_id: r for r in results if not r.ok}
+        if failed:
+            self._emit_log(on_log, f"検証NG {len(failed)}本 を再レンダリングします")
+            for clip in rendered:
+                if clip.clip_id in failed:
+                    self.logger.warning(
+                        "render.validation_failed",
+                        clip_id=clip.clip_id,
+                        errors=failed[clip.clip_id].errors,
+                    )
+            # Retries keep their original clip numbers, so each replacement is renamed over the
+            # failing file (and its subtitles) instead of taking another clip's name; a failed
+            # re-render leaves each clip pointing at a file that still exists.
+            retry = [(n, c) for n, c in enumerate(candidates, start=1) if c.clip_id in failed]
+            retry_candidates = [c for _, c in retry]
+            try:
+                rerendered = self._render_with_progress(
+                    input_video=input_video,
+                    job_id=job_id,
+                    candidates=retry_candidates,
+                    transcript=transcript,
+                    on_progress=on_progress,
+                    on_log=on_log,
+                    silence_map=silence_map,
+                    reuse=False,
+                    progress_span=(0.96, 0.98),
+                    clip_numbers=[n for n, _ in retry],
+                )
+            except Exception as exc:
+                self.logger.warning("render.revalidation_render_failed", error=str(exc))
+                rerendered = []
+            self.repo.save_rendered(job_id, rerendered)
+            by_id = {clip.clip_id: clip for clip in rerendered}
+            rendered = [by_id.get(clip.clip_id, clip) for clip in rendered]
+            retried = {
+                r.clip_id: r for r in self.validator.validate(rerendered, expect_audio=expect_audio)
+            }
+            results = [retried.get(r.clip_id, r) for r in results]
+
+        self.repo.save_validations(job_id, results)
+        bad = sum(1 for r in results if not r.ok)
+        if bad:
+            self._emit_log(on_log, f"検証NGのまま {bad}本 がレビューに残っています")
+        else:
+            self._emit_log(on_log, f"出力検証OK: {len(results)}本")
+        return rendered
+
+    def _clip_chapters(self, clip: RenderedClip, transcript: Transcript) -> list[dict]:
+        """Transcript segment starts as timestamps in the (compacted) rendered clip."""
+        timeline = CompactedTimeline.for_clip(clip.speech_intervals, clip.end_sec - clip.start_sec)
+        chapters: list[dict] = []
+        for seg in transcript.index.overlapping(clip.start_sec, clip.end_sec):
+            text = seg.text.strip()
+            if not text:
+                continue
+            chapters.append(
+                {
+                    "time_sec": round(timeline.map_time(max(0.0, seg.start - clip.start_sec)), 3),
+                    "source_sec": round(seg.start, 3),
+                    "text": text[:40],
+                }
+            )
+        return chapters
+
     def _render_with_progress(
         self,
         input_video: Path,
@@ -285,25 +686,50 @@ class PipelineExecutor:
         transcript: Transcript,
         on_progress: ProgressCallback | None,
         on_log: LogCallback | None,
+        silence_map: SilenceMap | None = None,
+        reuse: bool = True,
+        progress_span: tuple[float, float] = (0.64, 0.96),
+        clip_numbers: list[int] | None = None,
     ):
         total = len(candidates)
+        span_start, span_end = progress_span
         completed = 0
+        clip_fractions: dict[int, float] = {}
+        progress_lock = Lock()
 
         if on_progress:
-            on_progress(f"レンダリング中 0/{total}", 0.64)
-        self._emit_log(
-            on_log,
-            f"レンダリング開始: {total}本 / 並列 {self.settings.app.render_parallelism}",
-        )
-
-        def on_event(kind: str, idx: int, event_total: int, title: str) -> None:
+            on_progress(f"レンダリング中 0/{total}", span_start)
+        parallelism = self.settings.app.render_parallelism or "自動"
+        self._emit_log(on_log, f"レンダリング開始: {total}本 / 並列 {parallelism}")
+
+        def on_event(
+            kind: str,
+            idx: int,
+            event_total: int,
+            title: str,
+            fraction: float = 0.0,
+        ) -> None:
             nonlocal completed
             if kind == "started":
                 self._emit_log(on_log, f"レンダリング開始 {idx}/{event_total}: {title}")
                 return
+            if kind == "progress":
+                with progress_lock:
+                    clip_fractions[idx] = max(clip_fractions.get(idx, 0.0), fraction)
+                    done = sum(clip_fractions.values())
+                if on_progress:
+                    progress = span_start + (span_end - span_start) * (done / max(event_total, 1))
+                    on_progress(
+                        f"レンダリング中 {completed}/{event_total}（{idx}本目 {fraction:.0%}）",
+                        progress,
+                    )
+                return
             if kind == "completed":
-                completed += 1
-                progress = 0.64 + 0.32 * (completed / max(event_total, 1))
+                with progress_lock:
+                    completed += 1
+                    clip_fractions[idx] = 1.0
+                    done = sum(clip_fractions.values())
+                progress = span_start + (span_end - span_start) * (done / max(event_total, 1))
                 if on_progress:
                     on_progress(f"レンダリング中 {completed}/{event_total}", progress)
                 self._emit_log(on_log, f"レンダリング完了 {completed}/{event_total}: {title}")
@@ -311,6 +737,7 @@ class PipelineExecutor:
             if kind == "failed":
                 self._emit_log(on_log, f"レンダリング失敗 {idx}/{event_total}: {title}")
 
+        extra = {"clip_numbers": clip_numbers} if clip_numbers is not None else {}
         try:
             return self.renderer.render(
                 input_video=input_video,
@@ -319,6 +746,10 @@ class PipelineExecutor:
                 transcript=transcript,
                 on_event=on_event,
                 cancel_event=self._cancel_event,
+                silence_map=silence_map,
+                profile="preview" if self.settings.render.preview_enabled else "final",
+                reuse=reuse,
+                **extra,
             )
         except TypeError:
             # Backward-compatible path for renderers without progress callback support.
@@ -345,6 +776,8 @@ class PipelineExecutor:
         base_progress: float,
         on_progress: ProgressCallback | None,
         on_log: LogCallback | None,
+        progress_span: float = 0.0,
+        phase_fraction: Callable[[], float] | None = None,
     ):
         finished = Event()
         result_holder: dict[str, object] = {}
@@ -366,10 +799,17 @@ class PipelineExecutor:
             if self._cancel_event.is_set():
                 raise RuntimeError("ユーザー停止要求により処理を中断しました")
             elapsed = int(monotonic() - start)
+            elapsed_text = self._format_elapsed(elapsed)
+            label = f"{phase_label} 実行中（{elapsed_text}経過）"
+            progress = base_progress
+            fraction = min(1.0, max(0.0, phase_fraction())) if phase_fraction else 0.0
+            if fraction > 0:
+                label = f"{phase_label} 実行中（{fraction:.0%} / {elapsed_text}経過）"
+                progress = base_progress + progress_span * fraction
             if on_progress:
-                on_progress(f"{phase_label} 実行中（{self._format_elapsed(elapsed)}経過）", base_progress)
+                on_progress(label, progress)
             if elapsed - last_log_elapsed >= 15:
-                self._emit_log(on_log, f"{phase_label} 実行中（{self._format_elapsed(elapsed)}経過）")
+                self._emit_log(on_log, label)
                 last_log_elapsed = elapsed
 
         if self._cancel_event.is_set():
@@ -383,7 +823,7 @@ class PipelineExecutor:
         transcribe_min = max(2.0, duration_sec / 900.0)
         render_min = max(
             6.0,
-            (self.settings.app.target_clips * 1.5) / max(self.settings.app.render_parallelism, 1),
+            (self.settings.app.target_clips * 1.5) / (self.settings.app.render_parallelism or 3),
         )
         misc_min = 1.5
         return transcribe_min + render_min + misc_min
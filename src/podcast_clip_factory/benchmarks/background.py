@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import re
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from podcast_clip_factory.infrastructure.render.letterbox_layout import (
+    BACKGROUND_MODES,
+    build_background_chain,
+    build_base_filtergraph,
+)
+from podcast_clip_factory.utils.config import RenderConfig
+from podcast_clip_factory.utils.media import CommandError
+
+
+@dataclass(slots=True)
+class BackgroundBenchResult:
+    mode: str
+    frames: int
+    elapsed_sec: float
+    fps: float
+    ssim: float | None
+
+
+def _input_args(input_video: Path | None, duration_sec: float) -> list[str]:
+    if input_video is None:
+        return ["-f", "lavfi", "-i", f"testsrc2=size=1920x1080:rate=30:duration={duration_sec:.3f}"]
+    return ["-t", f"{duration_sec:.3f}", "-i", str(input_video)]
+
+
+def run_ffmpeg(cmd: list[str]) -> str:
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise CommandError(f"Command failed: {' '.join(cmd)}\n{proc.stderr[-4000:]}")
+    return proc.stderr or ""
+
+
+def parse_frame_count(stderr: str) -> int:
+    matches = re.findall(r"frame=\s*(\d+)", stderr)
+    return int(matches[-1]) if matches else 0
+
+
+def parse_ssim(stderr: str) -> float | None:
+    match = re.search(r"SSIM .*All:([0-9.]+)", stderr)
+    return float(match.group(1)) if match else None
+
+
+def run_background_benchmark(
+    config: RenderConfig,
+    input_video: Path | None = None,
+    duration_sec: float = 20.0,
+    modes: tuple[str, ...] = BACKGROUND_MODES,
+    ffmpeg_bin: str = "ffmpeg",
+) -> list[BackgroundBenchResult]:
+    """Time the letterbox base layer per background mode; SSIM is measured against "gblur".
+
+    SSIM compares the background layer alone (the only part that differs between modes),
+    so it is a lower bound for the fully composited frame.
+    """
+    results: list[BackgroundBenchResult] = []
+    inputs = _input_args(input_video, duration_sec)
+    for mode in modes:
+        graph = build_base_filtergraph(
+            video_width=config.video_width,
+            video_height=config.video_height,
+            center_width=config.center_width,
+            center_height=config.center_height,
+            blur_sigma=config.background_blur_sigma,
+            background_mode=mode,
+            background_downscale=config.background_downscale,
+        )
+        cmd = [
+            ffmpeg_bin,
+            "-hide_banner",
+            *inputs,
+            "-filter_complex",
+            graph,
+            "-map",
+            "[base]",
+            "-f",
+            "null",
+            "-",
+        ]
+        started = time.perf_counter()
+        stderr = run_ffmpeg(cmd)
+        elapsed = time.perf_counter() - started
+        frames = parse_frame_count(stderr)
+
+        ssim = None
+        if mode != "gblur":
+            reference = build_background_chain(
+                config.video_width, config.video_height, config.background_blur_sigma, "gblur"
+            )
+            candidate = build_background_chain(
+                config.video_width,
+                config.video_height,
+                config.background_blur_sigma,
+                mode,
+                config.background_downscale,
+            )
+            ssim_cmd = [
+                ffmpeg_bin,
+                "-hide_banner",
+                *inputs,
+                "-filter_complex",
+                f"[0:v]split=2[a][b];[a]{reference}[ref];[b]{candidate}[test];[test][ref]ssim",
+                "-f",
+                "null",
+                "-",
+            ]
+            ssim = parse_ssim(run_ffmpeg(ssim_cmd))
+
+        results.append(
+            BackgroundBenchResult(
+                mode=mode,
+                frames=frames,
+                elapsed_sec=round(elapsed, 3),
+                fps=round(frames / elapsed, 2) if elapsed > 0 else 0.0,
+                ssim=ssim,
+            )
+        )
+    return results
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from podcast_clip_factory.benchmarks.background import parse_frame_count, run_ffmpeg
+from podcast_clip_factory.infrastructure.render.ffmpeg_builder import FFmpegCommandBuilder
+from podcast_clip_factory.utils.config import RenderConfig
+
+COMPACTION_MODES = ("concat", "select")
+
+
+@dataclass(slots=True)
+class CompactionBenchResult:
+    mode: str
+    cuts: int
+    frames: int
+    elapsed_sec: float
+    fps: float
+
+
+def synthetic_intervals(
+    duration_sec: float, cuts: int, gap_sec: float = 0.3
+) -> list[tuple[float, float]]:
+    """Evenly spaced speech ranges leaving `cuts` silences of `gap_sec` inside the clip."""
+    segments = max(1, int(cuts) + 1)
+    step = duration_sec / segments
+    gap = min(gap_sec, step / 2)
+    return [
+        (i * step, (i + 1) * step - (gap if i < segments - 1 else 0.0)) for i in range(segments)
+    ]
+
+
+def legacy_concat_graph(speech_intervals: list[tuple[float, float]]) -> str:
+    """The previous trim/atrim-per-interval + concat compaction graph, kept for comparison."""
+    parts: list[str] = []
+    labels: list[str] = []
+    for idx, (start, end) in enumerate(speech_intervals):
+        parts.append(f"[0:v]trim=start={start:.3f}:end={end:.3f},setpts=PTS-STARTPTS[v{idx}]")
+        parts.append(f"[0:a]atrim=start={start:.3f}:end={end:.3f},asetpts=PTS-STARTPTS[a{idx}]")
+        labels.append(f"[v{idx}][a{idx}]")
+    parts.append(f"{''.join(labels)}concat=n={len(speech_intervals)}:v=1:a=1[srcv][srca]")
+    return ";".join(parts)
+
+
+def run_compaction_benchmark(
+    config: RenderConfig,
+    input_video: Path | None = None,
+    duration_sec: float = 60.0,
+    cuts: int = 55,
+    modes: tuple[str, ...] = COMPACTION_MODES,
+    ffmpeg_bin: str = "ffmpeg",
+) -> list[CompactionBenchResult]:
+    """Time compaction alone (decode + cut + re-timestamp, no encode) per graph style."""
+    intervals = synthetic_intervals(duration_sec, cuts)
+    if input_video is None:
+        inputs = [
+            "-f",
+            "lavfi",
+            "-i",
+            f"testsrc2=size=1920x1080:rate=30:duration={duration_sec:.3f}",
+            "-f",
+            "lavfi",
+            "-i",
+            f"sine=frequency=440:sample_rate=48000:duration={duration_sec:.3f}",
+        ]
+        audio_label = "1:a"
+    else:
+        inputs = ["-t", f"{duration_sec:.3f}", "-i", str(input_video)]
+        audio_label = "0:a"
+
+    builder = FFmpegCommandBuilder(config)
+    results: list[CompactionBenchResult] = []
+    for mode in modes:
+        if mode == "concat":
+            graph = legacy_concat_graph(intervals).replace("[0:a]", f"[{audio_label}]")
+        elif mode == "select":
+            graph = builder._compaction_graph(intervals, audio_input_label=audio_label)
+        else:
+            raise ValueError(f"unknown compaction mode: {mode}")
+        cmd = [
+            ffmpeg_bin,
+            "-hide_banner",
+            *inputs,
+            "-filter_complex",
+            graph,
+            "-map",
+            "[srcv]",
+            "-map",
+            "[srca]",
+            "-f",
+            "null",
+            "-",
+        ]
+        started = time.perf_counter()
+        stderr = run_ffmpeg(cmd)
+        elapsed = time.perf_counter() - started
+        frames = parse_frame_count(stderr)
+        results.append(
+            CompactionBenchResult(
+                mode=mode,
+                cuts=len(intervals) - 1,
+                frames=frames,
+                elapsed_sec=round(elapsed, 3),
+                fps=round(frames / elapsed, 2) if elapsed > 0 else 0.0,
+            )
+        )
+    return results
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from podcast_clip_factory.domain.models import Transcript, TranscriptSegment, WordToken
+from podcast_clip_factory.domain.transcript_index import TranscriptIndex
+
+
+@dataclass(slots=True)
+class TranscriptIndexBenchResult:
+    mode: str
+    segments: int
+    queries: int
+    elapsed_sec: float
+    per_query_us: float
+
+
+def synthetic_transcript(
+    duration_sec: float = 3 * 3600.0,
+    segment_sec: float = 4.0,
+    words_per_segment: int = 8,
+) -> Transcript:
+    """Evenly spaced segments with word tokens, roughly what whisper produces for talk audio."""
+    segments: list[TranscriptSegment] = []
+    count = int(duration_sec // segment_sec)
+    word_sec = segment_sec / max(1, words_per_segment)
+    for i in range(count):
+        start = i * segment_sec
+        words = [
+            WordToken(word=f"w{j}", start=start + j * word_sec, end=start + (j + 0.9) * word_sec)
+            for j in range(words_per_segment)
+        ]
+        segments.append(
+            TranscriptSegment(
+                start=start,
+                end=start + segment_sec * 0.95,
+                text=" ".join(word.word for word in words),
+                words=words,
+            )
+        )
+    return Transcript(segments=segments, duration_sec=duration_sec)
+
+
+def run_transcript_index_benchmark(
+    duration_sec: float = 3 * 3600.0,
+    window_sec: float = 60.0,
+    step_sec: float = 5.0,
+) -> list[TranscriptIndexBenchResult]:
+    """Time sliding-window overlap queries: linear segment scan vs `TranscriptIndex`."""
+    transcript = synthetic_transcript(duration_sec)
+    segments = transcript.segments
+    windows = []
+    cursor = 0.0
+    while cursor + window_sec <= duration_sec:
+        windows.append((cursor, cursor + window_sec))
+        cursor += step_sec
+
+    results: list[TranscriptIndexBenchResult] = []
+    started = time.perf_counter()
+    scanned = [
+        [seg for seg in segments if seg.start < end and seg.end > start] for start, end in windows
+    ]
+    results.append(_result("scan", len(segments), len(windows), time.perf_counter() - started))
+
+    started = time.perf_counter()
+    index = TranscriptIndex(segments)
+    indexed = [index.overlapping(start, end) for start, end in windows]
+    results.append(_result("index", len(segments), len(windows), time.perf_counter() - started))
+
+    if scanned != indexed:
+        raise AssertionError("TranscriptIndex returned different segments than a linear scan")
+
+    started = time.perf_counter()
+    for start, end in windows:
+        index.words_between(start, end)
+    results.append(_result("words", len(index.words), len(windows), time.perf_counter() - started))
+    return results
+
+
+def _result(mode: str, items: int, queries: int, elapsed: float) -> TranscriptIndexBenchResult:
+    return TranscriptIndexBenchResult(
+        mode=mode,
+        segments=items,
+        queries=queries,
+        elapsed_sec=round(elapsed, 4),
+        per_query_us=round(elapsed / max(1, queries) * 1e6, 2),
+    )
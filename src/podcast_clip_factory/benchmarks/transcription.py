@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import tempfile
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from podcast_clip_factory.benchmarks.background import run_ffmpeg
+from podcast_clip_factory.infrastructure.transcriber.faster_whisper import (
+    FasterWhisperOptions,
+    _audio_duration,
+    _load_model,
+    _transcribe_audio,
+)
+
+
+@dataclass(slots=True)
+class TranscriptionBenchResult:
+    mode: str
+    audio_sec: float
+    load_sec: float
+    elapsed_sec: float
+    rtf: float
+    segments: int
+
+
+def run_transcription_benchmark(
+    input_media: Path,
+    model: str = "small",
+    duration_sec: float = 120.0,
+    batch_sizes: tuple[int, ...] = (0, 8, 16),
+    base_options: FasterWhisperOptions | None = None,
+    word_timestamps: bool = True,
+    ffmpeg_bin: str = "ffmpeg",
+) -> list[TranscriptionBenchResult]:
+    """Real-time factor (decode seconds / audio seconds) of faster-whisper per batch size.
+
+    Batch size 0 is the sequential decoder the app uses by default. Model load time is
+    reported separately, since a warm process or resident worker does not pay it per job.
+    """
+    base_options = base_options or FasterWhisperOptions()
+    results: list[TranscriptionBenchResult] = []
+    with tempfile.TemporaryDirectory(prefix="pcf_bench_tr_") as tmp:
+        audio_path = Path(tmp) / "audio.wav"
+        run_ffmpeg(
+            [
+                ffmpeg_bin,
+                "-hide_banner",
+                "-y",
+                "-t",
+                f"{duration_sec:.3f}",
+                "-i",
+                str(input_media),
+                "-vn",
+                "-acodec",
+                "pcm_s16le",
+                "-ac",
+                "1",
+                "-ar",
+                "16000",
+                str(audio_path),
+            ]
+        )
+        audio_sec = _audio_duration(audio_path, None)
+        for batch_size in batch_sizes:
+            options = replace(base_options, batch_size=max(0, int(batch_size)))
+            started = time.perf_counter()
+            loaded = _load_model(model, options)
+            load_sec = time.perf_counter() - started
+
+            started = time.perf_counter()
+            segments, _ = _transcribe_audio(loaded, str(audio_path), word_timestamps, options)
+            elapsed = time.perf_counter() - started
+            results.append(
+                TranscriptionBenchResult(
+                    mode=f"batch={options.batch_size}" if options.batch_size else "sequential",
+                    audio_sec=round(audio_sec, 2),
+                    load_sec=round(load_sec, 2),
+                    elapsed_sec=round(elapsed, 2),
+                    rtf=round(elapsed / audio_sec, 4) if audio_sec > 0 else 0.0,
+                    segments=len(segments),
+                )
+            )
+    return results
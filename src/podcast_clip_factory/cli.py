@@ -60,6 +60,61 @@ def _build_parser() -> argparse.ArgumentParser:
     worker_cmd.add_argument("--max-items", type=int, default=10, help="処理する最大件数 (default: 10)")
     worker_cmd.add_argument("--dry-run", action="store_true", help="YouTubeへの書き込みを行わない")
 
+    bench_bg_cmd = sub.add_parser(
+        "bench-background",
+        help="レターボックス背景ぼかし方式の速度(fps)と画質(SSIM)を比較",
+    )
+    bench_bg_cmd.add_argument("--input", default="", help="入力動画（省略時は testsrc2 を使用）")
+    bench_bg_cmd.add_argument("--duration", type=float, default=20.0, help="計測秒数 (default: 20)")
+
+    bench_cmp_cmd = sub.add_parser(
+        "bench-compaction",
+        help="無音詰め(旧 trim+concat / select+aselect)の処理速度を比較",
+    )
+    bench_cmp_cmd.add_argument(
+        "--input", default="", help="入力動画（省略時は testsrc2 + sine を使用）"
+    )
+    bench_cmp_cmd.add_argument(
+        "--duration", type=float, default=60.0, help="計測秒数 (default: 60)"
+    )
+    bench_cmp_cmd.add_argument("--cuts", type=int, default=55, help="カット数 (default: 55)")
+
+    bench_idx_cmd = sub.add_parser(
+        "bench-transcript-index",
+        help="文字起こし区間検索(線形走査 / TranscriptIndex)の速度を比較",
+    )
+    bench_idx_cmd.add_argument(
+        "--hours", type=float, default=3.0, help="文字起こしの長さ (default: 3)"
+    )
+
+    bench_tr_cmd = sub.add_parser(
+        "bench-transcribe",
+        help="faster-whisper の逐次 / バッチ推論の実時間比(RTF)を計測",
+    )
+    bench_tr_cmd.add_argument("--input", required=True, help="入力音声または動画")
+    bench_tr_cmd.add_argument(
+        "--duration", type=float, default=120.0, help="計測秒数 (default: 120)"
+    )
+    bench_tr_cmd.add_argument("--model", default="", help="モデル名（省略時は設定値）")
+    bench_tr_cmd.add_argument(
+        "--batch-sizes",
+        default="0,8,16",
+        help="比較するバッチサイズ。0は逐次デコード (default: 0,8,16)",
+    )
+
+    resume_cmd = sub.add_parser(
+        "resume-job",
+        help="中断したジョブをレンダリングから再開（完了済みクリップは再利用）",
+    )
+    resume_cmd.add_argument("--job-id", required=True, help="対象ジョブID")
+
+    worker_tr_cmd = sub.add_parser(
+        "transcribe-worker",
+        help="文字起こしワーカー（モデル常駐）をフォアグラウンドで起動 / 状態確認 / 停止",
+    )
+    worker_tr_cmd.add_argument("--status", action="store_true", help="稼働状況を表示")
+    worker_tr_cmd.add_argument("--stop", action="store_true", help="稼働中のワーカーを停止")
+
     return parser
 
 
@@ -295,6 +350,136 @@ def _cmd_cloud_worker(args: argparse.Namespace) -> int:
     return 0 if fail_count == 0 else 1
 
 
+def _cmd_bench_background(args: argparse.Namespace) -> int:
+    from podcast_clip_factory.benchmarks.background import run_background_benchmark
+    from podcast_clip_factory.utils.config import load_settings
+
+    root_dir = Path(__file__).resolve().parents[2]
+    settings = load_settings(root_dir)
+    input_video = Path(args.input).expanduser() if str(args.input or "").strip() else None
+    results = run_background_benchmark(
+        settings.render,
+        input_video=input_video,
+        duration_sec=max(1.0, float(args.duration)),
+    )
+    for result in results:
+        ssim = f"{result.ssim:.4f}" if result.ssim is not None else "-"
+        print(
+            f"{result.mode:10s} frames={result.frames} elapsed={result.elapsed_sec:.2f}s "
+            f"fps={result.fps:.1f} ssim={ssim}"
+        )
+    return 0
+
+
+def _cmd_bench_compaction(args: argparse.Namespace) -> int:
+    from podcast_clip_factory.benchmarks.compaction import run_compaction_benchmark
+    from podcast_clip_factory.utils.config import load_settings
+
+    root_dir = Path(__file__).resolve().parents[2]
+    settings = load_settings(root_dir)
+    input_video = Path(args.input).expanduser() if str(args.input or "").strip() else None
+    results = run_compaction_benchmark(
+        settings.render,
+        input_video=input_video,
+        duration_sec=max(1.0, float(args.duration)),
+        cuts=max(1, int(args.cuts)),
+    )
+    for result in results:
+        print(
+            f"{result.mode:8s} cuts={result.cuts} frames={result.frames} "
+            f"elapsed={result.elapsed_sec:.2f}s fps={result.fps:.1f}"
+        )
+    return 0
+
+
+def _cmd_bench_transcript_index(args: argparse.Namespace) -> int:
+    from podcast_clip_factory.benchmarks.transcript_index import run_transcript_index_benchmark
+
+    results = run_transcript_index_benchmark(duration_sec=max(0.1, float(args.hours)) * 3600.0)
+    for result in results:
+        print(
+            f"{result.mode:6s} items={result.segments} queries={result.queries} "
+            f"elapsed={result.elapsed_sec:.4f}s per_query={result.per_query_us:.1f}us"
+        )
+    return 0
+
+
+def _cmd_bench_transcribe(args: argparse.Namespace) -> int:
+    from podcast_clip_factory.benchmarks.transcription import run_transcription_benchmark
+    from podcast_clip_factory.infrastructure.transcriber.faster_whisper import FasterWhisperOptions
+    from podcast_clip_factory.utils.config import load_settings
+
+    root_dir = Path(__file__).resolve().parents[2]
+    settings = load_settings(root_dir)
+    trans = settings.transcribe
+    batch_sizes = tuple(int(part) for part in str(args.batch_sizes).split(",") if part.strip())
+    results = run_transcription_benchmark(
+        Path(args.input).expanduser(),
+        model=str(args.model or "").strip() or trans.faster_model,
+        duration_sec=max(1.0, float(args.duration)),
+        batch_sizes=batch_sizes or (0,),
+        base_options=FasterWhisperOptions(
+            compute_type=trans.faster_compute_type,
+            cpu_threads=trans.faster_cpu_threads,
+            num_workers=trans.faster_num_workers,
+            beam_size=trans.faster_beam_size,
+        ),
+        word_timestamps=trans.word_timestamps,
+    )
+    for result in results:
+        print(
+            f"{result.mode:10s} audio={result.audio_sec:.1f}s load={result.load_sec:.2f}s "
+            f"elapsed={result.elapsed_sec:.2f}s rtf={result.rtf:.3f} segments={result.segments}"
+        )
+    return 0
+
+
+def _cmd_transcribe_worker(args: argparse.Namespace) -> int:
+    from podcast_clip_factory.infrastructure.transcriber.worker import (
+        TranscriptionWorkerClient,
+        TranscriptionWorkerServer,
+    )
+    from podcast_clip_factory.utils.config import load_settings
+
+    root_dir = Path(__file__).resolve().parents[2]
+    settings = load_settings(root_dir)
+    worker_socket = settings.transcribe.worker_socket
+    socket_path = Path(worker_socket).expanduser() if worker_socket else None
+    idle_sec = settings.transcribe.worker_idle_minutes * 60.0
+    client = TranscriptionWorkerClient(socket_path, idle_timeout_sec=idle_sec, autostart=False)
+    status = client.ping()
+    if args.status:
+        if status is None:
+            print(f"文字起こしワーカー: 停止中 ({client.socket_path})")
+            return 1
+        print(f"文字起こしワーカー: 稼働中 pid={status.get('pid')} ({client.socket_path})")
+        return 0
+    if args.stop:
+        if status is None or not client.shutdown():
+            print("文字起こしワーカーは起動していません。")
+            return 1
+        print("文字起こしワーカーを停止しました。")
+        return 0
+    if status is not None:
+        print(f"文字起こしワーカーは既に稼働中です pid={status.get('pid')}")
+        return 0
+    print(f"文字起こしワーカー起動: {client.socket_path}")
+    TranscriptionWorkerServer(client.socket_path, idle_timeout_sec=idle_sec).serve()
+    return 0
+
+
+def _cmd_resume_job(args: argparse.Namespace) -> int:
+    root_dir = Path(__file__).resolve().parents[2]
+    orch = build_orchestrator(root_dir)
+    result = orch.resume_pipeline(
+        str(args.job_id).strip(),
+        on_progress=lambda message, value: print(f"[{value:.0%}] {message}"),
+        on_log=lambda line: print(line),
+    )
+    print(f"再開完了: {len(result.rendered_clips)}本 (job={result.job.job_id})")
+    return 0
+
+
 def main() -> None:
     from dotenv import load_dotenv
     load_dotenv()
@@ -306,6 +491,18 @@ def main() -> None:
         raise SystemExit(_cmd_cloud_deploy(args))
     elif args.command == "cloud-worker":
         raise SystemExit(_cmd_cloud_worker(args))
+    elif args.command == "bench-background":
+        raise SystemExit(_cmd_bench_background(args))
+    elif args.command == "bench-compaction":
+        raise SystemExit(_cmd_bench_compaction(args))
+    elif args.command == "bench-transcript-index":
+        raise SystemExit(_cmd_bench_transcript_index(args))
+    elif args.command == "bench-transcribe":
+        raise SystemExit(_cmd_bench_transcribe(args))
+    elif args.command == "transcribe-worker":
+        raise SystemExit(_cmd_transcribe_worker(args))
+    elif args.command == "resume-job":
+        raise SystemExit(_cmd_resume_job(args))
     raise SystemExit("unsupported command")
 
 
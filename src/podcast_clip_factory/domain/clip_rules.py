@@ -3,7 +3,8 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 
-from .models import ClipCandidate, Transcript, TranscriptSegment
+from .models import ClipCandidate, Transcript
+from .transcript_index import TranscriptIndex
 
 
 @dataclass(slots=True)
@@ -101,8 +102,8 @@ class ClipRuleEngine:
         if not transcript.segments:
             return []
 
-        segs = transcript.segments
-        total = transcript.duration_sec or segs[-1].end
+        index = transcript.index
+        total = transcript.duration_sec or transcript.segments[-1].end
         step = max(self.config.min_sec, math.floor(self.config.max_sec * 0.8))
         candidates: list[ClipCandidate] = []
         cursor = 0.0
@@ -112,7 +113,7 @@ class ClipRuleEngine:
             end = min(total, start + self.config.max_sec)
             if end - start < self.config.min_sec:
                 break
-            text = self._collect_text(segs, start, end)
+            text = self._collect_text(index, start, end)
             title_seed = text[: self.config.title_max_chars] or f"切り抜き {idx}"
             candidates.append(
                 ClipCandidate(
@@ -129,5 +130,5 @@ class ClipRuleEngine:
             idx += 1
         return candidates
 
-    def _collect_text(self, segments: list[TranscriptSegment], start: float, end: float) -> str:
-        return " ".join(s.text.strip() for s in segments if s.start < end and s.end > start).strip()
+    def _collect_text(self, index: TranscriptIndex, start: float, end: float) -> str:
+        return index.text_between(start, end)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class CompactedTimeline:
+    """Maps clip-relative source times onto the silence-compacted output timeline.
+
+    `intervals` are the kept (speech) ranges in clip-relative seconds. Cumulative output
+    offsets are computed once, so each lookup is a bisect instead of a walk over all ranges.
+    """
+
+    intervals: list[tuple[float, float]]
+    _starts: list[float] = field(init=False, repr=False, default_factory=list)
+    _ends: list[float] = field(init=False, repr=False, default_factory=list)
+    _offsets: list[float] = field(init=False, repr=False, default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.intervals = sorted((float(s), float(e)) for s, e in self.intervals if e > s)
+        self._starts = [start for start, _ in self.intervals]
+        self._ends = [end for _, end in self.intervals]
+        cursor = 0.0
+        self._offsets = []
+        for start, end in self.intervals:
+            self._offsets.append(cursor)
+            cursor += end - start
+
+    @classmethod
+    def for_clip(
+        cls, speech_intervals: list[tuple[float, float]] | None, duration_sec: float
+    ) -> CompactedTimeline:
+        """Timeline of a rendered clip; without compaction it is the identity over the clip."""
+        return cls(list(speech_intervals) if speech_intervals else [(0.0, duration_sec)])
+
+    @property
+    def duration(self) -> float:
+        if not self.intervals:
+            return 0.0
+        return self._offsets[-1] + self._ends[-1] - self._starts[-1]
+
+    def contains(self, sec: float) -> bool:
+        idx = bisect_right(self._starts, sec) - 1
+        return idx >= 0 and sec < self._ends[idx]
+
+    def map_time(self, sec: float) -> float:
+        """Output time of `sec`; a time inside a cut maps to where playback resumes."""
+        idx = bisect_right(self._starts, sec) - 1
+        if idx < 0:
+            return 0.0
+        return self._offsets[idx] + min(sec, self._ends[idx]) - self._starts[idx]
+
+    def map_range(self, start: float, end: float) -> list[tuple[float, float]]:
+        """Output ranges of the kept parts of [start, end) (one per kept interval it touches)."""
+        lo = bisect_right(self._ends, start)
+        hi = bisect_left(self._starts, end)
+        mapped: list[tuple[float, float]] = []
+        for idx in range(lo, hi):
+            keep_start = self._starts[idx]
+            overlap_start = max(start, keep_start)
+            overlap_end = min(end, self._ends[idx])
+            if overlap_end > overlap_start:
+                shift = self._offsets[idx] - keep_start
+                mapped.append((overlap_start + shift, overlap_end + shift))
+        return mapped
+
+
+def align_to_frames(
+    intervals: list[tuple[float, float]], frame_rate: float, origin_sec: float = 0.0
+) -> list[tuple[float, float]]:
+    """Move each bound to the nearest midpoint between two source frames.
+
+    Source frames sit at k / frame_rate; `origin_sec` is the source time of 0 in `intervals`.
+    A bound halfway between frames never ties with a frame timestamp, so every kept range
+    holds exactly (end - start) * frame_rate frames and its audio can be cut to that length.
+    """
+    if frame_rate <= 0:
+        return list(intervals)
+    aligned: list[tuple[float, float]] = []
+    for start, end in sorted(intervals):
+        start, end = (
+            (math.floor((sec + origin_sec) * frame_rate) + 0.5) / frame_rate - origin_sec
+            for sec in (start, end)
+        )
+        if end - start < 0.5 / frame_rate:
+            continue
+        if aligned and start <= aligned[-1][1] + 1e-9:
+            aligned[-1] = (aligned[-1][0], max(aligned[-1][1], end))
+        else:
+            aligned.append((start, end))
+    return aligned
+
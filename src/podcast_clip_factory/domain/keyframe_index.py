@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class KeyframeIndex:
+    """Sorted video keyframe times (seconds, relative to the container start time)."""
+
+    times: list[float]
+
+    def __post_init__(self) -> None:
+        self.times = sorted({round(float(t), 6) for t in self.times if t >= 0})
+
+    def at_or_before(self, sec: float) -> float | None:
+        idx = bisect_right(self.times, sec + 1e-6)
+        if idx == 0:
+            return None
+        return self.times[idx - 1]
+
+    def preroll(self, sec: float) -> float:
+        """Seconds that must be decoded and discarded to start exactly at `sec`."""
+        keyframe = self.at_or_before(sec)
+        if keyframe is None:
+            return max(0.0, sec)
+        return max(0.0, sec - keyframe)
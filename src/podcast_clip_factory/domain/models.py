@@ -4,6 +4,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import StrEnum
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from podcast_clip_factory.domain.transcript_index import TranscriptIndex
 
 
 class JobStatus(StrEnum):
@@ -13,6 +17,7 @@ class JobStatus(StrEnum):
     SELECTING = "selecting"
     PREPARING = "preparing"
     RENDERING = "rendering"
+    VALIDATING = "validating"
     REVIEW_PENDING = "review_pending"
     COMPLETED = "completed"
     FAILED = "failed"
@@ -38,11 +43,21 @@ class Transcript:
     segments: list[TranscriptSegment]
     language: str = "ja"
     duration_sec: float = 0.0
+    _index: TranscriptIndex | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def full_text(self) -> str:
         return "\n".join(s.text.strip() for s in self.segments if s.text.strip())
 
+    @property
+    def index(self) -> TranscriptIndex:
+        """Time-range index over the segments, rebuilt if `segments` was replaced or resized."""
+        from podcast_clip_factory.domain.transcript_index import TranscriptIndex
+
+        if self._index is None or not self._index.is_current(self.segments):
+            self._index = TranscriptIndex(self.segments)
+        return self._index
+
 
 @dataclass(slots=True)
 class ClipCandidate:
@@ -68,6 +83,24 @@ class RenderedClip:
     end_sec: float
     video_path: Path
     subtitle_path: Path | None = None
+    preroll_sec: float = 0.0
+    cache_hit: bool = False
+    overlay_signature: str = ""
+    expected_duration_sec: float = 0.0
+    # Kept ranges (clip-relative seconds) when silence compaction was applied.
+    speech_intervals: list[tuple[float, float]] | None = None
+
+
+@dataclass(slots=True)
+class ClipValidation:
+    clip_id: str
+    ok: bool
+    duration_sec: float = 0.0
+    expected_duration_sec: float = 0.0
+    has_video: bool = False
+    has_audio: bool = False
+    faststart: bool = False
+    errors: list[str] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -103,6 +136,15 @@ class MediaInfo:
     width: int
     height: int
     fps: float
+    video_codec: str = ""
+    audio_codec: str = ""
+    audio_stream_count: int = 0
+    audio_channels: int = 0
+    audio_channel_layout: str = ""
+    audio_sample_rate: int = 0
+    bit_rate: int = 0
+    keyframe_interval_sec: float = 0.0
+    rotation: int = 0
 
 
 @dataclass(slots=True)
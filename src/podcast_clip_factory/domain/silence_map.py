@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class SilenceMap:
+    """Episode-wide silence intervals (absolute seconds), sorted and non-overlapping."""
+
+    intervals: list[tuple[float, float]]
+    noise_db: float
+    min_silence_sec: float
+    duration_sec: float = 0.0
+    _ends: list[float] = field(init=False, repr=False, default_factory=list)
+
+    def __post_init__(self) -> None:
+        merged: list[tuple[float, float]] = []
+        for start, end in sorted((float(s), float(e)) for s, e in self.intervals):
+            if end <= start:
+                continue
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        self.intervals = merged
+        self._ends = [end for _, end in merged]
+
+    def matches(self, noise_db: float, min_silence_sec: float) -> bool:
+        return (
+            abs(self.noise_db - float(noise_db)) < 1e-6
+            and abs(self.min_silence_sec - float(min_silence_sec)) < 1e-6
+        )
+
+    def slice(self, start_sec: float, end_sec: float) -> list[tuple[float, float]]:
+        """Return silences inside [start_sec, end_sec) relative to start_sec."""
+        duration = end_sec - start_sec
+        if duration <= 0:
+            return []
+        result: list[tuple[float, float]] = []
+        idx = bisect_right(self._ends, start_sec)
+        while idx < len(self.intervals):
+            sil_start, sil_end = self.intervals[idx]
+            if sil_start >= end_sec:
+                break
+            rel_start = max(0.0, sil_start - start_sec)
+            rel_end = min(duration, sil_end - start_sec)
+            if rel_end > rel_start:
+                result.append((rel_start, rel_end))
+            idx += 1
+        return result
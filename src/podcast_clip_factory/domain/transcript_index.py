@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from podcast_clip_factory.domain.models import TranscriptSegment, WordToken
+
+
+class TranscriptIndex:
+    """Time-range queries over transcript segments and words in O(log n + hits).
+
+    Items are ordered by start time. Whisper segments can overlap slightly, so a running
+    maximum of end times (monotonic, hence bisectable) bounds where overlaps can begin.
+    """
+
+    def __init__(self, segments: list[TranscriptSegment]) -> None:
+        self.source = segments
+        self.segment_count = len(segments)
+        self.segments = sorted(segments, key=lambda seg: seg.start)
+        self._seg_starts = [seg.start for seg in self.segments]
+        self._seg_max_ends = list(accumulate((seg.end for seg in self.segments), max))
+        self.words: list[WordToken] = sorted(
+            (word for seg in self.segments for word in seg.words), key=lambda word: word.start
+        )
+        self._word_starts = [word.start for word in self.words]
+        self._word_max_ends = list(accumulate((word.end for word in self.words), max))
+
+    def is_current(self, segments: list[TranscriptSegment]) -> bool:
+        return segments is self.source and len(segments) == self.segment_count
+
+    def overlapping(self, start: float, end: float) -> list[TranscriptSegment]:
+        """Segments with `seg.start < end and seg.end > start`, in start order."""
+        lo = bisect_right(self._seg_max_ends, start)
+        hi = bisect_left(self._seg_starts, end)
+        return [seg for seg in self.segments[lo:hi] if seg.end > start]
+
+    def words_between(self, start: float, end: float) -> list[WordToken]:
+        """Words with `word.start < end and word.end > start`, in start order."""
+        lo = bisect_right(self._word_max_ends, start)
+        hi = bisect_left(self._word_starts, end)
+        return [word for word in self.words[lo:hi] if word.end > start]
+
+    def text_between(self, start: float, end: float) -> str:
+        return " ".join(seg.text.strip() for seg in self.overlapping(start, end)).strip()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from podcast_clip_factory.domain.models import ClipCandidate, MediaInfo, Transcript
+from podcast_clip_factory.domain.transcript_index import TranscriptIndex
 
 
 class HeuristicClipAnalyzer:
@@ -32,7 +33,7 @@ class HeuristicClipAnalyzer:
         while len(candidates) < target_count and cursor + min_sec <= total:
             start = cursor
             end = min(total, start + window)
-            text = self._collect_text(segments, start, end)
+            text = self._collect_text(transcript.index, start, end)
             if not text:
                 cursor += step
                 continue
@@ -88,5 +89,5 @@ class HeuristicClipAnalyzer:
 
         return candidates
 
-    def _collect_text(self, segments, start: float, end: float) -> str:
-        return " ".join(seg.text for seg in segments if seg.start < end and seg.end > start).strip()
+    def _collect_text(self, index: TranscriptIndex, start: float, end: float) -> str:
+        return " ".join(seg.text for seg in index.overlapping(start, end)).strip()
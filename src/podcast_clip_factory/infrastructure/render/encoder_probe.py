@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import platform
+import subprocess
+import time
+from pathlib import Path
+from threading import Lock
+
+
+class EncoderProbe:
+    """Detects which video encoders actually work on this host.
+
+    Results are cached per (host, ffmpeg version) so the 1-frame test encodes run once.
+    Failures expire after `negative_ttl_sec`: a busy GPU or a driver installed later should
+    not pin the host to software encoding forever.
+    """
+
+    def __init__(
+        self, cache_path: Path, ffmpeg_bin: str = "ffmpeg", negative_ttl_sec: float = 86400.0
+    ) -> None:
+        self.cache_path = cache_path
+        self.ffmpeg_bin = ffmpeg_bin
+        self.negative_ttl_sec = negative_ttl_sec
+        self._lock = Lock()
+        self._listed: set[str] | None = None
+        self._cache_key: str | None = None
+
+    def select(self, priority: list[str]) -> str | None:
+        """Return the first encoder in `priority` that passes a test encode."""
+        with self._lock:
+            cache = self._load_cache()
+            key = self._host_key()
+            results: dict[str, dict] = cache.setdefault(key, {})
+            selected: str | None = None
+            for encoder in priority:
+                if not self._is_fresh(results.get(encoder)):
+                    results[encoder] = {"ok": self._probe(encoder), "checked_at": time.time()}
+                    self._save_cache(cache)
+                if results[encoder]["ok"]:
+                    selected = encoder
+                    break
+            return selected
+
+    def _is_fresh(self, entry) -> bool:
+        if not isinstance(entry, dict):
+            return False
+        if entry.get("ok"):
+            return True
+        return time.time() - float(entry.get("checked_at", 0.0)) < self.negative_ttl_sec
+
+    def _probe(self, encoder: str) -> bool:
+        if encoder not in self._list_encoders():
+            return False
+        cmd = [
+            self.ffmpeg_bin,
+            "-hide_banner",
+            "-v",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            "color=c=black:s=256x256:r=30:d=0.1",
+            "-frames:v",
+            "1",
+            "-c:v",
+            encoder,
+            "-pix_fmt",
+            "yuv420p",
+            "-f",
+            "null",
+            "-",
+        ]
+        try:
+            proc = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return proc.returncode == 0
+
+    def _list_encoders(self) -> set[str]:
+        if self._listed is not None:
+            return self._listed
+        try:
+            proc = subprocess.run(
+                [self.ffmpeg_bin, "-hide_banner", "-encoders"],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            self._listed = set()
+            return self._listed
+        names: set[str] = set()
+        for line in proc.stdout.splitlines():
+            parts = line.split()
+            # Encoder rows look like " V....D libx264   libx264 H.264 ..."
+            if len(parts) >= 2 and len(parts[0]) == 6 and parts[0][0] in "VAS":
+                names.add(parts[1])
+        self._listed = names
+        return names
+
+    def _host_key(self) -> str:
+        if self._cache_key is not None:
+            return self._cache_key
+        version = "unknown"
+        try:
+            proc = subprocess.run(
+                [self.ffmpeg_bin, "-hide_banner", "-version"],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+            first_line = (proc.stdout or "").splitlines()[:1]
+            if first_line:
+                version = first_line[0].strip()
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        self._cache_key = f"{platform.node()}|{platform.machine()}|{version}"
+        return self._cache_key
+
+    def _load_cache(self) -> dict:
+        if not self.cache_path.exists():
+            return {}
+        try:
+            return json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, cache: dict) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(cache, ensure_ascii=False, indent=2)
+        self.cache_path.write_text(payload, encoding="utf-8")
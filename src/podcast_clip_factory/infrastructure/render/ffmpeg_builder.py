@@ -1,15 +1,40 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 from podcast_clip_factory.domain.models import ClipCandidate, ImpactOverlayStyle, TitleOverlayStyle
-from podcast_clip_factory.infrastructure.render.letterbox_layout import build_filtergraph
+from podcast_clip_factory.infrastructure.render.letterbox_layout import (
+    build_base_filtergraph,
+    build_image_overlay_filtergraph,
+    build_overlay_filtergraph,
+)
+from podcast_clip_factory.infrastructure.render.overlay_image_cache import OverlayImageCache
 from podcast_clip_factory.utils.config import RenderConfig
 
 
+@dataclass(slots=True)
+class BatchClip:
+    output_video: Path
+    subtitle_path: Path | None
+    candidate: ClipCandidate
+    speech_intervals: list[tuple[float, float]] | None = None
+
+
 class FFmpegCommandBuilder:
-    def __init__(self, config: RenderConfig) -> None:
+    # Intermediate base layers are re-encoded once more by the overlay pass, so they are
+    # written near-lossless and fast (intra-heavy x264 + PCM audio in Matroska).
+    BASE_LAYER_SUFFIX = ".mkv"
+    BASE_LAYER_VIDEO_ARGS = ["-c:v", "libx264", "-preset", "ultrafast", "-crf", "12"]
+    BASE_LAYER_AUDIO_ARGS = ["-c:a", "pcm_s16le"]
+
+    def __init__(
+        self, config: RenderConfig, overlay_images: OverlayImageCache | None = None
+    ) -> None:
         self.config = config
+        # When set, title/impact text is composited from cached PNG strips instead of being
+        # drawn per frame; `overlay_images.materialize(cmd)` must run before the command.
+        self.overlay_images = overlay_images
 
     def build(
         self,
@@ -21,39 +46,45 @@ class FFmpegCommandBuilder:
         impact_style: ImpactOverlayStyle | None = None,
         speech_intervals: list[tuple[float, float]] | None = None,
         fallback_software_codec: bool = False,
+        seek_keyframe_sec: float | None = None,
+        video_codec: str | None = None,
+        threads: int | None = None,
+        frame_rate: float | None = None,
     ) -> list[str]:
-        codec = "libx264" if fallback_software_codec else self.config.video_codec
+        codec = "libx264" if fallback_software_codec else (video_codec or self.config.video_codec)
+        input_args, source_trim, speech_intervals = self._input_args(
+            input_video, candidate, speech_intervals, seek_keyframe_sec
+        )
         style = title_style or TitleOverlayStyle()
         lower_style = impact_style or ImpactOverlayStyle()
-        use_compaction = bool(speech_intervals)
-        filter_graph = self._build_filter_graph(
+        source_graph = self._source_graph(speech_intervals, source_trim, frame_rate)
+        filter_graph, image_inputs = self._build_filter_graph(
             subtitle_path=subtitle_path,
             title_text=candidate.title,
-            impact_text=self._wrap_text(candidate.punchline or "", max_chars=14),
+            impact_text=self.wrap_text(candidate.punchline or "", max_chars=14),
             title_style=style,
             impact_style=lower_style,
-            speech_intervals=speech_intervals or [],
+            source_graph=source_graph,
         )
 
-        audio_map = "[srca]" if use_compaction else "0:a:0?"
+        audio_map = "[srca]" if source_graph else "0:a:0?"
 
         return [
             "ffmpeg",
             "-y",
-            "-ss",
-            f"{candidate.start_sec:.3f}",
-            "-to",
-            f"{candidate.end_sec:.3f}",
-            "-i",
-            str(input_video),
+            *self._filter_thread_args(threads),
+            *input_args,
+            *image_inputs,
             "-filter_complex",
             filter_graph,
             "-map",
             "[v]",
             "-map",
             audio_map,
+            *self._encoder_thread_args(threads),
             "-c:v",
             codec,
+            *self._preset_args(codec),
             "-c:a",
             self.config.audio_codec,
             "-b:a",
@@ -65,42 +96,359 @@ class FFmpegCommandBuilder:
             str(output_video),
         ]
 
-    def _build_filter_graph(
+    def build_base(
+        self,
+        input_video: Path,
+        output_base: Path,
+        candidate: ClipCandidate,
+        speech_intervals: list[tuple[float, float]] | None = None,
+        seek_keyframe_sec: float | None = None,
+        threads: int | None = None,
+        frame_rate: float | None = None,
+    ) -> list[str]:
+        """Decode, compact, blur and letterbox once into a reusable intermediate (no text)."""
+        input_args, source_trim, speech_intervals = self._input_args(
+            input_video, candidate, speech_intervals, seek_keyframe_sec
+        )
+        source_graph = self._source_graph(speech_intervals, source_trim, frame_rate)
+        base_graph = build_base_filtergraph(
+            video_width=self.config.video_width,
+            video_height=self.config.video_height,
+            center_width=self.config.center_width,
+            center_height=self.config.center_height,
+            blur_sigma=self.config.background_blur_sigma,
+            background_mode=self.config.background_mode,
+            background_downscale=self.config.background_downscale,
+            video_input_label="srcv" if source_graph else "0:v",
+            output_label="v",
+        )
+        if source_graph:
+            base_graph = f"{source_graph};{base_graph}"
+
+        return [
+            "ffmpeg",
+            "-y",
+            *self._filter_thread_args(threads),
+            *input_args,
+            "-filter_complex",
+            base_graph,
+            "-map",
+            "[v]",
+            "-map",
+            "[srca]" if source_graph else "0:a:0?",
+            *self._encoder_thread_args(threads),
+            *self.BASE_LAYER_VIDEO_ARGS,
+            *self.BASE_LAYER_AUDIO_ARGS,
+            "-pix_fmt",
+            "yuv420p",
+            str(output_base),
+        ]
+
+    def build_overlay(
+        self,
+        base_video: Path,
+        output_video: Path,
+        subtitle_path: Path | None,
+        candidate: ClipCandidate,
+        title_style: TitleOverlayStyle | None = None,
+        impact_style: ImpactOverlayStyle | None = None,
+        fallback_software_codec: bool = False,
+        video_codec: str | None = None,
+        threads: int | None = None,
+    ) -> list[str]:
+        """Composite title, impact text and subtitles over a base layer from `build_base`."""
+        codec = "libx264" if fallback_software_codec else (video_codec or self.config.video_codec)
+        style = title_style or TitleOverlayStyle()
+        lower_style = impact_style or ImpactOverlayStyle()
+        overlay_graph, image_inputs = self._text_overlay_graph(
+            subtitle_path=subtitle_path,
+            title_text=candidate.title,
+            impact_text=self.wrap_text(candidate.punchline or "", max_chars=14),
+            title_style=style,
+            impact_style=lower_style,
+            input_label="0:v",
+        )
+        return [
+            "ffmpeg",
+            "-y",
+            *self._filter_thread_args(threads),
+            "-i",
+            str(base_video),
+            *image_inputs,
+            "-filter_complex",
+            overlay_graph,
+            "-map",
+            "[v]",
+            "-map",
+            "0:a:0?",
+            *self._encoder_thread_args(threads),
+            "-c:v",
+            codec,
+            *self._preset_args(codec),
+            "-c:a",
+            self.config.audio_codec,
+            "-b:a",
+            self.config.audio_bitrate,
+            "-pix_fmt",
+            "yuv420p",
+            "-movflags",
+            "+faststart",
+            str(output_video),
+        ]
+
+    def build_batch(
+        self,
+        input_video: Path,
+        clips: list[BatchClip],
+        seek_sec: float,
+        title_style: TitleOverlayStyle | None = None,
+        impact_style: ImpactOverlayStyle | None = None,
+        fallback_software_codec: bool = False,
+        video_codec: str | None = None,
+        threads: int | None = None,
+        frame_rate: float | None = None,
+        has_audio: bool = True,
+    ) -> list[str]:
+        """Decode [seek_sec, last clip end] once and emit every clip from one ffmpeg process.
+
+        The source is split once per clip; each clip selects its kept ranges and gets its own
+        namespaced letterbox + overlay chain and output file. `has_audio=False` (a source
+        without audio) leaves the audio branches out, since `[0:a]` would not exist.
+        """
+        codec = "libx264" if fallback_software_codec else (video_codec or self.config.video_codec)
+        style = title_style or TitleOverlayStyle()
+        lower_style = impact_style or ImpactOverlayStyle()
+        span_end = max(clip.candidate.end_sec for clip in clips)
+
+        count = len(clips)
+        graph_parts = [f"[0:v]split={count}" + "".join(f"[bv{i}]" for i in range(count))]
+        if has_audio:
+            graph_parts.append(f"[0:a]asplit={count}" + "".join(f"[ba{i}]" for i in range(count)))
+        image_inputs: list[str] = []
+        output_args: list[str] = []
+        for i, clip in enumerate(clips):
+            offset = clip.candidate.start_sec - seek_sec
+            intervals = clip.speech_intervals or [(0.0, clip.candidate.duration)]
+            graph_parts.append(
+                self._compaction_graph(
+                    [(start + offset, end + offset) for start, end in intervals],
+                    video_input_label=f"bv{i}",
+                    audio_input_label=f"ba{i}" if has_audio else None,
+                    label_prefix=f"c{i}",
+                    frame_rate=frame_rate,
+                )
+            )
+            graph_parts.append(
+                build_base_filtergraph(
+                    **self._layout_kwargs(),
+                    video_input_label=f"c{i}srcv",
+                    output_label=f"c{i}base",
+                    label_prefix=f"c{i}",
+                )
+            )
+            overlay_graph, clip_inputs = self._text_overlay_graph(
+                subtitle_path=clip.subtitle_path,
+                title_text=clip.candidate.title,
+                impact_text=self.wrap_text(clip.candidate.punchline or "", max_chars=14),
+                title_style=style,
+                impact_style=lower_style,
+                input_label=f"c{i}base",
+                output_label=f"c{i}v",
+                label_prefix=f"c{i}",
+                first_input=1 + len(image_inputs) // 2,
+            )
+            graph_parts.append(overlay_graph)
+            image_inputs.extend(clip_inputs)
+            audio_args = (
+                [
+                    "-map",
+                    f"[c{i}srca]",
+                    "-c:a",
+                    self.config.audio_codec,
+                    "-b:a",
+                    self.config.audio_bitrate,
+                ]
+                if has_audio
+                else []
+            )
+            output_args.extend(
+                [
+                    "-map",
+                    f"[c{i}v]",
+                    *audio_args,
+                    *self._encoder_thread_args(threads),
+                    "-c:v",
+                    codec,
+                    *self._preset_args(codec),
+                    "-pix_fmt",
+                    "yuv420p",
+                    "-movflags",
+                    "+faststart",
+                    str(clip.output_video),
+                ]
+            )
+
+        return [
+            "ffmpeg",
+            "-y",
+            *self._filter_thread_args(threads),
+            "-ss",
+            f"{seek_sec:.6f}",
+            "-t",
+            f"{span_end - seek_sec:.3f}",
+            "-i",
+            str(input_video),
+            *image_inputs,
+            "-filter_complex",
+            ";".join(graph_parts),
+            *output_args,
+        ]
+
+    def _input_args(
+        self,
+        input_video: Path,
+        candidate: ClipCandidate,
+        speech_intervals: list[tuple[float, float]] | None,
+        seek_keyframe_sec: float | None,
+    ) -> tuple[list[str], tuple[float, float] | None, list[tuple[float, float]] | None]:
+        # With a known keyframe at or before the clip start, seek the input to that keyframe
+        # (no discarded pre-roll in the demuxer) and trim the remainder precisely after decode.
+        # The trim happens at the head of the filter graph, so the letterbox/subtitle chain
+        # only sees clip frames and its timestamps start at the clip start.
+        preroll = 0.0
+        if seek_keyframe_sec is not None and 0.0 <= seek_keyframe_sec <= candidate.start_sec:
+            preroll = candidate.start_sec - seek_keyframe_sec
+        else:
+            seek_keyframe_sec = None
+        if speech_intervals and preroll > 0:
+            speech_intervals = [(start + preroll, end + preroll) for start, end in speech_intervals]
+
+        if seek_keyframe_sec is None:
+            input_args = [
+                "-ss",
+                f"{candidate.start_sec:.3f}",
+                "-to",
+                f"{candidate.end_sec:.3f}",
+                "-i",
+                str(input_video),
+            ]
+        else:
+            input_args = [
+                "-ss",
+                f"{seek_keyframe_sec:.6f}",
+                "-t",
+                f"{candidate.end_sec - seek_keyframe_sec:.3f}",
+                "-i",
+                str(input_video),
+            ]
+        source_trim = None
+        if seek_keyframe_sec is not None and preroll > 0 and not speech_intervals:
+            source_trim = (preroll, candidate.duration)
+        return input_args, source_trim, speech_intervals
+
+    def _source_graph(
+        self,
+        speech_intervals: list[tuple[float, float]] | None,
+        source_trim: tuple[float, float] | None,
+        frame_rate: float | None = None,
+    ) -> str:
+        """Graph producing `[srcv]`/`[srca]` from input 0, or "" to use the streams directly."""
+        if speech_intervals:
+            return self._compaction_graph(speech_intervals, frame_rate=frame_rate)
+        if source_trim is None:
+            return ""
+        start, duration = source_trim
+        return (
+            f"[0:v]trim=start={start:.6f}:duration={duration:.6f},setpts=PTS-STARTPTS[srcv];"
+            f"[0:a]atrim=start={start:.6f}:duration={duration:.6f},asetpts=PTS-STARTPTS[srca]"
+        )
+
+    def _compaction_graph(
+        self,
+        speech_intervals: list[tuple[float, float]],
+        video_input_label: str = "0:v",
+        audio_input_label: str | None = "0:a",
+        label_prefix: str = "",
+        frame_rate: float | None = None,
+    ) -> str:
+        # Video: one select keeps the speech ranges in a single chain regardless of the cut
+        # count (trim+concat needed a branch per segment, each buffering decoded frames).
+        # Audio: select would keep whole audio frames (~21 ms) and drift against the video
+        # over many cuts, so each range is cut sample-accurately with atrim and concatenated;
+        # buffered audio is cheap. With `frame_rate`, bounds are expected on frame midpoints
+        # (see `align_to_frames`): a range then keeps (end - start) * frame_rate frames shown
+        # over [start + half a frame, end + half a frame), which is the audio that is kept.
+        p = label_prefix
+        video = (
+            f"[{video_input_label}]select='{self._select_expr(speech_intervals)}',"
+            f"setpts=N/FRAME_RATE/TB[{p}srcv]"
+        )
+        if audio_input_label is None:
+            return video
+        shift = 0.5 / frame_rate if frame_rate else 0.0
+        cuts = [
+            f"atrim=start={max(0.0, start + shift):.6f}:end={end + shift:.6f},"
+            "asetpts=PTS-STARTPTS"
+            for start, end in speech_intervals
+        ]
+        if len(cuts) == 1:
+            return f"{video};[{audio_input_label}]{cuts[0]}[{p}srca]"
+        count = len(cuts)
+        parts = [
+            f"[{audio_input_label}]asplit={count}" + "".join(f"[{p}aseg{i}]" for i in range(count))
+        ]
+        parts.extend(f"[{p}aseg{i}]{cut}[{p}akeep{i}]" for i, cut in enumerate(cuts))
+        parts.append(
+            "".join(f"[{p}akeep{i}]" for i in range(count)) + f"concat=n={count}:v=0:a=1[{p}srca]"
+        )
+        return ";".join([video, *parts])
+
+    def _select_expr(self, speech_intervals: list[tuple[float, float]]) -> str:
+        # Half-open ranges: a frame exactly on a shared bound is kept once, not twice.
+        return "+".join(
+            f"gte(t,{start:.6f})*lt(t,{end:.6f})" for start, end in speech_intervals
+        )
+
+    def _scaled_styles(
+        self, title_style: TitleOverlayStyle, impact_style: ImpactOverlayStyle
+    ) -> tuple[TitleOverlayStyle, ImpactOverlayStyle]:
+        scale = self.config.overlay_scale
+        if scale == 1.0:
+            return title_style, impact_style
+        return (
+            replace(
+                title_style,
+                font_size=max(1, round(title_style.font_size * scale)),
+                y=round(title_style.y * scale),
+                background_padding=round(title_style.background_padding * scale),
+            ),
+            replace(
+                impact_style,
+                font_size=max(1, round(impact_style.font_size * scale)),
+                y=round(impact_style.y * scale),
+                background_padding=round(impact_style.background_padding * scale),
+            ),
+        )
+
+    def _text_overlay_graph(
         self,
         subtitle_path: Path | None,
         title_text: str,
         impact_text: str,
         title_style: TitleOverlayStyle,
         impact_style: ImpactOverlayStyle,
-        speech_intervals: list[tuple[float, float]],
-    ) -> str:
-        if speech_intervals:
-            trim_parts: list[str] = []
-            concat_inputs: list[str] = []
-            for i, (start, end) in enumerate(speech_intervals):
-                trim_parts.append(
-                    f"[0:v]trim=start={start:.3f}:end={end:.3f},setpts=PTS-STARTPTS[sv{i}]"
-                )
-                trim_parts.append(
-                    f"[0:a]atrim=start={start:.3f}:end={end:.3f},asetpts=PTS-STARTPTS[sa{i}]"
-                )
-                concat_inputs.append(f"[sv{i}][sa{i}]")
-
-            concat_graph = (
-                ";".join(trim_parts)
-                + ";"
-                + "".join(concat_inputs)
-                + f"concat=n={len(speech_intervals)}:v=1:a=1[srcv][srca]"
-            )
-            layout_graph = build_filtergraph(
+        input_label: str = "base",
+        output_label: str = "v",
+        label_prefix: str = "",
+        first_input: int = 1,
+    ) -> tuple[str, list[str]]:
+        """Text + subtitle graph over `input_label`, plus the extra `-i` args it reads."""
+        title_style, impact_style = self._scaled_styles(title_style, impact_style)
+        if self.overlay_images is None:
+            graph = build_overlay_filtergraph(
                 subtitle_path=str(subtitle_path) if subtitle_path else None,
                 title_text=title_text,
                 impact_text=impact_text,
-                video_width=self.config.video_width,
-                video_height=self.config.video_height,
-                center_width=self.config.center_width,
-                center_height=self.config.center_height,
-                blur_sigma=self.config.background_blur_sigma,
                 font_name=title_style.font_name,
                 font_size=title_style.font_size,
                 title_y=title_style.y,
@@ -113,34 +461,94 @@ class FFmpegCommandBuilder:
                 impact_background=impact_style.background,
                 impact_background_opacity=impact_style.background_opacity,
                 impact_background_padding=impact_style.background_padding,
-                video_input_label="srcv",
+                input_label=input_label,
+                output_label=output_label,
+                label_prefix=label_prefix,
             )
-            return f"{concat_graph};{layout_graph}"
+            return graph, []
 
-        return build_filtergraph(
+        image_inputs: list[str] = []
+        labels: list[str | None] = []
+        for text, style in ((title_text, title_style), (impact_text, impact_style)):
+            if not text.strip():
+                labels.append(None)
+                continue
+            path = self.overlay_images.path_for(text, style, self.config.video_width)
+            labels.append(f"{first_input + len(image_inputs) // 2}:v")
+            image_inputs.extend(["-i", str(path)])
+        graph = build_image_overlay_filtergraph(
             subtitle_path=str(subtitle_path) if subtitle_path else None,
+            title_input=labels[0],
+            title_y=self.overlay_images.offset(title_style),
+            impact_input=labels[1],
+            impact_y=self.overlay_images.offset(impact_style),
+            input_label=input_label,
+            output_label=output_label,
+            label_prefix=label_prefix,
+        )
+        return graph, image_inputs
+
+    def overlay_image(
+        self,
+        text: str,
+        style: TitleOverlayStyle | ImpactOverlayStyle,
+    ) -> Path | None:
+        """Rasterized strip for one overlay as this profile would composite it (for previews)."""
+        if self.overlay_images is None or not text.strip():
+            return None
+        if isinstance(style, TitleOverlayStyle):
+            scaled, _ = self._scaled_styles(style, ImpactOverlayStyle())
+        else:
+            _, scaled = self._scaled_styles(TitleOverlayStyle(), style)
+        return self.overlay_images.image(text, scaled, self.config.video_width)
+
+    def _preset_args(self, codec: str) -> list[str]:
+        return ["-preset", self.config.preset] if self.config.preset and codec == "libx264" else []
+
+    def _filter_thread_args(self, threads: int | None) -> list[str]:
+        return ["-filter_complex_threads", str(threads)] if threads else []
+
+    def _encoder_thread_args(self, threads: int | None) -> list[str]:
+        return ["-threads", str(threads)] if threads else []
+
+    def _layout_kwargs(self) -> dict:
+        return {
+            "video_width": self.config.video_width,
+            "video_height": self.config.video_height,
+            "center_width": self.config.center_width,
+            "center_height": self.config.center_height,
+            "blur_sigma": self.config.background_blur_sigma,
+            "background_mode": self.config.background_mode,
+            "background_downscale": self.config.background_downscale,
+        }
+
+    def _build_filter_graph(
+        self,
+        subtitle_path: Path | None,
+        title_text: str,
+        impact_text: str,
+        title_style: TitleOverlayStyle,
+        impact_style: ImpactOverlayStyle,
+        source_graph: str = "",
+    ) -> tuple[str, list[str]]:
+        base_graph = build_base_filtergraph(
+            **self._layout_kwargs(),
+            video_input_label="srcv" if source_graph else "0:v",
+        )
+        overlay_graph, image_inputs = self._text_overlay_graph(
+            subtitle_path=subtitle_path,
             title_text=title_text,
             impact_text=impact_text,
-            video_width=self.config.video_width,
-            video_height=self.config.video_height,
-            center_width=self.config.center_width,
-            center_height=self.config.center_height,
-            blur_sigma=self.config.background_blur_sigma,
-            font_name=title_style.font_name,
-            font_size=title_style.font_size,
-            title_y=title_style.y,
-            text_background=title_style.background,
-            text_background_opacity=title_style.background_opacity,
-            text_background_padding=title_style.background_padding,
-            impact_font_name=impact_style.font_name,
-            impact_font_size=impact_style.font_size,
-            impact_y=impact_style.y,
-            impact_background=impact_style.background,
-            impact_background_opacity=impact_style.background_opacity,
-            impact_background_padding=impact_style.background_padding,
+            title_style=title_style,
+            impact_style=impact_style,
         )
+        graph = f"{base_graph};{overlay_graph}"
+        if source_graph:
+            graph = f"{source_graph};{graph}"
+        return graph, image_inputs
 
-    def _wrap_text(self, text: str, max_chars: int) -> str:
+    def wrap_text(self, text: str, max_chars: int) -> str:
+        """Hard-wrap `text` every `max_chars` characters, at most three lines."""
         raw = (text or "").strip()
         if not raw:
             return ""
@@ -1,15 +1,71 @@
 from __future__ import annotations
 
+BACKGROUND_MODES = ("gblur", "downscale")
 
-def build_filtergraph(
-    subtitle_path: str | None,
-    title_text: str,
-    impact_text: str,
+
+def build_base_filtergraph(
     video_width: int,
     video_height: int,
     center_width: int,
     center_height: int,
     blur_sigma: int,
+    video_input_label: str = "0:v",
+    output_label: str = "base",
+    background_mode: str = "gblur",
+    background_downscale: int = 8,
+    label_prefix: str = "",
+) -> str:
+    """Blurred full-frame background with the letterboxed source centred on top.
+
+    `label_prefix` namespaces the intermediate pads so several layouts can share one graph.
+    """
+    p = label_prefix
+    background = build_background_chain(
+        video_width, video_height, blur_sigma, background_mode, background_downscale
+    )
+    return (
+        f"[{video_input_label}]split=2[{p}bgsrc][{p}fgsrc];"
+        f"[{p}bgsrc]{background}[{p}bg];"
+        f"[{p}fgsrc]scale={center_width}:{center_height}:force_original_aspect_ratio=decrease[{p}fg];"
+        f"[{p}bg][{p}fg]overlay=(W-w)/2:(H-h)/2[{output_label}]"
+    )
+
+
+def build_background_chain(
+    video_width: int,
+    video_height: int,
+    blur_sigma: int,
+    background_mode: str = "gblur",
+    background_downscale: int = 8,
+) -> str:
+    """Filter chain (no labels) turning a source frame into the blurred fill background.
+
+    "gblur" blurs the full output-size frame. "downscale" shrinks first, blurs with a sigma
+    scaled by the same factor and upscales back, which looks almost identical for a heavy
+    background blur at a fraction of the per-pixel cost.
+    """
+    if background_mode not in BACKGROUND_MODES:
+        raise ValueError(f"unknown background_mode: {background_mode}")
+    factor = max(1, int(background_downscale))
+    if background_mode == "gblur" or factor == 1:
+        return (
+            f"scale={video_width}:{video_height}:force_original_aspect_ratio=increase,"
+            f"crop={video_width}:{video_height},gblur=sigma={blur_sigma}"
+        )
+    small_w = max(2, video_width // factor // 2 * 2)
+    small_h = max(2, video_height // factor // 2 * 2)
+    small_sigma = max(0.5, blur_sigma / factor)
+    return (
+        f"scale={small_w}:{small_h}:force_original_aspect_ratio=increase,"
+        f"crop={small_w}:{small_h},gblur=sigma={small_sigma:g},"
+        f"scale={video_width}:{video_height}:flags=bilinear"
+    )
+
+
+def build_overlay_filtergraph(
+    subtitle_path: str | None,
+    title_text: str,
+    impact_text: str,
     font_name: str,
     font_size: int,
     title_y: int,
@@ -22,66 +78,100 @@ def build_filtergraph(
     impact_background: bool,
     impact_background_opacity: float,
     impact_background_padding: int,
-    video_input_label: str = "0:v",
+    input_label: str = "base",
+    output_label: str = "v",
+    label_prefix: str = "",
 ) -> str:
-    safe_title = (
-        title_text.replace("\\", r"\\")
-        .replace("\n", r"\n")
-        .replace(":", r"\\:")
-        .replace(",", r"\,")
-        .replace("'", r"\\'")
-        .replace("%", r"\\%")
+    """Title, impact text and optional ASS subtitles composited over the base layer -> [v]."""
+    p = label_prefix
+    title_filter = build_drawtext_filter(
+        title_text,
+        font_name,
+        font_size,
+        title_y,
+        text_background,
+        text_background_opacity,
+        text_background_padding,
     )
-    safe_impact = (
-        impact_text.replace("\\", r"\\")
+    impact_filter = build_drawtext_filter(
+        impact_text,
+        impact_font_name,
+        impact_font_size,
+        impact_y,
+        impact_background,
+        impact_background_opacity,
+        impact_background_padding,
+    )
+    return (
+        f"[{input_label}]{title_filter}[{p}with_title];"
+        f"[{p}with_title]{impact_filter}[{p}base_with_text];"
+        f"[{p}base_with_text]{_subtitle_filter(subtitle_path, output_label)}"
+    )
+
+
+def build_image_overlay_filtergraph(
+    subtitle_path: str | None,
+    title_input: str | None,
+    title_y: int,
+    impact_input: str | None,
+    impact_y: int,
+    input_label: str = "base",
+    output_label: str = "v",
+    label_prefix: str = "",
+) -> str:
+    """Like `build_overlay_filtergraph`, but composites pre-rasterized full-width text strips.
+
+    `title_input` / `impact_input` are input pad labels (e.g. "1:v") of transparent PNGs, or
+    None when there is no text to draw.
+    """
+    p = label_prefix
+    title = f"[{title_input}]overlay=0:{int(title_y)}" if title_input else "null"
+    impact = f"[{impact_input}]overlay=0:{int(impact_y)}" if impact_input else "null"
+    return (
+        f"[{input_label}]{title}[{p}with_title];"
+        f"[{p}with_title]{impact}[{p}base_with_text];"
+        f"[{p}base_with_text]{_subtitle_filter(subtitle_path, output_label)}"
+    )
+
+
+def build_drawtext_filter(
+    text: str,
+    font_name: str,
+    font_size: int,
+    y: int,
+    background: bool,
+    background_opacity: float,
+    background_padding: int,
+) -> str:
+    """A horizontally centred `drawtext` (no pad labels)."""
+    safe_text = (
+        text.replace("\\", r"\\")
         .replace("\n", r"\n")
         .replace(":", r"\\:")
         .replace(",", r"\,")
         .replace("'", r"\\'")
         .replace("%", r"\\%")
     )
-    subtitle_filter = "[base_with_text]"
-    if subtitle_path:
-        safe_sub_path = subtitle_path.replace("\\", r"\\").replace(":", r"\\:")
-        subtitle_filter = f"ass='{safe_sub_path}'[v]"
-    else:
-        subtitle_filter = "null[v]"
-
     safe_font_name = (
         font_name.replace("\\", r"\\")
         .replace(":", r"\\:")
         .replace(",", r"\,")
         .replace("'", r"\\'")
     )
-    safe_impact_font_name = (
-        impact_font_name.replace("\\", r"\\")
-        .replace(":", r"\\:")
-        .replace(",", r"\,")
-        .replace("'", r"\\'")
-    )
-    text_bg_opts = ""
-    if text_background:
-        text_bg_opts = (
-            f":box=1:boxcolor=black@{text_background_opacity:.2f}"
-            f":boxborderw={max(0, int(text_background_padding))}"
-        )
-    impact_bg_opts = ""
-    if impact_background:
-        impact_bg_opts = (
-            f":box=1:boxcolor=black@{impact_background_opacity:.2f}"
-            f":boxborderw={max(0, int(impact_background_padding))}"
+    bg_opts = ""
+    if background:
+        bg_opts = (
+            f":box=1:boxcolor=black@{background_opacity:.2f}"
+            f":boxborderw={max(0, int(background_padding))}"
         )
-
     return (
-        f"[{video_input_label}]scale={video_width}:{video_height}:force_original_aspect_ratio=increase,"
-        f"crop={video_width}:{video_height},gblur=sigma={blur_sigma}[bg];"
-        f"[{video_input_label}]scale={center_width}:{center_height}:force_original_aspect_ratio=decrease[fg];"
-        f"[bg][fg]overlay=(W-w)/2:(H-h)/2[base];"
-        f"[base]drawtext=font='{safe_font_name}':text='{safe_title}':"
-        f"x=(w-text_w)/2:y={int(title_y)}:fontsize={int(font_size)}:fontcolor=white{text_bg_opts}"
-        f"[with_title];"
-        f"[with_title]drawtext=font='{safe_impact_font_name}':text='{safe_impact}':"
-        f"x=(w-text_w)/2:y={int(impact_y)}:fontsize={int(impact_font_size)}:fontcolor=white{impact_bg_opts}"
-        f"[base_with_text];"
-        f"[base_with_text]{subtitle_filter}"
+        f"drawtext=font='{safe_font_name}':text='{safe_text}':"
+        f"x=(w-text_w)/2:y={int(y)}:fontsize={int(font_size)}:fontcolor=white{bg_opts}"
     )
+
+
+def _subtitle_filter(subtitle_path: str | None, output_label: str) -> str:
+    if subtitle_path:
+        safe_sub_path = subtitle_path.replace("\\", r"\\").replace(":", r"\\:")
+        return f"ass='{safe_sub_path}'[{output_label}]"
+    return f"null[{output_label}]"
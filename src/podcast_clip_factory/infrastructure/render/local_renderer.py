@@ -2,36 +2,103 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import copy
+from dataclasses import asdict, dataclass
 from pathlib import Path
-import re
+from threading import Lock
+import hashlib
+import json
+import os
 import subprocess
+import time
 
+from podcast_clip_factory.domain.compacted_timeline import align_to_frames
+from podcast_clip_factory.domain.keyframe_index import KeyframeIndex
 from podcast_clip_factory.domain.models import (
     ClipCandidate,
     ImpactOverlayStyle,
+    MediaInfo,
     RenderedClip,
     TitleOverlayStyle,
     Transcript,
 )
-from podcast_clip_factory.infrastructure.render.ffmpeg_builder import FFmpegCommandBuilder
+from podcast_clip_factory.domain.silence_map import SilenceMap
+from podcast_clip_factory.infrastructure.render.encoder_probe import EncoderProbe
+from podcast_clip_factory.infrastructure.render.ffmpeg_builder import (
+    BatchClip,
+    FFmpegCommandBuilder,
+)
+from podcast_clip_factory.infrastructure.render.render_cache import RenderCache
+from podcast_clip_factory.infrastructure.render.render_failures import (
+    RenderAttempt,
+    classify_render_failure,
+)
+from podcast_clip_factory.infrastructure.render.render_manifest import (
+    RenderManifest,
+    command_digest,
+    partial_path,
+)
+from podcast_clip_factory.infrastructure.render.render_scheduler import RenderScheduler
 from podcast_clip_factory.infrastructure.render.subtitle_generator import SubtitleGenerator
+from podcast_clip_factory.infrastructure.storage.media_probe_cache import MediaProbeCache
 from podcast_clip_factory.utils.config import AppConfig
-from podcast_clip_factory.utils.media import run_command
+from podcast_clip_factory.utils.media import (
+    ffprobe_media,
+    parse_silencedetect,
+    probe_keyframes,
+    run_command,
+    verify_rendered_output,
+    with_progress,
+)
 from podcast_clip_factory.utils.paths import sanitize_filename
 
+# on_event(kind, idx, total, title[, fraction]); kind is "started", "progress", "completed"
+# or "failed". Only "progress" events carry the fractional clip progress (0.0-1.0).
+RenderEventCallback = Callable[..., None]
+
+
+@dataclass(slots=True)
+class _PendingBatchClip:
+    idx: int
+    clip: BatchClip
+    output_path: Path
+    digest: str
+    cache_key: str | None
+    duration_sec: float
+
 
 class LocalFFmpegRenderer:
+    RETRY_DELAY_SEC = 1.0
+
     def __init__(
         self,
         app_config: AppConfig,
         command_builder: FFmpegCommandBuilder,
         subtitle_generator: SubtitleGenerator,
         enable_subtitles: bool = True,
+        probe_cache: MediaProbeCache | None = None,
+        logger=None,
+        encoder_probe: EncoderProbe | None = None,
+        render_cache: RenderCache | None = None,
+        base_layer_cache: RenderCache | None = None,
+        scheduler: RenderScheduler | None = None,
     ) -> None:
         self.app_config = app_config
         self.command_builder = command_builder
         self.subtitle_generator = subtitle_generator
         self.enable_subtitles = enable_subtitles
+        self.probe_cache = probe_cache
+        self.logger = logger
+        self.encoder_probe = encoder_probe
+        self.render_cache = render_cache
+        self.base_layer_cache = base_layer_cache
+        self.scheduler = scheduler or RenderScheduler(
+            max_parallelism=app_config.render_parallelism,
+            memory_per_job_mb=app_config.render_memory_per_job_mb,
+        )
+        self.profile = "final"
+        self._manifest_lock = Lock()
+        self._video_codec: str | None = None
 
     def render(
         self,
@@ -41,9 +108,33 @@ class LocalFFmpegRenderer:
         transcript: Transcript,
         title_style: TitleOverlayStyle | None = None,
         impact_style: ImpactOverlayStyle | None = None,
-        on_event: Callable[[str, int, int, str], None] | None = None,
+        on_event: RenderEventCallback | None = None,
         cancel_event=None,
+        silence_map: SilenceMap | None = None,
+        profile: str = "final",
+        reuse: bool = True,
+        clip_numbers: list[int] | None = None,
     ) -> list[RenderedClip]:
+        """Render `candidates`; clip N is written as `clip_NN_<title>.mp4` / `clip_NN.ass`.
+
+        `clip_numbers` overrides N per candidate (default: 1-based position), so re-rendering
+        a subset of a job lands on the same files as the original clips.
+        """
+        if profile != self.profile:
+            return self.for_profile(profile).render(
+                input_video=input_video,
+                output_dir=output_dir,
+                candidates=candidates,
+                transcript=transcript,
+                title_style=title_style,
+                impact_style=impact_style,
+                on_event=on_event,
+                cancel_event=cancel_event,
+                silence_map=silence_map,
+                profile=profile,
+                reuse=reuse,
+                clip_numbers=clip_numbers,
+            )
         clips_dir = output_dir / "clips"
         clips_dir.mkdir(parents=True, exist_ok=True)
         subtitle_dir: Path | None = None
@@ -51,34 +142,138 @@ class LocalFFmpegRenderer:
             subtitle_dir = output_dir / "subtitles"
             subtitle_dir.mkdir(parents=True, exist_ok=True)
         total = len(candidates)
+        numbers = list(clip_numbers) if clip_numbers is not None else list(range(1, total + 1))
+        if len(numbers) != total:
+            raise ValueError("clip_numbers must have one entry per candidate")
+        keyframe_index = self._load_keyframe_index(input_video)
+        source_info = self._probe_source(input_video)
+        frame_rate = source_info.fps if source_info is not None and source_info.fps > 0 else None
+        # Resumed outputs must carry audio whenever the source has it.
+        expect_audio = source_info is not None and source_info.audio_stream_count > 0
+        # Unprobeable sources keep the old assumption that an audio stream exists.
+        has_audio = source_info is None or source_info.audio_stream_count > 0
+        video_codec = self._resolve_video_codec()
+
+        groups = self._plan_batches(candidates)
+        costs = [
+            sum(
+                self.scheduler.clip_cost(
+                    self._estimate_output_duration(candidates[idx - 1], silence_map),
+                    video_codec or self.command_builder.config.video_codec,
+                    self.enable_subtitles,
+                )
+                for idx in group
+            )
+            for group in groups
+        ]
+        schedule = self.scheduler.plan(costs, memory_weights=[len(group) for group in groups])
+        threads = schedule.threads_per_job
+        if self.logger is not None:
+            self.logger.info(
+                "render.schedule",
+                jobs=len(groups),
+                workers=schedule.workers,
+                threads_per_job=threads,
+            )
 
-        with ThreadPoolExecutor(max_workers=self.app_config.render_parallelism) as executor:
-            future_map = {
-                executor.submit(
-                    self._render_one,
-                    idx,
-                    candidate,
-                    input_video,
-                    clips_dir,
-                    subtitle_dir,
-                    transcript,
-                    title_style,
-                    impact_style,
-                    total,
-                    on_event,
-                    cancel_event,
-                ): idx
-                for idx, candidate in enumerate(candidates, start=1)
-            }
+        with ThreadPoolExecutor(max_workers=schedule.workers) as executor:
+            future_map = {}
+            for job in schedule.order:
+                group = groups[job]
+                if len(group) == 1:
+                    idx = group[0]
+                    future = executor.submit(
+                        self._render_one,
+                        idx,
+                        candidates[idx - 1],
+                        input_video,
+                        clips_dir,
+                        subtitle_dir,
+                        transcript,
+                        title_style,
+                        impact_style,
+                        total,
+                        on_event,
+                        cancel_event,
+                        silence_map,
+                        keyframe_index,
+                        video_codec,
+                        threads,
+                        reuse,
+                        frame_rate,
+                        expect_audio,
+                        numbers[idx - 1],
+                    )
+                else:
+                    future = executor.submit(
+                        self._render_batch,
+                        [(idx, candidates[idx - 1]) for idx in group],
+                        input_video,
+                        clips_dir,
+                        subtitle_dir,
+                        transcript,
+                        title_style,
+                        impact_style,
+                        total,
+                        on_event,
+                        cancel_event,
+                        silence_map,
+                        keyframe_index,
+                        video_codec,
+                        threads,
+                        reuse,
+                        frame_rate,
+                        expect_audio,
+                        {idx: numbers[idx - 1] for idx in group},
+                        has_audio,
+                    )
+                future_map[future] = group
             ordered: list[tuple[int, RenderedClip]] = []
+            failures: list[tuple[list[int], Exception]] = []
             for future in as_completed(future_map):
-                idx = future_map[future]
-                rendered_clip = future.result()
-                ordered.append((idx, rendered_clip))
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    failures.append((future_map[future], exc))
+                    continue
+                if isinstance(result, RenderedClip):
+                    ordered.append((future_map[future][0], result))
+                else:
+                    ordered.extend(result)
+
+        if failures:
+            cancelled = cancel_event is not None and cancel_event.is_set()
+            if cancelled or not ordered:
+                raise failures[0][1]
+            # Keep the clips that finished; one bad clip should not discard the batch.
+            if self.logger is not None:
+                self.logger.warning(
+                    "render.partial_failure",
+                    failed=sorted(idx for group, _ in failures for idx in group),
+                    rendered=len(ordered),
+                    error=str(failures[0][1])[-500:],
+                )
 
         ordered.sort(key=lambda pair: pair[0])
         return [clip for _, clip in ordered]
 
+    def for_profile(self, profile: str) -> LocalFFmpegRenderer:
+        """Renderer sharing caches and probes but building commands for `profile`."""
+        if profile == self.profile:
+            return self
+        if profile != "preview":
+            raise ValueError(f"unknown render profile: {profile}")
+        renderer = copy.copy(self)
+        renderer.command_builder = FFmpegCommandBuilder(
+            self.command_builder.config.preview_config(),
+            overlay_images=self.command_builder.overlay_images,
+        )
+        # Base layers are keyed by profile, so a preview base layer is never reused by
+        # finalize; one single-pass encode is cheaper than base + overlay at preview quality.
+        renderer.base_layer_cache = None
+        renderer.profile = profile
+        return renderer
+
     def _render_one(
         self,
         idx: int,
@@ -90,36 +285,38 @@ class LocalFFmpegRenderer:
         title_style: TitleOverlayStyle | None,
         impact_style: ImpactOverlayStyle | None,
         total: int,
-        on_event: Callable[[str, int, int, str], None] | None,
+        on_event: RenderEventCallback | None,
         cancel_event=None,
+        silence_map: SilenceMap | None = None,
+        keyframe_index: KeyframeIndex | None = None,
+        video_codec: str | None = None,
+        threads: int | None = None,
+        reuse: bool = True,
+        frame_rate: float | None = None,
+        expect_audio: bool = False,
+        clip_number: int | None = None,
     ) -> RenderedClip:
         if cancel_event is not None and cancel_event.is_set():
             raise RuntimeError("processing cancelled")
 
-        safe_title = sanitize_filename(candidate.title)
-        clip_filename = f"clip_{idx:02d}_{safe_title}.mp4"
-        output_path = clips_dir / clip_filename
-        subtitle_path: Path | None = None
-        if self.enable_subtitles and subtitle_dir is not None:
-            subtitle_filename = f"clip_{idx:02d}.ass"
-            subtitle_path = subtitle_dir / subtitle_filename
-
         if on_event:
             on_event("started", idx, total, candidate.title)
 
-        speech_intervals = (
-            self._build_speech_intervals(input_video, candidate, transcript)
-            if self.app_config.enable_silence_compaction
-            else None
+        output_path, subtitle_path, speech_intervals = self._prepare_clip(
+            idx,
+            candidate,
+            input_video,
+            clips_dir,
+            subtitle_dir,
+            transcript,
+            silence_map,
+            frame_rate,
+            clip_number,
         )
-
-        if subtitle_path is not None:
-            self.subtitle_generator.generate(
-                subtitle_path,
-                candidate,
-                transcript,
-                speech_intervals=speech_intervals,
-            )
+        seek_keyframe = (
+            keyframe_index.at_or_before(candidate.start_sec) if keyframe_index is not None else None
+        )
+        preroll = candidate.start_sec - seek_keyframe if seek_keyframe is not None else 0.0
         cmd = self.command_builder.build(
             input_video=input_video,
             output_video=output_path,
@@ -128,27 +325,134 @@ class LocalFFmpegRenderer:
             title_style=title_style,
             impact_style=impact_style,
             speech_intervals=speech_intervals,
+            seek_keyframe_sec=seek_keyframe,
+            video_codec=video_codec,
+            frame_rate=frame_rate,
         )
 
+        # Keyed by renderer setup: with a base-layer cache a clip may come from either the
+        # single-pass or the two-pass encode (see `_wants_base_layer`), which differ bitwise.
+        mode = f"{video_codec or ''}+base_layer" if self.base_layer_cache else video_codec
+        output_duration = (
+            sum(end - start for start, end in speech_intervals)
+            if speech_intervals
+            else candidate.duration
+        )
+        manifest = self._manifest(clips_dir)
+        digest = command_digest(cmd, mode or "")
+        if reuse and self._already_rendered(
+            manifest, output_path, digest, output_duration, expect_audio
+        ):
+            if on_event:
+                on_event("completed", idx, total, candidate.title)
+            return RenderedClip(
+                clip_id=candidate.clip_id,
+                title=candidate.title,
+                start_sec=candidate.start_sec,
+                end_sec=candidate.end_sec,
+                video_path=output_path,
+                subtitle_path=subtitle_path,
+                preroll_sec=round(preroll, 3),
+                cache_hit=True,
+                overlay_signature=self.overlay_signature(candidate, title_style, impact_style),
+                expected_duration_sec=round(output_duration, 3),
+                speech_intervals=speech_intervals,
+            )
+
+        cache_key = None
+        if self.render_cache is not None:
+            cache_key = self.render_cache.key(
+                cmd,
+                input_video,
+                output_path,
+                subtitle_path,
+                candidate,
+                mode,
+            )
+            if reuse and self.render_cache.fetch(cache_key, output_path):
+                if on_event:
+                    on_event("completed", idx, total, candidate.title)
+                cached = self.render_cache.metadata(cache_key)
+                return RenderedClip(
+                    clip_id=candidate.clip_id,
+                    title=candidate.title,
+                    start_sec=candidate.start_sec,
+                    end_sec=candidate.end_sec,
+                    video_path=output_path,
+                    subtitle_path=subtitle_path,
+                    preroll_sec=float(cached.get("preroll_sec", round(preroll, 3))),
+                    cache_hit=True,
+                    overlay_signature=self.overlay_signature(candidate, title_style, impact_style),
+                    expected_duration_sec=round(output_duration, 3),
+                    speech_intervals=speech_intervals,
+                )
+        # ffmpeg writes to a temporary name that is renamed into place on success, so a crash
+        # never leaves a truncated clip behind and a cached (hardlinked) inode is never rewritten.
+        temp_path = partial_path(output_path)
+        temp_path.unlink(missing_ok=True)
+
+        def _on_progress(fraction: float) -> None:
+            if on_event:
+                on_event("progress", idx, total, candidate.title, fraction)
+
+        base_target = None
+        if self.base_layer_cache is not None:
+            base_target = self._base_layer_target(
+                idx, candidate, input_video, clips_dir, speech_intervals, seek_keyframe, frame_rate
+            )
         try:
-            run_command(cmd, cancel_event=cancel_event)
-        except Exception:
-            try:
-                fallback = self.command_builder.build(
+            if base_target is not None and self._wants_base_layer(base_target[1]):
+                self._render_with_base_layer(
+                    base_path=base_target[0],
+                    base_key=base_target[1],
+                    candidate=candidate,
                     input_video=input_video,
-                    output_video=output_path,
+                    output_path=temp_path,
                     subtitle_path=subtitle_path,
-                    candidate=candidate,
                     title_style=title_style,
                     impact_style=impact_style,
                     speech_intervals=speech_intervals,
-                    fallback_software_codec=True,
+                    seek_keyframe=seek_keyframe,
+                    video_codec=video_codec,
+                    output_duration=output_duration,
+                    frame_rate=frame_rate,
+                    on_progress=_on_progress,
+                    cancel_event=cancel_event,
+                    threads=threads,
                 )
-                run_command(fallback, cancel_event=cancel_event)
-            except Exception:
-                if on_event:
-                    on_event("failed", idx, total, candidate.title)
-                raise
+            else:
+                self._run_encode(
+                    lambda **overrides: self.command_builder.build(
+                        input_video=input_video,
+                        output_video=temp_path,
+                        subtitle_path=subtitle_path,
+                        candidate=candidate,
+                        speech_intervals=speech_intervals,
+                        seek_keyframe_sec=seek_keyframe,
+                        video_codec=video_codec,
+                        frame_rate=frame_rate,
+                        **overrides,
+                    ),
+                    video_codec=video_codec,
+                    output_duration=output_duration,
+                    on_progress=_on_progress,
+                    cancel_event=cancel_event,
+                    title_style=title_style,
+                    impact_style=impact_style,
+                    threads=threads,
+                )
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            if on_event:
+                on_event("failed", idx, total, candidate.title)
+            raise
+
+        os.replace(temp_path, output_path)
+        manifest.record(output_path.name, digest, output_duration, preroll)
+        if self.render_cache is not None and cache_key is not None:
+            self.render_cache.store(
+                cache_key, output_path, {"preroll_sec": round(preroll, 3)}
+            )
 
         if on_event:
             on_event("completed", idx, total, candidate.title)
@@ -160,13 +464,528 @@ class LocalFFmpegRenderer:
             end_sec=candidate.end_sec,
             video_path=output_path,
             subtitle_path=subtitle_path,
+            preroll_sec=round(preroll, 3),
+            overlay_signature=self.overlay_signature(candidate, title_style, impact_style),
+            expected_duration_sec=round(output_duration, 3),
+            speech_intervals=speech_intervals,
+        )
+
+    def _manifest(self, clips_dir: Path) -> RenderManifest:
+        return RenderManifest(clips_dir / ".render_manifest.json", self._manifest_lock)
+
+    def _already_rendered(
+        self,
+        manifest: RenderManifest,
+        output_path: Path,
+        digest: str,
+        expected_duration: float,
+        expect_audio: bool = False,
+    ) -> bool:
+        """True when a previous (possibly crashed) run finished this exact clip."""
+        if manifest.digest_for(output_path.name) != digest:
+            return False
+        return verify_rendered_output(output_path, expected_duration, expect_audio=expect_audio)
+
+    def _prepare_clip(
+        self,
+        idx: int,
+        candidate: ClipCandidate,
+        input_video: Path,
+        clips_dir: Path,
+        subtitle_dir: Path | None,
+        transcript: Transcript,
+        silence_map: SilenceMap | None,
+        frame_rate: float | None = None,
+        clip_number: int | None = None,
+    ) -> tuple[Path, Path | None, list[tuple[float, float]] | None]:
+        number = clip_number if clip_number is not None else idx
+        safe_title = sanitize_filename(candidate.title)
+        clip_filename = f"clip_{number:02d}_{safe_title}.mp4"
+        output_path = clips_dir / clip_filename
+        subtitle_path: Path | None = None
+        if self.enable_subtitles and subtitle_dir is not None:
+            subtitle_filename = f"clip_{number:02d}.ass"
+            subtitle_path = subtitle_dir / subtitle_filename
+
+        speech_intervals = (
+            self._build_speech_intervals(
+                input_video,
+                candidate,
+                transcript,
+                silence_map=silence_map,
+            )
+            if self.app_config.enable_silence_compaction
+            else None
         )
+        if speech_intervals and frame_rate:
+            # Subtitles, expected duration and the ffmpeg cuts all use the aligned bounds.
+            speech_intervals = align_to_frames(
+                speech_intervals, frame_rate, origin_sec=candidate.start_sec
+            )
+
+        if subtitle_path is not None:
+            self.subtitle_generator.generate(
+                subtitle_path,
+                candidate,
+                transcript,
+                speech_intervals=speech_intervals,
+            )
+        return output_path, subtitle_path, speech_intervals
+
+    def _estimate_output_duration(
+        self, candidate: ClipCandidate, silence_map: SilenceMap | None
+    ) -> float:
+        duration = candidate.duration
+        if self.app_config.enable_silence_compaction and silence_map is not None:
+            silences = silence_map.slice(candidate.start_sec, candidate.end_sec)
+            silent = sum(end - start for start, end in silences)
+            duration = max(0.0, duration - silent)
+        return duration
+
+    def _plan_batches(self, candidates: list[ClipCandidate]) -> list[list[int]]:
+        """Group 1-based clip indices whose ranges sit close together in the source.
+
+        Each group is decoded once; size and covered span are capped so a single ffmpeg
+        process never holds more than `render_batch_max_clips` encoders or decodes far
+        beyond what its clips need.
+        """
+        max_clips = max(1, int(self.app_config.render_batch_max_clips))
+        order = sorted(range(1, len(candidates) + 1), key=lambda i: candidates[i - 1].start_sec)
+        if max_clips == 1:
+            return [[idx] for idx in order]
+        max_gap = max(0.0, float(self.app_config.render_batch_max_gap_sec))
+        max_span = max(0.0, float(self.app_config.render_batch_max_span_sec))
+
+        groups: list[list[int]] = []
+        group_start = group_end = 0.0
+        for idx in order:
+            candidate = candidates[idx - 1]
+            if (
+                groups
+                and len(groups[-1]) < max_clips
+                and candidate.start_sec - group_end <= max_gap
+                and max(group_end, candidate.end_sec) - group_start <= max_span
+            ):
+                groups[-1].append(idx)
+                group_end = max(group_end, candidate.end_sec)
+                continue
+            groups.append([idx])
+            group_start, group_end = candidate.start_sec, candidate.end_sec
+        return groups
+
+    def _render_batch(
+        self,
+        items: list[tuple[int, ClipCandidate]],
+        input_video: Path,
+        clips_dir: Path,
+        subtitle_dir: Path | None,
+        transcript: Transcript,
+        title_style: TitleOverlayStyle | None,
+        impact_style: ImpactOverlayStyle | None,
+        total: int,
+        on_event: RenderEventCallback | None,
+        cancel_event=None,
+        silence_map: SilenceMap | None = None,
+        keyframe_index: KeyframeIndex | None = None,
+        video_codec: str | None = None,
+        threads: int | None = None,
+        reuse: bool = True,
+        frame_rate: float | None = None,
+        expect_audio: bool = False,
+        clip_numbers: dict[int, int] | None = None,
+        has_audio: bool = True,
+    ) -> list[tuple[int, RenderedClip]]:
+        if cancel_event is not None and cancel_event.is_set():
+            raise RuntimeError("processing cancelled")
+
+        group_start = min(candidate.start_sec for _, candidate in items)
+        seek_sec = group_start
+        if keyframe_index is not None:
+            keyframe = keyframe_index.at_or_before(group_start)
+            if keyframe is not None:
+                seek_sec = keyframe
+
+        results: list[tuple[int, RenderedClip]] = []
+        pending: list[_PendingBatchClip] = []
+        manifest = self._manifest(clips_dir)
+        for idx, candidate in items:
+            if on_event:
+                on_event("started", idx, total, candidate.title)
+            output_path, subtitle_path, speech_intervals = self._prepare_clip(
+                idx,
+                candidate,
+                input_video,
+                clips_dir,
+                subtitle_dir,
+                transcript,
+                silence_map,
+                frame_rate,
+                (clip_numbers or {}).get(idx),
+            )
+            output_duration = (
+                sum(end - start for start, end in speech_intervals)
+                if speech_intervals
+                else candidate.duration
+            )
+            key_cmd = self.command_builder.build(
+                input_video=input_video,
+                output_video=output_path,
+                subtitle_path=subtitle_path,
+                candidate=candidate,
+                title_style=title_style,
+                impact_style=impact_style,
+                speech_intervals=speech_intervals,
+                video_codec=video_codec,
+                frame_rate=frame_rate,
+            )
+            mode = f"{video_codec or ''}+batch"
+            digest = command_digest(key_cmd, mode)
+            reused = reuse and self._already_rendered(
+                manifest, output_path, digest, output_duration, expect_audio
+            )
+            # The batch digest leaves out the group seek, so the preroll comes from the entry.
+            preroll = manifest.preroll_for(output_path.name) if reused else 0.0
+            cache_key = None
+            if not reused and self.render_cache is not None:
+                cache_key = self.render_cache.key(
+                    key_cmd, input_video, output_path, subtitle_path, candidate, mode
+                )
+                reused = reuse and self.render_cache.fetch(cache_key, output_path)
+                if reused:
+                    preroll = float(self.render_cache.metadata(cache_key).get("preroll_sec", 0.0))
+            if reused:
+                if on_event:
+                    on_event("completed", idx, total, candidate.title)
+                results.append(
+                    (
+                        idx,
+                        RenderedClip(
+                            clip_id=candidate.clip_id,
+                            title=candidate.title,
+                            start_sec=candidate.start_sec,
+                            end_sec=candidate.end_sec,
+                            video_path=output_path,
+                            subtitle_path=subtitle_path,
+                            preroll_sec=round(preroll, 3),
+                            cache_hit=True,
+                            overlay_signature=self.overlay_signature(
+                                candidate, title_style, impact_style
+                            ),
+                            expected_duration_sec=round(output_duration, 3),
+                            speech_intervals=speech_intervals,
+                        ),
+                    )
+                )
+                continue
+            temp_path = partial_path(output_path)
+            temp_path.unlink(missing_ok=True)
+            pending.append(
+                _PendingBatchClip(
+                    idx=idx,
+                    clip=BatchClip(temp_path, subtitle_path, candidate, speech_intervals),
+                    output_path=output_path,
+                    digest=digest,
+                    cache_key=cache_key,
+                    duration_sec=output_duration,
+                )
+            )
+
+        if not pending:
+            return results
+
+        clips = [item.clip for item in pending]
+        span_duration = max(clip.candidate.end_sec for clip in clips) - seek_sec
+
+        def _on_progress(fraction: float) -> None:
+            if on_event:
+                for item in pending:
+                    on_event("progress", item.idx, total, item.clip.candidate.title, fraction)
+
+        try:
+            self._run_encode(
+                lambda **overrides: self.command_builder.build_batch(
+                    input_video=input_video,
+                    clips=clips,
+                    seek_sec=seek_sec,
+                    video_codec=video_codec,
+                    frame_rate=frame_rate,
+                    has_audio=has_audio,
+                    **overrides,
+                ),
+                video_codec=video_codec,
+                output_duration=span_duration,
+                on_progress=_on_progress,
+                cancel_event=cancel_event,
+                title_style=title_style,
+                impact_style=impact_style,
+                threads=threads,
+            )
+        except Exception:
+            for item in pending:
+                item.clip.output_video.unlink(missing_ok=True)
+                if on_event:
+                    on_event("failed", item.idx, total, item.clip.candidate.title)
+            raise
+
+        for item in pending:
+            candidate = item.clip.candidate
+            preroll = candidate.start_sec - seek_sec
+            os.replace(item.clip.output_video, item.output_path)
+            manifest.record(item.output_path.name, item.digest, item.duration_sec, preroll)
+            if self.render_cache is not None and item.cache_key is not None:
+                self.render_cache.store(
+                    item.cache_key, item.output_path, {"preroll_sec": round(preroll, 3)}
+                )
+            if on_event:
+                on_event("completed", item.idx, total, candidate.title)
+            results.append(
+                (
+                    item.idx,
+                    RenderedClip(
+                        clip_id=candidate.clip_id,
+                        title=candidate.title,
+                        start_sec=candidate.start_sec,
+                        end_sec=candidate.end_sec,
+                        video_path=item.output_path,
+                        subtitle_path=item.clip.subtitle_path,
+                        preroll_sec=round(preroll, 3),
+                        overlay_signature=self.overlay_signature(
+                            candidate, title_style, impact_style
+                        ),
+                        expected_duration_sec=round(item.duration_sec, 3),
+                        speech_intervals=item.clip.speech_intervals,
+                    ),
+                )
+            )
+        return results
+
+    def _run_encode(
+        self,
+        build_cmd: Callable[..., list[str]],
+        video_codec: str | None,
+        output_duration: float,
+        on_progress: Callable[[float], None],
+        cancel_event=None,
+        title_style: TitleOverlayStyle | None = None,
+        impact_style: ImpactOverlayStyle | None = None,
+        threads: int | None = None,
+    ) -> None:
+        """Run the encode, retrying classified failures up to `max_render_retries` times.
+
+        `build_cmd` receives the attempt's builder overrides (styles, software codec, threads),
+        so each retry applies the degradation matching the failure.
+        """
+        codec = video_codec or self.command_builder.config.video_codec
+        retries = max(0, int(self.app_config.max_render_retries))
+        attempt = RenderAttempt()
+        for attempt_no in range(retries + 1):
+            try:
+                cmd = build_cmd(**attempt.overrides(title_style, impact_style, threads))
+                if self.command_builder.overlay_images is not None:
+                    # Inside the retry: a font failure here degrades to the fallback font.
+                    self.command_builder.overlay_images.materialize(cmd)
+                run_command(
+                    with_progress(cmd),
+                    cancel_event=cancel_event,
+                    on_progress=on_progress,
+                    progress_duration_sec=output_duration,
+                )
+                return
+            except Exception as exc:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise
+                failure = classify_render_failure(exc)
+                next_attempt = attempt.degrade(failure, codec)
+                if next_attempt is None or attempt_no >= retries:
+                    raise
+                if self.logger is not None:
+                    self.logger.warning(
+                        "render.retry",
+                        failure=failure,
+                        attempt=attempt_no + 1,
+                        error=str(exc)[-500:],
+                    )
+                if failure in ("io", "oom"):
+                    time.sleep(self.RETRY_DELAY_SEC * (attempt_no + 1))
+                attempt = next_attempt
+
+    def _base_layer_target(
+        self,
+        idx: int,
+        candidate: ClipCandidate,
+        input_video: Path,
+        clips_dir: Path,
+        speech_intervals: list[tuple[float, float]] | None,
+        seek_keyframe: float | None,
+        frame_rate: float | None = None,
+    ) -> tuple[Path, str]:
+        """Where the clip's text-free base layer is written, and its base-layer cache key."""
+        suffix = self.command_builder.BASE_LAYER_SUFFIX
+        base_path = clips_dir.parent / "base_layers" / f"clip_{idx:02d}{suffix}"
+        base_cmd = self.command_builder.build_base(
+            input_video=input_video,
+            output_base=base_path,
+            candidate=candidate,
+            speech_intervals=speech_intervals,
+            seek_keyframe_sec=seek_keyframe,
+            frame_rate=frame_rate,
+        )
+        base_key = self.base_layer_cache.key(
+            base_cmd,
+            input_video,
+            base_path,
+            None,
+            candidate,
+            "base_layer",
+        )
+        return base_path, base_key
+
+    def _wants_base_layer(self, base_key: str) -> bool:
+        """Two-pass only pays off once the footage is rendered again (e.g. after a title edit).
+
+        The first render of a clip is one encode; from the second request on, the base layer
+        is built and cached so later edits only re-run the cheap overlay pass.
+        """
+        if self.base_layer_cache.contains(base_key):
+            return True
+        return self.base_layer_cache.note_request(base_key)
+
+    def _render_with_base_layer(
+        self,
+        base_path: Path,
+        base_key: str,
+        candidate: ClipCandidate,
+        input_video: Path,
+        output_path: Path,
+        subtitle_path: Path | None,
+        title_style: TitleOverlayStyle | None,
+        impact_style: ImpactOverlayStyle | None,
+        speech_intervals: list[tuple[float, float]] | None,
+        seek_keyframe: float | None,
+        video_codec: str | None,
+        output_duration: float,
+        on_progress: Callable[[float], None],
+        cancel_event=None,
+        threads: int | None = None,
+        frame_rate: float | None = None,
+    ) -> None:
+        """Two-pass render: a cached text-free base layer, then a cheap overlay composite."""
+        base_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if not self.base_layer_cache.fetch(base_key, base_path):
+                base_path.unlink(missing_ok=True)
+                self._run_encode(
+                    lambda **overrides: self.command_builder.build_base(
+                        input_video=input_video,
+                        output_base=base_path,
+                        candidate=candidate,
+                        speech_intervals=speech_intervals,
+                        seek_keyframe_sec=seek_keyframe,
+                        threads=overrides["threads"],
+                        frame_rate=frame_rate,
+                    ),
+                    video_codec="libx264",
+                    output_duration=output_duration,
+                    on_progress=lambda fraction: on_progress(0.8 * fraction),
+                    cancel_event=cancel_event,
+                    threads=threads,
+                )
+                self.base_layer_cache.store(base_key, base_path)
+            self._run_encode(
+                lambda **overrides: self.command_builder.build_overlay(
+                    base_video=base_path,
+                    output_video=output_path,
+                    subtitle_path=subtitle_path,
+                    candidate=candidate,
+                    video_codec=video_codec,
+                    **overrides,
+                ),
+                video_codec=video_codec,
+                output_duration=output_duration,
+                on_progress=lambda fraction: on_progress(0.8 + 0.2 * fraction),
+                cancel_event=cancel_event,
+                title_style=title_style,
+                impact_style=impact_style,
+                threads=threads,
+            )
+        finally:
+            base_path.unlink(missing_ok=True)
+
+    def overlay_preview_image(
+        self,
+        kind: str,
+        text: str,
+        style: TitleOverlayStyle | ImpactOverlayStyle,
+    ) -> Path | None:
+        """The exact text strip a final render composites, for the review UI ("title"/"impact")."""
+        if kind == "impact":
+            text = self.command_builder.wrap_text(text, max_chars=14)
+        return self.command_builder.overlay_image(text, style)
+
+    def overlay_signature(
+        self,
+        candidate: ClipCandidate,
+        title_style: TitleOverlayStyle | None = None,
+        impact_style: ImpactOverlayStyle | None = None,
+    ) -> str:
+        """Digest of everything a review edit can change in a rendered clip."""
+        payload = {
+            "title": candidate.title,
+            "punchline": candidate.punchline,
+            "title_style": asdict(title_style or TitleOverlayStyle()),
+            "impact_style": asdict(impact_style or ImpactOverlayStyle()),
+            "subtitles": self.enable_subtitles,
+            "profile": self.profile,
+            "render": asdict(self.command_builder.config),
+        }
+        blob = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(blob).hexdigest()
+
+    def _resolve_video_codec(self) -> str | None:
+        if self.encoder_probe is None:
+            return None
+        if self._video_codec is None:
+            candidates = self.command_builder.config.codec_candidates()
+            try:
+                self._video_codec = self.encoder_probe.select(candidates)
+            except Exception as exc:
+                if self.logger is not None:
+                    self.logger.warning("render.encoder_probe_failed", error=str(exc))
+            if self._video_codec is None:
+                self._video_codec = candidates[0]
+            if self.logger is not None:
+                self.logger.info("render.encoder_selected", codec=self._video_codec)
+        return self._video_codec
+
+    def _probe_source(self, input_video: Path) -> MediaInfo | None:
+        """Source streams (frame rate for aligned cuts, audio presence); None if unknown."""
+        try:
+            if self.probe_cache is not None:
+                return self.probe_cache.probe(input_video)
+            return ffprobe_media(input_video)
+        except Exception as exc:
+            if self.logger is not None:
+                self.logger.warning("render.source_probe_failed", error=str(exc))
+            return None
+
+    def _load_keyframe_index(self, input_video: Path) -> KeyframeIndex | None:
+        if not self.command_builder.config.keyframe_seek:
+            return None
+        try:
+            if self.probe_cache is not None:
+                return self.probe_cache.keyframes(input_video)
+            return KeyframeIndex(times=probe_keyframes(input_video))
+        except Exception as exc:
+            if self.logger is not None:
+                self.logger.warning("render.keyframe_index_failed", error=str(exc))
+            return None
 
     def _build_speech_intervals(
         self,
         input_video: Path,
         candidate: ClipCandidate,
         transcript: Transcript,
+        silence_map: SilenceMap | None = None,
     ) -> list[tuple[float, float]] | None:
         duration = max(0.0, float(candidate.end_sec - candidate.start_sec))
         if duration <= 0:
@@ -176,9 +995,15 @@ class LocalFFmpegRenderer:
         merge_gap = max(0.0, float(self.app_config.silence_merge_gap_sec))
         min_seg = max(0.05, float(self.app_config.silence_min_segment_sec))
         min_cut_total = max(0.0, float(self.app_config.silence_min_cut_total_sec))
-        max_segments = max(1, int(self.app_config.silence_max_segments))
+        max_segments = max(0, int(self.app_config.silence_max_segments))
 
-        silences = self._detect_silence_ranges(input_video, candidate)
+        if silence_map is not None:
+            silences = self._merge_intervals(
+                silence_map.slice(candidate.start_sec, candidate.end_sec),
+                0.03,
+            )
+        else:
+            silences = self._detect_silence_ranges(input_video, candidate)
         if silences:
             speech = self._invert_intervals(silences, duration)
         else:
@@ -196,7 +1021,7 @@ class LocalFFmpegRenderer:
         if len(merged) < 2:
             return None
 
-        if len(merged) > max_segments:
+        if max_segments and len(merged) > max_segments:
             merged = self._reduce_intervals(merged, max_segments)
 
         original = duration
@@ -235,21 +1060,7 @@ class LocalFFmpegRenderer:
             return []
 
         text = (proc.stderr or "") + "\n" + (proc.stdout or "")
-        silences: list[tuple[float, float]] = []
-        current_start: float | None = None
-        for line in text.splitlines():
-            start_match = re.search(r"silence_start:\s*([0-9.]+)", line)
-            if start_match:
-                current_start = max(0.0, float(start_match.group(1)))
-                continue
-            end_match = re.search(r"silence_end:\s*([0-9.]+)", line)
-            if end_match and current_start is not None:
-                end_val = min(duration, float(end_match.group(1)))
-                if end_val > current_start:
-                    silences.append((current_start, end_val))
-                current_start = None
-        if current_start is not None and current_start < duration:
-            silences.append((current_start, duration))
+        silences = parse_silencedetect(text, duration)
         return self._merge_intervals(silences, 0.03)
 
     def _invert_intervals(
@@ -281,9 +1092,7 @@ class LocalFFmpegRenderer:
         clip_start = float(candidate.start_sec)
         clip_end = float(candidate.end_sec)
         overlaps: list[tuple[float, float]] = []
-        for seg in transcript.segments:
-            if seg.end <= clip_start or seg.start >= clip_end:
-                continue
+        for seg in transcript.index.overlapping(clip_start, clip_end):
             start = max(0.0, seg.start - clip_start)
             end = min(clip_end - clip_start, seg.end - clip_start)
             if end - start >= min_seg:
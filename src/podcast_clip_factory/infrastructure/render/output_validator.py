@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from podcast_clip_factory.domain.models import ClipValidation, RenderedClip
+from podcast_clip_factory.utils.media import (
+    CommandError,
+    mp4_moov_before_mdat,
+    probe_output_streams,
+)
+
+
+class RenderedOutputValidator:
+    """ffprobes rendered clips in a bounded pool before they reach review."""
+
+    def __init__(self, max_workers: int = 4, duration_tolerance_sec: float = 0.5) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.duration_tolerance_sec = max(0.0, float(duration_tolerance_sec))
+
+    def validate(
+        self, clips: list[RenderedClip], expect_audio: bool = True
+    ) -> list[ClipValidation]:
+        if not clips:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(clips))) as executor:
+            return list(executor.map(lambda clip: self.validate_one(clip, expect_audio), clips))
+
+    def validate_one(self, clip: RenderedClip, expect_audio: bool = True) -> ClipValidation:
+        result = ClipValidation(
+            clip_id=clip.clip_id,
+            ok=False,
+            expected_duration_sec=clip.expected_duration_sec,
+        )
+        path = clip.video_path
+        if not path.is_file() or path.stat().st_size == 0:
+            result.errors.append("missing_output")
+            return result
+        try:
+            duration, kinds = probe_output_streams(path)
+        except (OSError, subprocess.TimeoutExpired, ValueError, CommandError) as exc:
+            result.errors.append(f"ffprobe_failed: {str(exc).strip()[:200]}")
+            return result
+
+        result.duration_sec = round(duration, 3)
+        result.has_video = "video" in kinds
+        result.has_audio = "audio" in kinds
+        result.faststart = path.suffix.lower() != ".mp4" or mp4_moov_before_mdat(path)
+        if not result.has_video:
+            result.errors.append("no_video_stream")
+        if expect_audio and not result.has_audio:
+            result.errors.append("no_audio_stream")
+        if not result.faststart:
+            result.errors.append("moov_not_at_start")
+        expected = clip.expected_duration_sec
+        tolerance = max(self.duration_tolerance_sec, expected * 0.02)
+        if expected > 0 and abs(duration - expected) > tolerance:
+            result.errors.append(f"duration_mismatch: {duration:.2f}s != {expected:.2f}s")
+        result.ok = not result.errors
+        return result
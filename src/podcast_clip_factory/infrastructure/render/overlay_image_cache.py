@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from dataclasses import asdict
+from pathlib import Path
+from threading import Lock, get_ident
+
+from podcast_clip_factory.domain.models import ImpactOverlayStyle, TitleOverlayStyle
+from podcast_clip_factory.infrastructure.render.letterbox_layout import build_drawtext_filter
+from podcast_clip_factory.utils.media import run_command
+
+OverlayStyle = TitleOverlayStyle | ImpactOverlayStyle
+
+
+class OverlayImageCache:
+    """Title/impact text rasterized once into transparent full-width PNG strips.
+
+    Images are keyed by (text, style, canvas width) and drawn by ffmpeg's own `drawtext`,
+    so compositing them with `overlay` matches the per-frame drawtext output while font
+    lookup and glyph layout happen once per distinct overlay instead of on every frame.
+    """
+
+    LINE_HEIGHT = 1.5
+
+    def __init__(self, root: Path, ffmpeg_bin: str = "ffmpeg") -> None:
+        self.root = root
+        self.ffmpeg_bin = ffmpeg_bin
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._specs: dict[Path, tuple[str, OverlayStyle, int]] = {}
+
+    def path_for(self, text: str, style: OverlayStyle, canvas_width: int) -> Path:
+        """Where the strip for this overlay lives; registers it for `materialize`."""
+        payload = {
+            "text": text,
+            "kind": type(style).__name__,
+            "style": asdict(style),
+            "width": int(canvas_width),
+        }
+        blob = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        path = self.root / f"{hashlib.sha256(blob).hexdigest()}.png"
+        with self._lock:
+            self._specs[path] = (text, style, int(canvas_width))
+        return path
+
+    def offset(self, style: OverlayStyle) -> int:
+        """Top edge of the strip on the canvas (the box border sits above the text)."""
+        return int(style.y) - self._padding(style)
+
+    def image(self, text: str, style: OverlayStyle, canvas_width: int) -> Path:
+        path = self.path_for(text, style, canvas_width)
+        self._rasterize(path)
+        return path
+
+    def materialize(self, cmd: list[str]) -> None:
+        """Rasterize every cached strip `cmd` reads that is not on disk yet."""
+        for prev, arg in zip(cmd, cmd[1:], strict=False):
+            if prev == "-i" and Path(arg).parent == self.root:
+                self._rasterize(Path(arg))
+
+    def _rasterize(self, path: Path) -> None:
+        if path.exists():
+            return
+        with self._lock:
+            spec = self._specs.get(path)
+        if spec is None:
+            raise FileNotFoundError(f"unknown overlay image: {path}")
+        text, style, width = spec
+        padding = self._padding(style)
+        lines = text.count("\n") + 1
+        height = 2 * padding + lines * math.ceil(style.font_size * self.LINE_HEIGHT)
+        height += height % 2
+        drawtext = build_drawtext_filter(
+            text,
+            style.font_name,
+            style.font_size,
+            padding,
+            style.background,
+            style.background_opacity,
+            style.background_padding,
+        )
+        temp_path = path.with_name(f"{path.stem}.{os.getpid()}-{get_ident()}.partial.png")
+        run_command(
+            [
+                self.ffmpeg_bin,
+                "-y",
+                "-f",
+                "lavfi",
+                "-i",
+                f"color=c=black@0.0:s={int(width)}x{height},format=rgba",
+                "-vf",
+                drawtext,
+                "-frames:v",
+                "1",
+                str(temp_path),
+            ]
+        )
+        os.replace(temp_path, path)
+
+    def _padding(self, style: OverlayStyle) -> int:
+        return max(0, int(style.background_padding)) if style.background else 0
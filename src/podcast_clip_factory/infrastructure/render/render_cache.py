@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from threading import Lock
+
+from podcast_clip_factory.domain.models import ClipCandidate
+from podcast_clip_factory.utils.paths import file_fingerprint, link_or_copy
+
+
+class RenderCache:
+    """Content-addressed store of rendered clips with size-bounded LRU eviction.
+
+    Entries are hardlinked in and out, so a hit costs no re-encode and (on the same
+    filesystem) no extra disk space. File mtime doubles as the LRU timestamp. Facts about
+    an entry that the bytes alone do not carry (e.g. its keyframe preroll) live in a
+    `<key>.json` sidecar.
+    """
+
+    # How many recently requested keys `note_request` remembers.
+    MAX_REQUESTS = 2000
+
+    def __init__(self, root: Path, max_bytes: int, suffix: str = ".mp4") -> None:
+        self.root = root
+        self.max_bytes = max(0, int(max_bytes))
+        self.suffix = suffix
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+
+    def key(
+        self,
+        cmd: list[str],
+        input_video: Path,
+        output_video: Path,
+        subtitle_path: Path | None,
+        candidate: ClipCandidate,
+        video_codec: str | None,
+    ) -> str:
+        """Hash everything that determines the output bytes, minus incidental paths."""
+        subtitle_digest = ""
+        if subtitle_path is not None and subtitle_path.exists():
+            subtitle_digest = hashlib.sha256(subtitle_path.read_bytes()).hexdigest()
+        fingerprint = file_fingerprint(input_video)
+        replacements = {
+            str(input_video): "<input>",
+            str(output_video): "<output>",
+        }
+        if subtitle_path is not None:
+            replacements[str(subtitle_path)] = "<subtitle>"
+        normalized = []
+        for arg in cmd:
+            for raw, placeholder in replacements.items():
+                arg = arg.replace(raw, placeholder)
+            normalized.append(arg)
+        payload = {
+            "input": list(fingerprint[1:]) if fingerprint else str(input_video),
+            "start_sec": round(candidate.start_sec, 3),
+            "end_sec": round(candidate.end_sec, 3),
+            "cmd": normalized,
+            "subtitle": subtitle_digest,
+            "codec": video_codec or "",
+        }
+        blob = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(blob).hexdigest()
+
+    def fetch(self, key: str, dst: Path) -> bool:
+        entry = self._entry_path(key)
+        with self._lock:
+            if not entry.exists():
+                return False
+            os.utime(entry)
+            link_or_copy(entry, dst)
+        return True
+
+    def contains(self, key: str) -> bool:
+        return self._entry_path(key).exists()
+
+    def note_request(self, key: str) -> bool:
+        """Remember that `key` was wanted; True if it had been requested before."""
+        path = self.root / "requests.json"
+        with self._lock:
+            try:
+                keys = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                keys = []
+            if not isinstance(keys, list):
+                keys = []
+            seen = key in keys
+            if seen:
+                keys.remove(key)
+            keys.append(key)
+            path.write_text(json.dumps(keys[-self.MAX_REQUESTS :]), encoding="utf-8")
+        return seen
+
+    def metadata(self, key: str) -> dict:
+        try:
+            data = json.loads(self._meta_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def store(self, key: str, src: Path, metadata: dict | None = None) -> None:
+        if self.max_bytes <= 0 or not src.exists():
+            return
+        entry = self._entry_path(key)
+        with self._lock:
+            if metadata is not None:
+                self._meta_path(key).write_text(json.dumps(metadata), encoding="utf-8")
+            link_or_copy(src, entry)
+            os.utime(entry)
+            self._evict()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / f"{key}{self.suffix}"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.root.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            path.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+from podcast_clip_factory.domain.models import ImpactOverlayStyle, TitleOverlayStyle
+from podcast_clip_factory.utils.media import CommandError
+
+FALLBACK_FONT = "Sans"
+
+# Error lines only: the stream-mapping banner names the encoder on every run
+# ("... -> Stream #0:0 (h264_videotoolbox)"), so a bare codec name proves nothing.
+_ENCODER_MARKERS = (
+    "unknown encoder",
+    "encoder not found",
+    "error while opening encoder",
+    "could not open encoder",
+    "vtcompressionsessioncreate",
+    "openencodesessionex failed",
+    "no nvenc capable devices found",
+)
+_FONT_MARKERS = (
+    "cannot find a valid font",
+    "could not load font",
+    "cannot load font",
+    "font not found",
+)
+_IO_MARKERS = (
+    "no space left on device",
+    "input/output error",
+    "broken pipe",
+    "resource temporarily unavailable",
+)
+# Retrying cannot fix these; the output location has to change first.
+_FATAL_MARKERS = ("permission denied", "read-only file system")
+_OOM_MARKERS = ("cannot allocate memory", "out of memory")
+
+
+def classify_render_failure(exc: BaseException) -> str:
+    """Map an ffmpeg failure to a retry class.
+
+    One of "cancelled", "encoder", "font", "oom", "io", "fatal" or "unknown".
+    """
+    text = str(exc)
+    if text.startswith("Command cancelled:") or text == "processing cancelled":
+        return "cancelled"
+    stderr = (getattr(exc, "stderr", "") or text).lower()
+    returncode = exc.returncode if isinstance(exc, CommandError) else None
+    # SIGKILL without a cancel request is almost always the OOM killer.
+    if returncode in (-9, 137) or any(marker in stderr for marker in _OOM_MARKERS):
+        return "oom"
+    if isinstance(exc, PermissionError) or any(marker in stderr for marker in _FATAL_MARKERS):
+        return "fatal"
+    if any(marker in stderr for marker in _FONT_MARKERS):
+        return "font"
+    if any(marker in stderr for marker in _ENCODER_MARKERS):
+        return "encoder"
+    if isinstance(exc, OSError) or any(marker in stderr for marker in _IO_MARKERS):
+        return "io"
+    return "unknown"
+
+
+@dataclass(slots=True, frozen=True)
+class RenderAttempt:
+    """Degradations applied to a render command after classified failures."""
+
+    software_codec: bool = False
+    fallback_fonts: bool = False
+    single_thread: bool = False
+
+    def degrade(self, failure: str, video_codec: str) -> RenderAttempt | None:
+        """Next attempt for `failure`, or None when retrying cannot help."""
+        hardware = video_codec != "libx264" and not self.software_codec
+        if failure in ("cancelled", "fatal"):
+            return None
+        if failure == "encoder":
+            return replace(self, software_codec=True) if hardware else None
+        if failure == "font":
+            return None if self.fallback_fonts else replace(self, fallback_fonts=True)
+        if failure == "oom":
+            return None if self.single_thread else replace(self, single_thread=True)
+        if failure == "unknown" and hardware:
+            return replace(self, software_codec=True)
+        return self
+
+    def overrides(
+        self,
+        title_style: TitleOverlayStyle | None,
+        impact_style: ImpactOverlayStyle | None,
+        threads: int | None,
+    ) -> dict:
+        """Builder keyword arguments for this attempt."""
+        if self.fallback_fonts:
+            title_style = replace(title_style or TitleOverlayStyle(), font_name=FALLBACK_FONT)
+            impact_style = replace(impact_style or ImpactOverlayStyle(), font_name=FALLBACK_FONT)
+        return {
+            "title_style": title_style,
+            "impact_style": impact_style,
+            "fallback_software_codec": self.software_codec,
+            "threads": 1 if self.single_thread else threads,
+        }
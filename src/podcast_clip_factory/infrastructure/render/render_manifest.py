@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from threading import Lock
+
+
+def command_digest(cmd: list[str], *extra: str) -> str:
+    blob = json.dumps([*cmd, *extra], ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+def partial_path(output_path: Path) -> Path:
+    """Temporary name an encode writes to before being renamed into place."""
+    return output_path.with_name(f"{output_path.stem}.partial{output_path.suffix}")
+
+
+class RenderManifest:
+    """Per-directory record of clips that finished rendering, keyed by output file name.
+
+    A clip is only recorded after its output was atomically renamed into place, so an
+    entry whose command digest still matches identifies a finished render to resume from.
+    """
+
+    def __init__(self, path: Path, lock: Lock) -> None:
+        self.path = path
+        self._lock = lock
+
+    def digest_for(self, name: str) -> str | None:
+        with self._lock:
+            entry = self._load().get(name)
+        return str(entry.get("cmd_sha256")) if isinstance(entry, dict) else None
+
+    def preroll_for(self, name: str) -> float:
+        with self._lock:
+            entry = self._load().get(name)
+        return float(entry.get("preroll_sec", 0.0)) if isinstance(entry, dict) else 0.0
+
+    def record(
+        self, name: str, digest: str, duration_sec: float, preroll_sec: float = 0.0
+    ) -> None:
+        with self._lock:
+            entries = self._load()
+            entries[name] = {
+                "cmd_sha256": digest,
+                "duration_sec": round(duration_sec, 3),
+                "preroll_sec": round(preroll_sec, 3),
+            }
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(entries, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+
+    def _load(self) -> dict:
+        if not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
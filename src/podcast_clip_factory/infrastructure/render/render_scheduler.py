@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+from dataclasses import dataclass
+
+HARDWARE_ENCODER_MARKERS = ("videotoolbox", "nvenc", "qsv", "vaapi", "amf", "v4l2m2m")
+
+
+@dataclass(slots=True)
+class RenderSchedule:
+    order: list[int]
+    workers: int
+    threads_per_job: int
+
+
+class RenderScheduler:
+    """Orders render jobs longest-first and sizes the pool from CPU and free memory.
+
+    Each job gets an ffmpeg thread budget of `cpu_count // workers`, so parallel encodes
+    share the cores instead of each one spawning a thread per core.
+    """
+
+    def __init__(
+        self,
+        max_parallelism: int = 0,
+        memory_per_job_mb: int = 1200,
+        min_threads_per_job: int = 2,
+        cpu_count: int | None = None,
+        available_memory_mb: int | None = None,
+    ) -> None:
+        self.max_parallelism = max(0, int(max_parallelism))
+        self.memory_per_job_mb = max(1, int(memory_per_job_mb))
+        self.min_threads_per_job = max(1, int(min_threads_per_job))
+        self._cpu_count = cpu_count
+        self._available_memory_mb = available_memory_mb
+
+    def clip_cost(
+        self,
+        effective_duration_sec: float,
+        video_codec: str | None,
+        subtitles: bool,
+    ) -> float:
+        cost = max(0.0, float(effective_duration_sec))
+        codec = (video_codec or "").lower()
+        if any(marker in codec for marker in HARDWARE_ENCODER_MARKERS):
+            # Hardware encoders offload the encode; decode and filtering remain on the CPU.
+            cost *= 0.4
+        if subtitles:
+            cost *= 1.1
+        return cost
+
+    def plan(self, costs: list[float], memory_weights: list[int] | None = None) -> RenderSchedule:
+        """Return job indices (into `costs`) longest-first plus pool size and thread budget.
+
+        `memory_weights` counts concurrent encoders per job (batched jobs hold several).
+        """
+        jobs = len(costs)
+        if jobs == 0:
+            return RenderSchedule(order=[], workers=1, threads_per_job=1)
+        cpus = max(1, self._cpu_count or os.cpu_count() or 1)
+        workers = min(jobs, max(1, cpus // self.min_threads_per_job))
+        free_mb = (
+            self._available_memory_mb
+            if self._available_memory_mb is not None
+            else available_memory_mb()
+        )
+        if free_mb is not None:
+            heaviest = max(memory_weights or [1])
+            workers = min(workers, max(1, free_mb // (self.memory_per_job_mb * heaviest)))
+        if self.max_parallelism:
+            workers = min(workers, self.max_parallelism)
+        order = sorted(range(jobs), key=lambda i: costs[i], reverse=True)
+        return RenderSchedule(
+            order=order,
+            workers=workers,
+            threads_per_job=max(1, cpus // workers),
+        )
+
+
+def available_memory_mb(meminfo_path: str = "/proc/meminfo") -> int | None:
+    """Free + reclaimable physical memory in MB, or None if it cannot be determined."""
+    # Linux: MemAvailable counts page cache and reclaimable slab; SC_AVPHYS_PAGES is only
+    # MemFree, which stays near zero on a box that has been reading large videos.
+    try:
+        with open(meminfo_path, encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    # Kernels before 3.14 lack MemAvailable; MemFree underestimates but is still bounded.
+    try:
+        pages = os.sysconf("SC_AVPHYS_PAGES")
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        if pages > 0 and page_size > 0:
+            return int(pages * page_size // (1024 * 1024))
+    except (AttributeError, OSError, ValueError):
+        pass
+    # macOS has no SC_AVPHYS_PAGES; fall back to vm_stat (free + inactive pages).
+    try:
+        proc = subprocess.run(["vm_stat"], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if proc.returncode != 0:
+        return None
+    size_match = re.search(r"page size of (\d+) bytes", proc.stdout)
+    page_size = int(size_match.group(1)) if size_match else 4096
+    pages = 0
+    for name in ("Pages free", "Pages inactive", "Pages speculative"):
+        match = re.search(rf"{name}:\s+(\d+)", proc.stdout)
+        if match:
+            pages += int(match.group(1))
+    return int(pages * page_size // (1024 * 1024)) if pages else None
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from podcast_clip_factory.domain.models import ClipCandidate, Transcript
+from podcast_clip_factory.domain.compacted_timeline import CompactedTimeline
+from podcast_clip_factory.domain.models import ClipCandidate, Transcript, WordToken
 from podcast_clip_factory.utils.config import SubtitleConfig
 
 
@@ -30,45 +31,55 @@ class SubtitleGenerator:
     ) -> list[tuple[float, float, str]]:
         start = candidate.start_sec
         end = candidate.end_sec
+        timeline = CompactedTimeline.for_clip(speech_intervals, end - start)
         lines: list[tuple[float, float, str]] = []
 
-        for seg in transcript.segments:
-            if seg.end <= start or seg.start >= end:
-                continue
+        for seg in transcript.index.overlapping(start, end):
             rel_start = max(0.0, seg.start - start)
             rel_end = min(end - start, seg.end - start)
             if rel_end <= rel_start:
                 continue
             text = self._sanitize_text(seg.text)
-            if speech_intervals:
-                mapped = self._map_to_compacted_timeline(rel_start, rel_end, speech_intervals)
-                for mapped_start, mapped_end in mapped:
-                    if mapped_end > mapped_start:
-                        lines.append((mapped_start, mapped_end, text))
-            else:
-                lines.append((rel_start, rel_end, text))
+            for mapped_start, mapped_end in timeline.map_range(rel_start, rel_end):
+                line_text = text
+                if self.config.karaoke and seg.words:
+                    line_text = (
+                        self._karaoke_text(seg.words, start, timeline, mapped_start, mapped_end)
+                        or text
+                    )
+                lines.append((mapped_start, mapped_end, line_text))
 
         return lines
 
-    def _map_to_compacted_timeline(
+    def _karaoke_text(
         self,
-        seg_start: float,
-        seg_end: float,
-        speech_intervals: list[tuple[float, float]],
-    ) -> list[tuple[float, float]]:
-        mapped: list[tuple[float, float]] = []
-        out_cursor = 0.0
-        for keep_start, keep_end in speech_intervals:
-            if keep_end <= keep_start:
+        words: list[WordToken],
+        clip_start: float,
+        timeline: CompactedTimeline,
+        line_start: float,
+        line_end: float,
+    ) -> str:
+        """ASS `\\kf` sweep over the words spoken within this line, in output time."""
+        parts: list[str] = []
+        cursor = line_start
+        for word in words:
+            word_start = timeline.map_time(word.start - clip_start)
+            word_end = timeline.map_time(word.end - clip_start)
+            if word_end <= line_start or word_start >= line_end:
                 continue
-            overlap_start = max(seg_start, keep_start)
-            overlap_end = min(seg_end, keep_end)
-            if overlap_end > overlap_start:
-                mapped_start = out_cursor + (overlap_start - keep_start)
-                mapped_end = out_cursor + (overlap_end - keep_start)
-                mapped.append((mapped_start, mapped_end))
-            out_cursor += keep_end - keep_start
-        return mapped
+            word_start = max(line_start, word_start)
+            word_end = min(line_end, word_end)
+            if word_start > cursor:
+                parts.append(f"{{\\k{self._centis(word_start - cursor)}}}")
+                cursor = word_start
+            duration = max(0.0, word_end - cursor)
+            token = word.word.replace("{", "(").replace("}", ")").replace("\n", " ")
+            parts.append(f"{{\\kf{self._centis(duration)}}}{token}")
+            cursor += duration
+        return "".join(parts).strip()
+
+    def _centis(self, sec: float) -> int:
+        return max(0, int(round(sec * 100)))
 
     def _render_ass(self, lines: list[tuple[float, float, str]]) -> str:
         header = f"""[Script Info]
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 from pathlib import Path
 
-from podcast_clip_factory.domain.models import Transcript, TranscriptSegment, WordToken
+from podcast_clip_factory.domain.models import (
+    ClipCandidate,
+    Transcript,
+    TranscriptSegment,
+    WordToken,
+)
+from podcast_clip_factory.domain.silence_map import SilenceMap
 
 
 class ArtifactStore:
@@ -22,6 +29,15 @@ class ArtifactStore:
     def transcript_path(self, job_id: str) -> Path:
         return self.job_dir(job_id) / "transcript_full.json"
 
+    def partial_transcript_path(self, job_id: str) -> Path:
+        return self.job_dir(job_id) / "transcript_partial.jsonl"
+
+    def candidates_path(self, job_id: str) -> Path:
+        return self.job_dir(job_id) / "candidates.json"
+
+    def silence_map_path(self, job_id: str) -> Path:
+        return self.job_dir(job_id) / "silence_map.json"
+
     def metadata_path(self, job_id: str) -> Path:
         return self.job_dir(job_id) / "metadata.json"
 
@@ -42,39 +58,92 @@ class ArtifactStore:
         path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
 
     def save_transcript(self, job_id: str, transcript: Transcript) -> Path:
+        path = self.transcript_path(job_id)
+        self.write_json(path, transcript_to_payload(transcript))
+        self.partial_transcript_path(job_id).unlink(missing_ok=True)
+        return path
+
+    def load_transcript(self, path: Path) -> Transcript:
+        return transcript_from_payload(json.loads(path.read_text(encoding="utf-8")))
+
+    def save_candidates(
+        self, job_id: str, candidates: list[ClipCandidate], selection_source: str
+    ) -> Path:
+        """Final candidates exactly as rendered (the DB row has no punchline)."""
+        path = self.candidates_path(job_id)
+        self.write_json(
+            path,
+            {
+                "selection_source": selection_source,
+                "candidates": [asdict(candidate) for candidate in candidates],
+            },
+        )
+        return path
+
+    def load_candidates(self, job_id: str) -> tuple[list[ClipCandidate], str] | None:
+        path = self.candidates_path(job_id)
+        if not path.exists():
+            return None
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        candidates = [ClipCandidate(**item) for item in payload.get("candidates", [])]
+        return candidates, str(payload.get("selection_source", ""))
+
+    def save_silence_map(self, job_id: str, silence_map: SilenceMap) -> Path:
         payload = {
-            "language": transcript.language,
-            "duration_sec": transcript.duration_sec,
-            "segments": [
-                {
-                    "start": s.start,
-                    "end": s.end,
-                    "text": s.text,
-                    "words": [{"word": w.word, "start": w.start, "end": w.end} for w in s.words],
-                }
-                for s in transcript.segments
-            ],
+            "noise_db": silence_map.noise_db,
+            "min_silence_sec": silence_map.min_silence_sec,
+            "duration_sec": silence_map.duration_sec,
+            "intervals": [[start, end] for start, end in silence_map.intervals],
         }
-        path = self.transcript_path(job_id)
+        path = self.silence_map_path(job_id)
         self.write_json(path, payload)
         return path
 
-    def load_transcript(self, path: Path) -> Transcript:
+    def load_silence_map(self, job_id: str) -> SilenceMap | None:
+        path = self.silence_map_path(job_id)
+        if not path.exists():
+            return None
         payload = json.loads(path.read_text(encoding="utf-8"))
-        segments = [
-            TranscriptSegment(
-                start=float(seg["start"]),
-                end=float(seg["end"]),
-                text=str(seg["text"]),
-                words=[
-                    WordToken(word=str(w["word"]), start=float(w["start"]), end=float(w["end"]))
-                    for w in seg.get("words", [])
-                ],
-            )
-            for seg in payload.get("segments", [])
-        ]
-        return Transcript(
-            segments=segments,
-            language=str(payload.get("language", "ja")),
+        return SilenceMap(
+            intervals=[(float(start), float(end)) for start, end in payload.get("intervals", [])],
+            noise_db=float(payload["noise_db"]),
+            min_silence_sec=float(payload["min_silence_sec"]),
             duration_sec=float(payload.get("duration_sec", 0.0)),
         )
+
+
+def transcript_to_payload(transcript: Transcript) -> dict:
+    return {
+        "language": transcript.language,
+        "duration_sec": transcript.duration_sec,
+        "segments": [segment_to_payload(s) for s in transcript.segments],
+    }
+
+
+def transcript_from_payload(payload: dict) -> Transcript:
+    return Transcript(
+        segments=[segment_from_payload(seg) for seg in payload.get("segments", [])],
+        language=str(payload.get("language", "ja")),
+        duration_sec=float(payload.get("duration_sec", 0.0)),
+    )
+
+
+def segment_to_payload(segment: TranscriptSegment) -> dict:
+    return {
+        "start": segment.start,
+        "end": segment.end,
+        "text": segment.text,
+        "words": [{"word": w.word, "start": w.start, "end": w.end} for w in segment.words],
+    }
+
+
+def segment_from_payload(payload: dict) -> TranscriptSegment:
+    return TranscriptSegment(
+        start=float(payload["start"]),
+        end=float(payload["end"]),
+        text=str(payload["text"]),
+        words=[
+            WordToken(word=str(w["word"]), start=float(w["start"]), end=float(w["end"]))
+            for w in payload.get("words", [])
+        ],
+    )
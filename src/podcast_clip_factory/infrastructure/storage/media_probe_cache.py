@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import asdict, fields
+from datetime import datetime, timezone
+from pathlib import Path
+
+from podcast_clip_factory.domain.keyframe_index import KeyframeIndex
+from podcast_clip_factory.domain.models import MediaInfo
+from podcast_clip_factory.utils import media
+from podcast_clip_factory.utils.paths import file_fingerprint
+
+
+class MediaProbeCache:
+    """ffprobe results keyed by (path, size, mtime, inode) so large inputs are probed once."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS media_probe (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    probed_at TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS media_keyframes (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    probed_at TEXT NOT NULL
+                );
+                """
+            )
+
+    def probe(self, input_path: Path) -> MediaInfo:
+        cached = self.get(input_path)
+        if cached is not None:
+            return cached
+        info = media.ffprobe_media(input_path)
+        self.put(input_path, info)
+        return info
+
+    def get(self, input_path: Path) -> MediaInfo | None:
+        payload = self._load("media_probe", input_path)
+        if payload is None:
+            return None
+        known = {f.name for f in fields(MediaInfo)}
+        return MediaInfo(**{k: v for k, v in payload.items() if k in known})
+
+    def put(self, input_path: Path, info: MediaInfo) -> None:
+        self._store("media_probe", input_path, asdict(info))
+
+    def keyframes(self, input_path: Path) -> KeyframeIndex:
+        payload = self._load("media_keyframes", input_path)
+        if payload is not None:
+            return KeyframeIndex(times=[float(t) for t in payload])
+        times = media.probe_keyframes(input_path)
+        self._store("media_keyframes", input_path, times)
+        return KeyframeIndex(times=times)
+
+    def _load(self, table: str, input_path: Path):
+        key = self._file_key(input_path)
+        if key is None:
+            return None
+        path, size, mtime_ns, inode = key
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT size, mtime_ns, inode, payload FROM {table} WHERE path = ?",
+                (path,),
+            ).fetchone()
+        if not row or (row[0], row[1], row[2]) != (size, mtime_ns, inode):
+            return None
+        return json.loads(row[3])
+
+    def _store(self, table: str, input_path: Path, payload: dict | list) -> None:
+        key = self._file_key(input_path)
+        if key is None:
+            return
+        path, size, mtime_ns, inode = key
+        now = datetime.now(timezone.utc).isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                f"""
+                INSERT OR REPLACE INTO {table} (path, size, mtime_ns, inode, payload, probed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (path, size, mtime_ns, inode, json.dumps(payload), now),
+            )
+
+    def _file_key(self, input_path: Path) -> tuple[str, int, int, int] | None:
+        return file_fingerprint(input_path)
@@ -5,7 +5,14 @@ from datetime import datetime, timezone
 from pathlib import Path
 from uuid import uuid4
 
-from podcast_clip_factory.domain.models import ClipCandidate, JobRecord, JobStatus, RenderedClip, ReviewDecision
+from podcast_clip_factory.domain.models import (
+    ClipCandidate,
+    ClipValidation,
+    JobRecord,
+    JobStatus,
+    RenderedClip,
+    ReviewDecision,
+)
 
 
 class SQLiteJobRepository:
@@ -43,10 +50,23 @@ class SQLiteJobRepository:
                     subtitle_path TEXT NOT NULL DEFAULT '',
                     selected INTEGER NOT NULL DEFAULT 1,
                     edited_title TEXT NOT NULL DEFAULT '',
+                    render_signature TEXT NOT NULL DEFAULT '',
+                    validation_status TEXT NOT NULL DEFAULT '',
+                    validation_errors TEXT NOT NULL DEFAULT '',
+                    validated_at TEXT NOT NULL DEFAULT '',
                     PRIMARY KEY (job_id, clip_id)
                 );
                 """
             )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(clips)")}
+            for column in (
+                "render_signature",
+                "validation_status",
+                "validation_errors",
+                "validated_at",
+            ):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE clips ADD COLUMN {column} TEXT NOT NULL DEFAULT ''")
 
     def create_job(self, input_path: Path) -> JobRecord:
         now = datetime.now(timezone.utc).isoformat()
@@ -121,21 +141,48 @@ class SQLiteJobRepository:
             conn.executemany(
                 """
                 UPDATE clips
-                SET video_path = ?, subtitle_path = ?
+                SET video_path = ?, subtitle_path = ?, render_signature = ?
                 WHERE job_id = ? AND clip_id = ?
                 """,
                 [
-                    (str(r.video_path), str(r.subtitle_path) if r.subtitle_path else "", job_id, r.clip_id)
+                    (
+                        str(r.video_path),
+                        str(r.subtitle_path) if r.subtitle_path else "",
+                        r.overlay_signature,
+                        job_id,
+                        r.clip_id,
+                    )
                     for r in rendered
                 ],
             )
 
+    def save_validations(self, job_id: str, validations: list[ClipValidation]) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                UPDATE clips
+                SET validation_status = ?, validation_errors = ?, validated_at = ?
+                WHERE job_id = ? AND clip_id = ?
+                """,
+                [
+                    (
+                        "ok" if v.ok else "failed",
+                        "; ".join(v.errors),
+                        now,
+                        job_id,
+                        v.clip_id,
+                    )
+                    for v in validations
+                ],
+            )
+
     def get_review_rows(self, job_id: str) -> list[dict]:
         with self._connect() as conn:
             rows = conn.execute(
                 """
                 SELECT clip_id, start_sec, end_sec, title, score, hook, reason, video_path,
-                       selected, edited_title
+                       selected, edited_title, validation_status, validation_errors
                 FROM clips
                 WHERE job_id = ?
                 ORDER BY score DESC
@@ -155,6 +202,8 @@ class SQLiteJobRepository:
                 "video_path": row[7],
                 "selected": bool(row[8]),
                 "edited_title": row[9] or row[3],
+                "validation_status": row[10],
+                "validation_errors": row[11],
             }
             for row in rows
         ]
@@ -174,7 +223,8 @@ class SQLiteJobRepository:
         with self._connect() as conn:
             rows = conn.execute(
                 """
-                SELECT clip_id, start_sec, end_sec, title, edited_title, score, video_path
+                SELECT clip_id, start_sec, end_sec, title, edited_title, score, video_path,
+                       render_signature
                 FROM clips
                 WHERE job_id = ? AND selected = 1
                 ORDER BY score DESC
@@ -190,6 +240,7 @@ class SQLiteJobRepository:
                 "title": row[4] or row[3],
                 "score": row[5],
                 "video_path": row[6],
+                "render_signature": row[7],
             }
             for row in rows
         ]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from threading import Lock
+
+from podcast_clip_factory.domain.models import Transcript
+from podcast_clip_factory.infrastructure.storage.artifact_store import (
+    transcript_from_payload,
+    transcript_to_payload,
+)
+
+
+class TranscriptCache:
+    """Transcripts keyed by audio content hash + transcriber identity, size-bounded LRU.
+
+    File mtime doubles as the LRU timestamp (refreshed on every hit), as in `RenderCache`.
+    """
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max(0, int(max_bytes))
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+
+    def key(self, audio_digest: str, identity: dict) -> str:
+        payload = {"audio": audio_digest, "transcriber": identity}
+        blob = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(blob).hexdigest()
+
+    def get(self, key: str) -> Transcript | None:
+        entry = self._entry_path(key)
+        with self._lock:
+            if not entry.exists():
+                return None
+            try:
+                payload = json.loads(entry.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                entry.unlink(missing_ok=True)
+                return None
+            os.utime(entry)
+        return transcript_from_payload(payload)
+
+    def put(self, key: str, transcript: Transcript) -> None:
+        if self.max_bytes <= 0:
+            return
+        entry = self._entry_path(key)
+        temp_path = entry.with_suffix(".json.part")
+        blob = json.dumps(transcript_to_payload(transcript), ensure_ascii=False)
+        with self._lock:
+            temp_path.write_text(blob, encoding="utf-8")
+            os.replace(temp_path, entry)
+            self._evict()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.root.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from threading import Lock
+
+from podcast_clip_factory.domain.models import TranscriptSegment
+from podcast_clip_factory.infrastructure.storage.artifact_store import (
+    segment_from_payload,
+    segment_to_payload,
+)
+
+
+class TranscriptCheckpoint:
+    """Append-only JSONL of segments written while transcription is still running.
+
+    One line per segment, flushed immediately, so a crash or cancel leaves every segment
+    decoded so far on disk. The final `transcript_full.json` supersedes it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = Lock()
+        self._handle = None
+        self.segment_count = 0
+        self.transcribed_until = 0.0
+
+    def open(self) -> TranscriptCheckpoint:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.path.open("w", encoding="utf-8")
+            self.segment_count = 0
+            self.transcribed_until = 0.0
+        return self
+
+    def append(self, segment: TranscriptSegment) -> None:
+        line = json.dumps(segment_to_payload(segment), ensure_ascii=False)
+        with self._lock:
+            if self._handle is None:
+                return
+            self._handle.write(line + "\n")
+            self._handle.flush()
+            self.segment_count += 1
+            self.transcribed_until = max(self.transcribed_until, segment.end)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    @staticmethod
+    def load(path: Path) -> list[TranscriptSegment]:
+        """Segments from a checkpoint; a torn final line (crash mid-write) is ignored."""
+        if not path.exists():
+            return []
+        segments: list[TranscriptSegment] = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                segments.append(segment_from_payload(json.loads(line)))
+            except (ValueError, KeyError):
+                break
+        return segments
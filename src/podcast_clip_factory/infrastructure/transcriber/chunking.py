@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+
+from podcast_clip_factory.domain.models import TranscriptSegment, WordToken
+
+
+@dataclass(slots=True)
+class AudioChunk:
+    """`[start, end)` is the chunk's share of the timeline; audio is read over the padded range."""
+
+    start: float
+    end: float
+    audio_start: float
+    audio_end: float
+
+
+def plan_chunks(
+    duration_sec: float,
+    silences: list[tuple[float, float]],
+    target_sec: float,
+    overlap_sec: float = 2.0,
+) -> list[AudioChunk]:
+    """Split `[0, duration)` into ~`target_sec` chunks, cutting in the middle of silences.
+
+    A boundary moves to the silence midpoint closest to the ideal cut within a quarter chunk.
+    Without one it becomes a hard cut and both neighbours read `overlap_sec` past it, so a
+    word straddling the cut is transcribed whole by at least one side (see `merge_chunks`).
+    """
+    if duration_sec <= 0:
+        return []
+    target = max(1.0, float(target_sec))
+    mids = sorted((start + end) / 2 for start, end in silences if end > start)
+    search = target / 4
+    cuts: list[tuple[float, bool]] = []
+    pos = 0.0
+    while duration_sec - pos > target * 1.5:
+        ideal = pos + target
+        idx = bisect_left(mids, ideal)
+        nearby = [m for m in mids[max(0, idx - 1) : idx + 1] if abs(m - ideal) <= search]
+        if nearby:
+            pos = min(nearby, key=lambda m: abs(m - ideal))
+            cuts.append((pos, False))
+        else:
+            pos = ideal
+            cuts.append((pos, True))
+
+    bounds = [(0.0, False), *cuts, (float(duration_sec), False)]
+    chunks: list[AudioChunk] = []
+    for (start, hard_start), (end, hard_end) in zip(bounds, bounds[1:], strict=False):
+        chunks.append(
+            AudioChunk(
+                start=start,
+                end=end,
+                audio_start=max(0.0, start - overlap_sec) if hard_start else start,
+                audio_end=min(float(duration_sec), end + overlap_sec) if hard_end else end,
+            )
+        )
+    return chunks
+
+
+def merge_chunks(
+    chunks: list[AudioChunk],
+    results: list[list[TranscriptSegment]],
+) -> list[TranscriptSegment]:
+    """Offset chunk-relative segments/words to absolute time and drop boundary duplicates.
+
+    Each segment belongs to the chunk whose `[start, end)` contains its midpoint, so text
+    transcribed twice inside an overlap is kept exactly once.
+    """
+    merged: list[TranscriptSegment] = []
+    for idx, (chunk, segments) in enumerate(zip(chunks, results, strict=True)):
+        merged.extend(merge_chunk(chunk, segments, last=idx == len(chunks) - 1))
+    merged.sort(key=lambda seg: seg.start)
+    return merged
+
+
+def merge_chunk(
+    chunk: AudioChunk, segments: list[TranscriptSegment], last: bool = False
+) -> list[TranscriptSegment]:
+    """One chunk's share of `merge_chunks`, usable as soon as that chunk is done."""
+    offset = chunk.audio_start
+    kept: list[TranscriptSegment] = []
+    for seg in segments:
+        start = seg.start + offset
+        end = seg.end + offset
+        mid = (start + end) / 2
+        if mid < chunk.start or (mid >= chunk.end and not last):
+            continue
+        kept.append(
+            TranscriptSegment(
+                start=start,
+                end=end,
+                text=seg.text,
+                words=[
+                    WordToken(word=w.word, start=w.start + offset, end=w.end + offset)
+                    for w in seg.words
+                ],
+            )
+        )
+    return kept
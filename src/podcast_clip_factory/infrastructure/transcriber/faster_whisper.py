@@ -1,54 +1,334 @@
 from __future__ import annotations
 
+import multiprocessing
+import os
+import subprocess
+import wave
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
 
 from podcast_clip_factory.domain.models import Transcript, TranscriptSegment, WordToken
+from podcast_clip_factory.infrastructure.transcriber.chunking import (
+    AudioChunk,
+    merge_chunk,
+    plan_chunks,
+)
+from podcast_clip_factory.infrastructure.transcriber.streaming import SegmentStream
+from podcast_clip_factory.infrastructure.transcriber.worker import WorkerUnavailableError
+from podcast_clip_factory.utils.logger import get_logger
+from podcast_clip_factory.utils.media import CommandError, probe_output_streams
+
+SAMPLE_RATE = 16000
+
+
+@dataclass(slots=True)
+class FasterWhisperOptions:
+    """CTranslate2 load settings and decode settings for `WhisperModel`.
+
+    `batch_size` > 0 switches to faster-whisper's `BatchedInferencePipeline`, which decodes
+    VAD-split pieces of the file in batches instead of one 30 s window after another.
+    `cpu_threads` = 0 lets CTranslate2 pick; `num_workers` > 1 only helps concurrent calls.
+    """
+
+    compute_type: str = "int8"
+    cpu_threads: int = 0
+    num_workers: int = 1
+    batch_size: int = 0
+    beam_size: int = 5
 
 
 class FasterWhisperTranscriber:
-    def __init__(self, model: str, word_timestamps: bool = True) -> None:
+    # transcribe() can consume 16 kHz mono float32 samples directly (streamed audio path).
+    accepts_samples = True
+    # transcribe() takes episode silences (absolute seconds) to place chunk boundaries.
+    accepts_silences = True
+    # transcribe() reports each finished segment through on_segment (see transcribe_stream).
+    streams_segments = True
+
+    def __init__(
+        self,
+        model: str,
+        word_timestamps: bool = True,
+        chunk_sec: float = 0.0,
+        chunk_workers: int = 0,
+        chunk_cpu_threads: int = 4,
+        worker=None,
+        options: FasterWhisperOptions | None = None,
+    ) -> None:
         self.model_name = model
         self.word_timestamps = word_timestamps
+        self.options = options or FasterWhisperOptions()
+        # chunk_sec > 0 enables chunked mode: audio is split at silences into ~chunk_sec
+        # pieces that a process pool transcribes in parallel, one model per worker process.
+        self.chunk_sec = max(0.0, float(chunk_sec))
+        self.chunk_workers = max(0, int(chunk_workers))
+        self.chunk_cpu_threads = max(1, int(chunk_cpu_threads))
+        # Resident TranscriptionWorkerClient; used for whole-file jobs so the model survives
+        # app restarts. In-memory samples and chunked runs stay in this process.
+        self.worker = worker
         self._model = None
 
+    def cache_identity(self) -> dict:
+        identity = {
+            "name": "faster_whisper",
+            "model": self.model_name,
+            "word_timestamps": self.word_timestamps,
+        }
+        if self.chunk_sec:
+            identity["chunk_sec"] = self.chunk_sec
+        # Decode settings change the text; thread counts only change speed.
+        decode = {
+            "compute_type": self.options.compute_type,
+            "batch_size": self.options.batch_size,
+            "beam_size": self.options.beam_size,
+        }
+        defaults = FasterWhisperOptions()
+        if decode != {key: getattr(defaults, key) for key in decode}:
+            identity.update(decode)
+        return identity
+
     def _get_model(self):
         if self._model is None:
-            try:
-                from faster_whisper import WhisperModel
-            except ImportError as exc:  # pragma: no cover
-                raise RuntimeError("faster-whisper is not installed") from exc
-            self._model = WhisperModel(self.model_name, device="cpu", compute_type="int8")
+            self._model = _load_model(self.model_name, self.options)
         return self._model
 
-    def transcribe(self, audio_path: Path, cancel_event=None) -> Transcript:
+    def transcribe(
+        self,
+        audio_path: Path,
+        cancel_event=None,
+        samples=None,
+        silences: list[tuple[float, float]] | None = None,
+        on_segment=None,
+    ) -> Transcript:
+        stream = self.transcribe_stream(
+            audio_path,
+            cancel_event=cancel_event,
+            samples=samples,
+            silences=silences,
+        )
+        return stream.collect(on_segment=on_segment)
+
+    def transcribe_stream(
+        self,
+        audio_path: Path,
+        cancel_event=None,
+        samples=None,
+        silences: list[tuple[float, float]] | None = None,
+    ) -> SegmentStream:
+        """Segments are yielded (absolute times, in order) as soon as they are decoded."""
         if cancel_event is not None and cancel_event.is_set():
             raise RuntimeError("transcription cancelled")
 
+        stream = SegmentStream()
+        duration = _audio_duration(audio_path, samples)
+        if self.chunk_sec and duration > self.chunk_sec * 1.5:
+            chunks = plan_chunks(duration, silences or [], self.chunk_sec)
+            if len(chunks) > 1:
+                return stream.bind(
+                    self._iter_chunked(audio_path, samples, chunks, stream, cancel_event)
+                )
+
+        if self.worker is not None and samples is None:
+            try:
+                return self.worker.transcribe_stream(
+                    "faster_whisper",
+                    self.model_name,
+                    audio_path,
+                    word_timestamps=self.word_timestamps,
+                    cancel_event=cancel_event,
+                    options=asdict(self.options),
+                )
+            except WorkerUnavailableError:
+                pass
+
         model = self._get_model()
-        segments_iter, info = model.transcribe(
-            str(audio_path),
-            word_timestamps=self.word_timestamps,
-            vad_filter=True,
+        audio = samples if samples is not None else str(audio_path)
+        return stream.bind(
+            _iter_segments(model, audio, self.word_timestamps, stream, cancel_event, self.options)
         )
 
-        segments: list[TranscriptSegment] = []
-        for seg in segments_iter:
-            if cancel_event is not None and cancel_event.is_set():
-                raise RuntimeError("transcription cancelled")
-            words: list[WordToken] = []
-            for word in getattr(seg, "words", []) or []:
-                words.append(WordToken(word=word.word.strip(), start=float(word.start), end=float(word.end)))
-            segments.append(
-                TranscriptSegment(
-                    start=float(seg.start),
-                    end=float(seg.end),
-                    text=seg.text.strip(),
-                    words=words,
-                )
+    def _iter_chunked(
+        self,
+        audio_path: Path,
+        samples,
+        chunks: list[AudioChunk],
+        stream: SegmentStream,
+        cancel_event=None,
+    ) -> Iterator[TranscriptSegment]:
+        workers = self.chunk_workers or max(1, (os.cpu_count() or 1) // self.chunk_cpu_threads)
+        workers = min(workers, len(chunks))
+        results: dict[int, list[TranscriptSegment]] = {}
+        languages: list[str] = []
+        next_idx = 0
+        # spawn: the parent runs render/heartbeat threads, which fork() would not carry safely.
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                self.model_name,
+                asdict(replace(self.options, cpu_threads=self.chunk_cpu_threads)),
+            ),
+        )
+        try:
+            futures = {}
+            for idx, chunk in enumerate(chunks):
+                if samples is not None:
+                    audio = samples[
+                        int(chunk.audio_start * SAMPLE_RATE) : int(chunk.audio_end * SAMPLE_RATE)
+                    ]
+                    future = pool.submit(
+                        _transcribe_chunk, None, audio, 0.0, 0.0, self.word_timestamps
+                    )
+                else:
+                    future = pool.submit(
+                        _transcribe_chunk,
+                        str(audio_path),
+                        None,
+                        chunk.audio_start,
+                        chunk.audio_end,
+                        self.word_timestamps,
+                    )
+                futures[future] = idx
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                if cancel_event is not None and cancel_event.is_set():
+                    raise RuntimeError("transcription cancelled")
+                for future in done:
+                    segments, language = future.result()
+                    results[futures[future]] = segments
+                    languages.append(language)
+                if languages:
+                    stream.language = max(set(languages), key=languages.count)
+                # Chunks finish out of order; release them only as a contiguous prefix.
+                while next_idx in results:
+                    last = next_idx == len(chunks) - 1
+                    yield from merge_chunk(chunks[next_idx], results.pop(next_idx), last)
+                    next_idx += 1
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+_WORKER_MODEL = None
+_WORKER_OPTIONS = FasterWhisperOptions()
+
+
+def _load_model(model_name: str, options: FasterWhisperOptions | None = None):
+    """`WhisperModel`, wrapped in `BatchedInferencePipeline` when batching is enabled."""
+    options = options or FasterWhisperOptions()
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError as exc:  # pragma: no cover
+        raise RuntimeError("faster-whisper is not installed") from exc
+    model = WhisperModel(
+        model_name,
+        device="cpu",
+        compute_type=options.compute_type,
+        cpu_threads=options.cpu_threads,
+        num_workers=max(1, options.num_workers),
+    )
+    if options.batch_size > 0:
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError as exc:  # pragma: no cover
+            raise RuntimeError("faster-whisper>=1.1 is required for batched inference") from exc
+        return BatchedInferencePipeline(model=model)
+    return model
+
+
+def _init_worker(model_name: str, options: dict) -> None:
+    global _WORKER_MODEL, _WORKER_OPTIONS
+    _WORKER_OPTIONS = FasterWhisperOptions(**options)
+    _WORKER_MODEL = _load_model(model_name, _WORKER_OPTIONS)
+
+
+def _transcribe_chunk(
+    audio_path: str | None,
+    samples,
+    start_sec: float,
+    end_sec: float,
+    word_timestamps: bool,
+) -> tuple[list[TranscriptSegment], str]:
+    """Worker entry point; times in the result are relative to the chunk start."""
+    audio = samples if samples is not None else _read_wav_range(audio_path, start_sec, end_sec)
+    return _transcribe_audio(_WORKER_MODEL, audio, word_timestamps, _WORKER_OPTIONS)
+
+
+def _transcribe_audio(
+    model, audio, word_timestamps: bool, options: FasterWhisperOptions | None = None
+) -> tuple[list[TranscriptSegment], str]:
+    stream = SegmentStream()
+    segments = list(_iter_segments(model, audio, word_timestamps, stream, options=options))
+    return segments, stream.language
+
+
+def _iter_segments(
+    model,
+    audio,
+    word_timestamps: bool,
+    stream: SegmentStream,
+    cancel_event=None,
+    options: FasterWhisperOptions | None = None,
+) -> Iterator[TranscriptSegment]:
+    # faster-whisper decodes lazily: each segment exists only once this loop pulls it.
+    options = options or FasterWhisperOptions()
+    decode_args = {"beam_size": options.beam_size}
+    if options.batch_size > 0:
+        decode_args["batch_size"] = options.batch_size
+    segments_iter, info = model.transcribe(
+        audio,
+        word_timestamps=word_timestamps,
+        vad_filter=True,
+        **decode_args,
+    )
+    stream.language = getattr(info, "language", "ja") or "ja"
+
+    for seg in segments_iter:
+        if cancel_event is not None and cancel_event.is_set():
+            raise RuntimeError("transcription cancelled")
+        words: list[WordToken] = []
+        for word in getattr(seg, "words", []) or []:
+            words.append(
+                WordToken(word=word.word.strip(), start=float(word.start), end=float(word.end))
             )
+        yield TranscriptSegment(
+            start=float(seg.start),
+            end=float(seg.end),
+            text=seg.text.strip(),
+            words=words,
+        )
 
-        return Transcript(
-            segments=segments,
-            language=getattr(info, "language", "ja") or "ja",
-            duration_sec=segments[-1].end if segments else 0.0,
+
+def _audio_duration(audio_path: Path, samples) -> float:
+    """Seconds of audio; 0.0 (which disables chunking) only when nothing can measure it."""
+    if samples is not None:
+        return len(samples) / SAMPLE_RATE
+    try:
+        with wave.open(str(audio_path), "rb") as wav:
+            return wav.getnframes() / float(wav.getframerate() or SAMPLE_RATE)
+    except (OSError, wave.Error, EOFError):
+        pass
+    # Not a PCM WAV (e.g. a user-supplied mp3/m4a): ask ffprobe instead.
+    try:
+        return probe_output_streams(Path(audio_path))[0]
+    except (OSError, ValueError, CommandError, subprocess.SubprocessError) as exc:
+        get_logger().warning(
+            "audio duration unknown; chunked transcription disabled",
+            audio_path=str(audio_path),
+            error=str(exc),
         )
+        return 0.0
+
+
+def _read_wav_range(audio_path: str, start_sec: float, end_sec: float):
+    import numpy as np
+
+    with wave.open(audio_path, "rb") as wav:
+        rate = wav.getframerate()
+        start = int(start_sec * rate)
+        wav.setpos(min(start, wav.getnframes()))
+        frames = wav.readframes(max(0, int(end_sec * rate) - start))
+    return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
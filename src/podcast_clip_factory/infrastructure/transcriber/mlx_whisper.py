@@ -8,41 +8,45 @@ import time
 from pathlib import Path
 
 from podcast_clip_factory.domain.models import Transcript, TranscriptSegment, WordToken
+from podcast_clip_factory.infrastructure.transcriber.worker import WorkerUnavailableError
 
 
 class MLXWhisperTranscriber:
-    def __init__(self, model: str, word_timestamps: bool = True) -> None:
+    # transcribe() reports each finished segment through on_segment (all at once unless
+    # the resident worker streams them).
+    streams_segments = True
+
+    def __init__(self, model: str, word_timestamps: bool = True, worker=None) -> None:
         self.model = model
         self.word_timestamps = word_timestamps
+        # Resident TranscriptionWorkerClient keeping the model loaded across jobs; when it
+        # cannot be reached the per-job subprocess below is used instead.
+        self.worker = worker
 
-    def transcribe(self, audio_path: Path, cancel_event=None) -> Transcript:
-        result = self._run_mlx_in_subprocess(audio_path, cancel_event=cancel_event)
+    def cache_identity(self) -> dict:
+        return {"name": "mlx_whisper", "model": self.model, "word_timestamps": self.word_timestamps}
 
-        segments: list[TranscriptSegment] = []
-        for seg in result.get("segments", []):
-            words: list[WordToken] = []
-            for word in seg.get("words", []):
-                words.append(
-                    WordToken(
-                        word=str(word.get("word", "")).strip(),
-                        start=float(word.get("start", seg.get("start", 0.0))),
-                        end=float(word.get("end", seg.get("end", 0.0))),
-                    )
-                )
-            segments.append(
-                TranscriptSegment(
-                    start=float(seg.get("start", 0.0)),
-                    end=float(seg.get("end", 0.0)),
-                    text=str(seg.get("text", "")).strip(),
-                    words=words,
+    def transcribe(self, audio_path: Path, cancel_event=None, on_segment=None) -> Transcript:
+        if self.worker is not None:
+            try:
+                stream = self.worker.transcribe_stream(
+                    "mlx_whisper",
+                    self.model,
+                    audio_path,
+                    word_timestamps=self.word_timestamps,
+                    cancel_event=cancel_event,
                 )
-            )
+            except WorkerUnavailableError:
+                pass
+            else:
+                return stream.collect(on_segment=on_segment)
 
-        return Transcript(
-            segments=segments,
-            language=str(result.get("language", "ja")),
-            duration_sec=float(result.get("duration", 0.0)) if result.get("duration") else 0.0,
-        )
+        result = self._run_mlx_in_subprocess(audio_path, cancel_event=cancel_event)
+        transcript = transcript_from_mlx_result(result)
+        if on_segment is not None:
+            for segment in transcript.segments:
+                on_segment(segment)
+        return transcript
 
     def _run_mlx_in_subprocess(self, audio_path: Path, cancel_event=None) -> dict:
         script = (
@@ -107,3 +111,31 @@ class MLXWhisperTranscriber:
             if proc.poll() is None:
                 proc.kill()
             tmp_path.unlink(missing_ok=True)
+
+
+def transcript_from_mlx_result(result: dict) -> Transcript:
+    segments: list[TranscriptSegment] = []
+    for seg in result.get("segments", []):
+        words: list[WordToken] = []
+        for word in seg.get("words", []):
+            words.append(
+                WordToken(
+                    word=str(word.get("word", "")).strip(),
+                    start=float(word.get("start", seg.get("start", 0.0))),
+                    end=float(word.get("end", seg.get("end", 0.0))),
+                )
+            )
+        segments.append(
+            TranscriptSegment(
+                start=float(seg.get("start", 0.0)),
+                end=float(seg.get("end", 0.0)),
+                text=str(seg.get("text", "")).strip(),
+                words=words,
+            )
+        )
+
+    return Transcript(
+        segments=segments,
+        language=str(result.get("language", "ja")),
+        duration_sec=float(result.get("duration", 0.0)) if result.get("duration") else 0.0,
+    )
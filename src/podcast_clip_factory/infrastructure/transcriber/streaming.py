@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from podcast_clip_factory.domain.models import Transcript, TranscriptSegment
+
+
+class SegmentStream:
+    """Finished segments in time order as the transcriber produces them.
+
+    `language` is filled in by the producer once decoding has started, so it is only
+    reliable after the first segment (or after the stream is exhausted).
+    """
+
+    def __init__(self) -> None:
+        self.language = "ja"
+        self._source: Iterator[TranscriptSegment] = iter(())
+
+    def bind(self, source: Iterator[TranscriptSegment]) -> SegmentStream:
+        self._source = source
+        return self
+
+    def __iter__(self) -> Iterator[TranscriptSegment]:
+        return self._source
+
+    def close(self) -> None:
+        close = getattr(self._source, "close", None)
+        if callable(close):
+            close()
+
+    def collect(self, on_segment=None, duration_sec: float = 0.0) -> Transcript:
+        """Drain the stream into a Transcript, handing each segment to `on_segment` first."""
+        segments: list[TranscriptSegment] = []
+        try:
+            for seg in self:
+                if on_segment is not None:
+                    on_segment(seg)
+                segments.append(seg)
+        finally:
+            self.close()
+        segments.sort(key=lambda seg: seg.start)
+        return Transcript(
+            segments=segments,
+            language=self.language,
+            duration_sec=segments[-1].end if segments else duration_sec,
+        )
@@ -0,0 +1,431 @@
+"""Resident transcription worker: one long-lived process that keeps whisper models loaded.
+
+GUI and CLI runs talk to it over a Unix socket with newline-delimited JSON, one job per
+connection:
+
+    client -> {"op": "transcribe", "engine", "model", "audio_path", "word_timestamps", "options"}
+    worker -> {"event": "segment", "segment": {...}} ... then one of
+              {"event": "done", "language"} / {"event": "error", "message"} / {"event": "cancelled"}
+    client -> {"op": "cancel"} at any point; the job stops but the model stays loaded.
+
+`{"op": "ping"}` and `{"op": "shutdown"}` are answered on their own connection. The worker
+exits by itself after `idle_timeout_sec` without jobs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fcntl
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from threading import Event, Lock, Thread
+
+from podcast_clip_factory.domain.models import TranscriptSegment
+from podcast_clip_factory.infrastructure.storage.artifact_store import (
+    segment_from_payload,
+    segment_to_payload,
+)
+from podcast_clip_factory.infrastructure.transcriber.streaming import SegmentStream
+
+Engine = Callable[[dict, Event], SegmentStream]
+
+
+class WorkerUnavailableError(RuntimeError):
+    """The resident worker could not be reached or started; callers transcribe in-process."""
+
+
+def default_socket_path() -> Path:
+    # AF_UNIX paths are limited to ~104 bytes, so stay out of the (possibly deep) project dir.
+    return Path(tempfile.gettempdir()) / f"pcf-transcribe-{os.getuid()}.sock"
+
+
+class TranscriptionWorkerClient:
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        idle_timeout_sec: float = 1800.0,
+        start_timeout_sec: float = 30.0,
+        autostart: bool = True,
+    ) -> None:
+        self.socket_path = socket_path or default_socket_path()
+        self.idle_timeout_sec = idle_timeout_sec
+        self.start_timeout_sec = start_timeout_sec
+        self.autostart = autostart
+        self._start_lock = Lock()
+
+    def ping(self) -> dict | None:
+        try:
+            with self._connect() as conn:
+                _send(conn, {"op": "ping"})
+                return next(event for event in _read_events(conn, timeout=5.0) if event is not None)
+        except (OSError, StopIteration, ValueError):
+            return None
+
+    def shutdown(self) -> bool:
+        try:
+            with self._connect() as conn:
+                _send(conn, {"op": "shutdown"})
+            return True
+        except OSError:
+            return False
+
+    def ensure_started(self) -> None:
+        if self.ping() is not None:
+            return
+        if not self.autostart:
+            raise WorkerUnavailableError(f"transcription worker is not running: {self.socket_path}")
+        with self._start_lock:
+            if self.ping() is not None:
+                return
+            src_root = str(Path(__file__).resolve().parents[3])
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join(
+                p for p in (src_root, env.get("PYTHONPATH", "")) if p
+            )
+            log_path = self.socket_path.with_suffix(".log")
+            with log_path.open("ab") as log:
+                subprocess.Popen(
+                    [
+                        sys.executable,
+                        "-m",
+                        "podcast_clip_factory.infrastructure.transcriber.worker",
+                        "--socket",
+                        str(self.socket_path),
+                        "--idle-timeout",
+                        str(self.idle_timeout_sec),
+                    ],
+                    stdin=subprocess.DEVNULL,
+                    stdout=log,
+                    stderr=log,
+                    env=env,
+                    start_new_session=True,
+                )
+            deadline = time.monotonic() + self.start_timeout_sec
+            while time.monotonic() < deadline:
+                if self.ping() is not None:
+                    return
+                time.sleep(0.1)
+        raise WorkerUnavailableError(f"transcription worker did not start (log: {log_path})")
+
+    def transcribe_stream(
+        self,
+        engine: str,
+        model: str,
+        audio_path: Path,
+        word_timestamps: bool = True,
+        cancel_event=None,
+        options: dict | None = None,
+    ) -> SegmentStream:
+        """Submit a job; raises WorkerUnavailableError before anything was sent."""
+        try:
+            self.ensure_started()
+            conn = self._connect()
+        except OSError as exc:
+            raise WorkerUnavailableError(str(exc)) from exc
+        _send(
+            conn,
+            {
+                "op": "transcribe",
+                "engine": engine,
+                "model": model,
+                "audio_path": str(Path(audio_path).resolve()),
+                "word_timestamps": word_timestamps,
+                "options": options or {},
+            },
+        )
+        stream = SegmentStream()
+        return stream.bind(self._iter_job(conn, stream, cancel_event))
+
+    def _iter_job(
+        self, conn: socket.socket, stream: SegmentStream, cancel_event
+    ) -> Iterator[TranscriptSegment]:
+        finished = False
+        try:
+            for event in _read_events(conn, timeout=0.5):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise RuntimeError("transcription cancelled")
+                if event is None:
+                    continue
+                kind = event.get("event")
+                if kind == "segment":
+                    stream.language = str(event.get("language") or stream.language)
+                    yield segment_from_payload(event["segment"])
+                elif kind == "done":
+                    stream.language = str(event.get("language") or stream.language)
+                    finished = True
+                    return
+                elif kind == "cancelled":
+                    raise RuntimeError("transcription cancelled")
+                else:
+                    message = event.get("message", event)
+                    raise RuntimeError(f"transcription worker failed: {message}")
+            raise RuntimeError("transcription worker closed the connection")
+        finally:
+            if not finished:
+                try:
+                    _send(conn, {"op": "cancel"})
+                except OSError:
+                    pass
+            conn.close()
+
+    def _connect(self) -> socket.socket:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.connect(str(self.socket_path))
+        except OSError:
+            conn.close()
+            raise
+        return conn
+
+
+class TranscriptionWorkerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: Path,
+        idle_timeout_sec: float = 1800.0,
+        engines: dict[str, Engine] | None = None,
+    ) -> None:
+        self.socket_path = socket_path
+        self.idle_timeout_sec = idle_timeout_sec
+        self.engines = engines if engines is not None else default_engines()
+        # Jobs run one at a time: the loaded model is the shared resource.
+        self.job_lock = Lock()
+        self.last_activity = time.monotonic()
+        self.active_jobs = 0
+        self._state_lock = Lock()
+        # The sidecar lock marks the live owner; only then is a leftover socket file stale.
+        self._owner_lock = _acquire_owner_lock(socket_path)
+        try:
+            socket_path.unlink(missing_ok=True)
+            super().__init__(str(socket_path), _WorkerHandler)
+        except BaseException:
+            self._owner_lock.close()
+            raise
+
+    def touch(self, delta: int = 0) -> None:
+        with self._state_lock:
+            self.active_jobs += delta
+            self.last_activity = time.monotonic()
+
+    def serve(self) -> None:
+        Thread(target=self._idle_watch, daemon=True).start()
+        try:
+            self.serve_forever(poll_interval=0.2)
+        finally:
+            self.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            self._owner_lock.close()
+
+    def _idle_watch(self) -> None:
+        while True:
+            time.sleep(1.0)
+            with self._state_lock:
+                idle_for = time.monotonic() - self.last_activity
+                idle = self.active_jobs == 0 and idle_for > self.idle_timeout_sec
+            if self.idle_timeout_sec > 0 and idle:
+                self.shutdown()
+                return
+
+
+class _WorkerHandler(socketserver.StreamRequestHandler):
+    server: TranscriptionWorkerServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        request = json.loads(line)
+        op = request.get("op")
+        if op == "ping":
+            engines = sorted(self.server.engines)
+            self._reply({"event": "pong", "pid": os.getpid(), "engines": engines})
+        elif op == "shutdown":
+            Thread(target=self.server.shutdown, daemon=True).start()
+        elif op == "transcribe":
+            self._transcribe(request)
+
+    def _transcribe(self, request: dict) -> None:
+        cancel_event = Event()
+        done = Event()
+        write_lock = Lock()
+        self.server.touch(+1)
+
+        def watch_client() -> None:
+            # Any further message (or EOF) from the client means "stop this job".
+            try:
+                self.rfile.readline()
+            except (OSError, ValueError):
+                pass
+            cancel_event.set()
+
+        def emit(payload: dict) -> None:
+            with write_lock:
+                if not cancel_event.is_set():
+                    self._reply(payload)
+
+        def run() -> None:
+            try:
+                with self.server.job_lock:
+                    engine = self.server.engines.get(str(request.get("engine")))
+                    if engine is None:
+                        raise RuntimeError(f"unknown engine: {request.get('engine')}")
+                    stream = engine(request, cancel_event)
+                    for segment in stream:
+                        if cancel_event.is_set():
+                            break
+                        emit(
+                            {
+                                "event": "segment",
+                                "segment": segment_to_payload(segment),
+                                "language": stream.language,
+                            }
+                        )
+                    stream.close()
+                    emit({"event": "done", "language": stream.language})
+            except Exception as exc:
+                emit({"event": "error", "message": str(exc)})
+            finally:
+                self.server.touch(-1)
+                done.set()
+
+        Thread(target=watch_client, daemon=True).start()
+        # The job thread may outlive a cancelled connection (mlx cannot stop mid-call);
+        # it keeps holding job_lock, so the next job simply waits for the model.
+        Thread(target=run, daemon=True).start()
+        while not done.wait(0.2):
+            if cancel_event.is_set():
+                with write_lock:
+                    try:
+                        self._reply({"event": "cancelled"})
+                    except OSError:
+                        pass
+                return
+
+    def _reply(self, payload: dict) -> None:
+        self.wfile.write((json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+
+def _acquire_owner_lock(socket_path: Path):
+    """Exclusive flock on `<socket>.lock`; raises if another worker owns the socket."""
+    lock_file = socket_path.with_suffix(".lock").open("a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError as exc:
+        lock_file.close()
+        raise WorkerUnavailableError(
+            f"another transcription worker owns {socket_path}"
+        ) from exc
+    return lock_file
+
+
+def default_engines() -> dict[str, Engine]:
+    # Only the most recent faster-whisper model stays resident; switching models frees the old one.
+    faster_models: dict[tuple, object] = {}
+
+    def faster_whisper(request: dict, cancel_event: Event) -> SegmentStream:
+        from podcast_clip_factory.infrastructure.transcriber.faster_whisper import (
+            FasterWhisperOptions,
+            _iter_segments,
+            _load_model,
+        )
+
+        options = FasterWhisperOptions(**(request.get("options") or {}))
+        # Loaded once per model + load settings; beam/batch sizes are per-call decode args.
+        key = (
+            str(request["model"]),
+            options.compute_type,
+            options.cpu_threads,
+            options.num_workers,
+            options.batch_size > 0,
+        )
+        if key not in faster_models:
+            faster_models.clear()
+            faster_models[key] = _load_model(str(request["model"]), options)
+        stream = SegmentStream()
+        return stream.bind(
+            _iter_segments(
+                faster_models[key],
+                str(request["audio_path"]),
+                bool(request.get("word_timestamps", True)),
+                stream,
+                cancel_event,
+                options,
+            )
+        )
+
+    def mlx_whisper(request: dict, cancel_event: Event) -> SegmentStream:
+        # mlx_whisper keeps the last loaded model in-process (ModelHolder), so a warm
+        # worker skips the load; a single call cannot be interrupted.
+        from mlx_whisper import transcribe
+
+        from podcast_clip_factory.infrastructure.transcriber.mlx_whisper import (
+            transcript_from_mlx_result,
+        )
+
+        result = transcribe(
+            str(request["audio_path"]),
+            path_or_hf_repo=str(request["model"]),
+            word_timestamps=bool(request.get("word_timestamps", True)),
+        )
+        transcript = transcript_from_mlx_result(result)
+        stream = SegmentStream()
+        stream.language = transcript.language
+        return stream.bind(iter(transcript.segments))
+
+    return {"faster_whisper": faster_whisper, "mlx_whisper": mlx_whisper}
+
+
+def _send(conn: socket.socket, payload: dict) -> None:
+    conn.sendall((json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8"))
+
+
+def _read_events(conn: socket.socket, timeout: float | None) -> Iterator[dict | None]:
+    """Decoded events; yields None whenever `timeout` passes without a complete line.
+
+    Reads raw bytes: a socket file object becomes unusable after its first timeout.
+    """
+    conn.settimeout(timeout)
+    buffer = b""
+    while True:
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            if line.strip():
+                yield json.loads(line)
+        try:
+            chunk = conn.recv(65536)
+        except (socket.timeout, TimeoutError):
+            yield None
+            continue
+        if not chunk:
+            return
+        buffer += chunk
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Resident transcription worker")
+    parser.add_argument("--socket", default=str(default_socket_path()))
+    parser.add_argument("--idle-timeout", type=float, default=1800.0)
+    args = parser.parse_args()
+    socket_path = Path(args.socket)
+    if TranscriptionWorkerClient(socket_path, autostart=False).ping() is not None:
+        return  # another worker already owns this socket
+    try:
+        server = TranscriptionWorkerServer(socket_path, idle_timeout_sec=args.idle_timeout)
+    except WorkerUnavailableError:
+        return  # lost the start race to another worker
+    server.serve()
+
+
+if __name__ == "__main__":
+    main()
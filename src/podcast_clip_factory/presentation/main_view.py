@@ -63,7 +63,9 @@ class MainView(ft.Column):
             min_lines=4,
             max_lines=6,
         )
-        self.review_view = ReviewView()
+        self.review_view = ReviewView(
+            overlay_image_provider=self.orchestrator.overlay_preview_image
+        )
         self.result_view = ResultView()
         self.open_output_button = ft.OutlinedButton(
             "出力フォルダを開く",
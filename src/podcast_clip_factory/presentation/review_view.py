@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from pathlib import Path
+
 import flet as ft
 
 from podcast_clip_factory.domain.models import ImpactOverlayStyle, ReviewDecision, TitleOverlayStyle
 
+# overlay_image_provider(kind, text, style) -> cached PNG strip ("title"/"impact") or None.
+OverlayImageProvider = Callable[[str, str, TitleOverlayStyle | ImpactOverlayStyle], Path | None]
+
 
 class ReviewView(ft.Column):
-    def __init__(self) -> None:
+    def __init__(self, overlay_image_provider: OverlayImageProvider | None = None) -> None:
+        self.overlay_image_provider = overlay_image_provider
         self.canvas_width = 1080
         self.canvas_height = 1920
         self.center_height = 608
@@ -62,6 +69,13 @@ class ReviewView(ft.Column):
             bgcolor=ft.Colors.with_opacity(0.55, ft.Colors.BLACK),
             content=self.preview_impact_text,
         )
+        # Exact-pixel strips from the render overlay cache; the text boxes above are the fallback.
+        self.preview_title_image = ft.Image(
+            left=0, top=0, width=self.preview_width, fit=ft.ImageFit.FILL, visible=False
+        )
+        self.preview_impact_image = ft.Image(
+            left=0, top=0, width=self.preview_width, fit=ft.ImageFit.FILL, visible=False
+        )
         self.preview_stack = ft.Stack(
             controls=[
                 ft.Container(
@@ -78,6 +92,8 @@ class ReviewView(ft.Column):
                 ),
                 self.preview_title_box,
                 self.preview_impact_box,
+                self.preview_title_image,
+                self.preview_impact_image,
             ],
             width=self.preview_width,
             height=self.preview_height,
@@ -288,6 +304,7 @@ class ReviewView(ft.Column):
             ft.Colors.with_opacity(0.55, ft.Colors.BLACK) if bool(self.impact_bg_checkbox.value) else None
         )
         self.preview_impact_box.padding = 8 if bool(self.impact_bg_checkbox.value) else 0
+        self._sync_preview_images()
 
         try:
             self.preview_stack.update()
@@ -298,6 +315,34 @@ class ReviewView(ft.Column):
         except Exception:
             return
 
+    def _sync_preview_images(self) -> None:
+        pairs = (
+            (
+                "title",
+                self.preview_title_text,
+                self.collect_title_style(),
+                self.preview_title_box,
+                self.preview_title_image,
+            ),
+            (
+                "impact",
+                self.preview_impact_text,
+                self.collect_impact_style(),
+                self.preview_impact_box,
+                self.preview_impact_image,
+            ),
+        )
+        for kind, text, style, box, image in pairs:
+            path = None
+            if self.overlay_image_provider is not None:
+                path = self.overlay_image_provider(kind, str(text.value or ""), style)
+            image.visible = path is not None
+            box.visible = path is None
+            if path is not None:
+                padding = style.background_padding if style.background else 0
+                image.src = str(path)
+                image.top = int((style.y - padding) * self.preview_scale)
+
     def _clamp_title_y(self, y: int, font_size: int) -> int:
         min_y = self.safe_margin
         max_y = max(min_y, self.center_top - font_size - self.safe_margin)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 import tomllib
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 
@@ -22,9 +22,16 @@ class AppConfig:
     silence_merge_gap_sec: float = 0.25
     silence_min_segment_sec: float = 0.18
     silence_min_cut_total_sec: float = 0.8
-    silence_max_segments: int = 24
+    silence_max_segments: int = 0
     silence_detect_noise_db: float = -35.0
     silence_detect_min_sec: float = 0.35
+    render_cache_max_gb: float = 20.0
+    base_layer_cache_max_gb: float = 20.0
+    render_batch_max_clips: int = 1
+    render_batch_max_gap_sec: float = 30.0
+    render_batch_max_span_sec: float = 300.0
+    render_memory_per_job_mb: int = 1200
+    validation_parallelism: int = 4
 
 
 @dataclass(slots=True)
@@ -34,6 +41,20 @@ class TranscribeConfig:
     word_timestamps: bool
     mlx_model: str
     faster_model: str
+    stream_audio: bool = False
+    persist_audio_wav: bool = True
+    cache_max_gb: float = 2.0
+    chunk_minutes: float = 0.0
+    chunk_workers: int = 0
+    chunk_cpu_threads: int = 4
+    resident_worker: bool = False
+    worker_socket: str = ""
+    worker_idle_minutes: float = 30.0
+    faster_compute_type: str = "int8"
+    faster_cpu_threads: int = 0
+    faster_num_workers: int = 1
+    faster_batch_size: int = 0
+    faster_beam_size: int = 5
 
 
 @dataclass(slots=True)
@@ -58,6 +79,41 @@ class RenderConfig:
     video_codec: str
     audio_codec: str
     audio_bitrate: str
+    keyframe_seek: bool = True
+    video_codec_priority: list[str] = field(default_factory=list)
+    background_mode: str = "gblur"
+    background_downscale: int = 8
+    preset: str = ""
+    overlay_scale: float = 1.0
+    preview_enabled: bool = True
+    preview_scale: float = 0.5
+    preview_preset: str = "ultrafast"
+    preview_audio_bitrate: str = "96k"
+    text_overlay_images: bool = True
+
+    def codec_candidates(self) -> list[str]:
+        ordered = self.video_codec_priority or [self.video_codec, "libx264"]
+        return list(dict.fromkeys(c for c in ordered if c))
+
+    def preview_config(self) -> RenderConfig:
+        """Reduced-size, fast-preset variant used for review renders."""
+        scale = max(0.1, min(1.0, float(self.preview_scale)))
+
+        def _even(value: int) -> int:
+            return max(2, int(round(value * scale / 2)) * 2)
+
+        return replace(
+            self,
+            video_width=_even(self.video_width),
+            video_height=_even(self.video_height),
+            center_width=_even(self.center_width),
+            center_height=_even(self.center_height),
+            background_blur_sigma=max(1, int(round(self.background_blur_sigma * scale))),
+            audio_bitrate=self.preview_audio_bitrate,
+            preset=self.preview_preset,
+            overlay_scale=self.overlay_scale * scale,
+            preview_enabled=False,
+        )
 
 
 @dataclass(slots=True)
@@ -69,6 +125,7 @@ class SubtitleConfig:
     primary_color: str
     outline_color: str
     bottom_margin: int
+    karaoke: bool = False
 
 
 @dataclass(slots=True)
@@ -99,7 +156,7 @@ def load_settings(root_dir: Path) -> Settings:
             clip_min_sec=int(app["clip_min_sec"]),
             clip_max_sec=int(app["clip_max_sec"]),
             title_max_chars=int(app["title_max_chars"]),
-            render_parallelism=max(1, int(app["render_parallelism"])),
+            render_parallelism=max(0, int(app["render_parallelism"])),
             manual_start_only=bool(app["manual_start_only"]),
             max_render_retries=int(app["max_render_retries"]),
             default_media_dir=str(
@@ -110,9 +167,16 @@ def load_settings(root_dir: Path) -> Settings:
             silence_merge_gap_sec=float(app.get("silence_merge_gap_sec", 0.25)),
             silence_min_segment_sec=float(app.get("silence_min_segment_sec", 0.18)),
             silence_min_cut_total_sec=float(app.get("silence_min_cut_total_sec", 0.8)),
-            silence_max_segments=max(1, int(app.get("silence_max_segments", 24))),
+            silence_max_segments=max(0, int(app.get("silence_max_segments", 0))),
             silence_detect_noise_db=float(app.get("silence_detect_noise_db", -35.0)),
             silence_detect_min_sec=float(app.get("silence_detect_min_sec", 0.35)),
+            render_cache_max_gb=float(app.get("render_cache_max_gb", 20.0)),
+            base_layer_cache_max_gb=float(app.get("base_layer_cache_max_gb", 20.0)),
+            render_batch_max_clips=max(1, int(app.get("render_batch_max_clips", 1))),
+            render_batch_max_gap_sec=float(app.get("render_batch_max_gap_sec", 30.0)),
+            render_batch_max_span_sec=float(app.get("render_batch_max_span_sec", 300.0)),
+            render_memory_per_job_mb=max(1, int(app.get("render_memory_per_job_mb", 1200))),
+            validation_parallelism=max(0, int(app.get("validation_parallelism", 4))),
         ),
         transcribe=TranscribeConfig(
             primary=str(trans["primary"]),
@@ -120,6 +184,20 @@ def load_settings(root_dir: Path) -> Settings:
             word_timestamps=bool(trans["word_timestamps"]),
             mlx_model=os.getenv("MLX_WHISPER_MODEL", "mlx-community/whisper-large-v3-turbo"),
             faster_model=os.getenv("FASTER_WHISPER_MODEL", "small"),
+            stream_audio=bool(trans.get("stream_audio", False)),
+            persist_audio_wav=bool(trans.get("persist_audio_wav", True)),
+            cache_max_gb=float(trans.get("cache_max_gb", 2.0)),
+            chunk_minutes=max(0.0, float(trans.get("chunk_minutes", 0.0))),
+            chunk_workers=max(0, int(trans.get("chunk_workers", 0))),
+            chunk_cpu_threads=max(1, int(trans.get("chunk_cpu_threads", 4))),
+            resident_worker=bool(trans.get("resident_worker", False)),
+            worker_socket=str(trans.get("worker_socket", "")),
+            worker_idle_minutes=max(0.0, float(trans.get("worker_idle_minutes", 30.0))),
+            faster_compute_type=str(trans.get("faster_compute_type", "int8")),
+            faster_cpu_threads=max(0, int(trans.get("faster_cpu_threads", 0))),
+            faster_num_workers=max(1, int(trans.get("faster_num_workers", 1))),
+            faster_batch_size=max(0, int(trans.get("faster_batch_size", 0))),
+            faster_beam_size=max(1, int(trans.get("faster_beam_size", 5))),
         ),
         llm=LLMConfig(
             primary=str(llm["primary"]),
@@ -140,6 +218,16 @@ def load_settings(root_dir: Path) -> Settings:
             video_codec=str(render["video_codec"]),
             audio_codec=str(render["audio_codec"]),
             audio_bitrate=str(render["audio_bitrate"]),
+            keyframe_seek=bool(render.get("keyframe_seek", True)),
+            video_codec_priority=[str(c) for c in render.get("video_codec_priority", [])],
+            background_mode=str(render.get("background_mode", "gblur")),
+            background_downscale=max(1, int(render.get("background_downscale", 8))),
+            preset=str(render.get("preset", "")),
+            preview_enabled=bool(render.get("preview_enabled", True)),
+            preview_scale=float(render.get("preview_scale", 0.5)),
+            preview_preset=str(render.get("preview_preset", "ultrafast")),
+            preview_audio_bitrate=str(render.get("preview_audio_bitrate", "96k")),
+            text_overlay_images=bool(render.get("text_overlay_images", True)),
         ),
         subtitle=SubtitleConfig(
             enable_subtitles=bool(subtitle.get("enable_subtitles", False)),
@@ -149,6 +237,7 @@ def load_settings(root_dir: Path) -> Settings:
             primary_color=str(subtitle["primary_color"]),
             outline_color=str(subtitle["outline_color"]),
             bottom_margin=int(subtitle["bottom_margin"]),
+            karaoke=bool(subtitle.get("karaoke", False)),
         ),
         root_dir=root_dir,
     )
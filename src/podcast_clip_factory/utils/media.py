@@ -1,46 +1,128 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import mmap
+import re
+import struct
 import subprocess
-import time
+import threading
+import wave
+from collections import deque
+from collections.abc import Callable
 from pathlib import Path
 
 from podcast_clip_factory.domain.models import MediaInfo
 
 
 class CommandError(RuntimeError):
-    pass
+    def __init__(self, message: str, returncode: int | None = None, stderr: str = "") -> None:
+        super().__init__(message)
+        self.returncode = returncode
+        self.stderr = stderr
 
 
-def run_command(cmd: list[str], cancel_event=None) -> None:
-    if cancel_event is None:
-        proc = subprocess.run(cmd, capture_output=True, text=True)
-        if proc.returncode != 0:
-            raise CommandError(f"Command failed: {' '.join(cmd)}\n{proc.stderr}")
-        return
+def run_command(
+    cmd: list[str],
+    cancel_event=None,
+    on_progress: Callable[[float], None] | None = None,
+    progress_duration_sec: float = 0.0,
+    stderr_tail_lines: int = 200,
+    on_stderr_line: Callable[[str], None] | None = None,
+) -> None:
+    """Run a command, reacting to exit and cancellation as events instead of polling.
 
-    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    try:
-        while True:
-            if cancel_event.is_set():
+    stdout is parsed as ffmpeg `-progress` key=value output when `on_progress` is given
+    (see `with_progress`); stderr is kept only as a bounded tail for error messages, and
+    streamed line by line to `on_stderr_line` for callers that parse ffmpeg's log.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+    stderr_tail: deque[str] = deque(maxlen=max(1, stderr_tail_lines))
+    finished = threading.Event()
+    cancelled = threading.Event()
+
+    def read_stderr() -> None:
+        for line in proc.stderr:
+            line = line.rstrip("\n")
+            stderr_tail.append(line)
+            if on_stderr_line is not None:
+                on_stderr_line(line)
+
+    def read_stdout() -> None:
+        for line in proc.stdout:
+            if on_progress is None:
+                continue
+            key, _, value = line.strip().partition("=")
+            fraction = _progress_fraction(key, value, progress_duration_sec)
+            if fraction is not None:
+                on_progress(fraction)
+
+    def watch_cancel() -> None:
+        while not finished.is_set():
+            if cancel_event.wait(0.05):
+                cancelled.set()
                 proc.terminate()
                 try:
                     proc.wait(timeout=3)
                 except subprocess.TimeoutExpired:
                     proc.kill()
-                raise CommandError(f"Command cancelled: {' '.join(cmd)}")
-
-            ret = proc.poll()
-            if ret is not None:
-                break
-            time.sleep(0.2)
+                return
 
-        stdout, stderr = proc.communicate()
-        if ret != 0:
-            raise CommandError(f"Command failed: {' '.join(cmd)}\n{stderr}")
+    workers = [
+        threading.Thread(target=read_stderr, daemon=True),
+        threading.Thread(target=read_stdout, daemon=True),
+    ]
+    if cancel_event is not None:
+        workers.append(threading.Thread(target=watch_cancel, daemon=True))
+    for worker in workers:
+        worker.start()
+    try:
+        ret = proc.wait()
     finally:
+        finished.set()
         if proc.poll() is None:
             proc.kill()
+        for worker in workers:
+            worker.join(timeout=5)
+
+    if cancelled.is_set():
+        raise CommandError(f"Command cancelled: {' '.join(cmd)}")
+    if ret != 0:
+        stderr = "\n".join(stderr_tail)
+        raise CommandError(
+            f"Command failed: {' '.join(cmd)}\n{stderr}",
+            returncode=ret,
+            stderr=stderr,
+        )
+
+
+def with_progress(cmd: list[str]) -> list[str]:
+    """Ask ffmpeg to write machine-readable progress to stdout."""
+    if not cmd or Path(cmd[0]).name != "ffmpeg" or "-progress" in cmd:
+        return cmd
+    return [cmd[0], "-progress", "pipe:1", "-nostats", *cmd[1:]]
+
+
+def _progress_fraction(key: str, value: str, duration_sec: float) -> float | None:
+    if key == "progress" and value == "end":
+        return 1.0
+    if duration_sec <= 0:
+        return None
+    # out_time_ms is reported in microseconds as well (historical ffmpeg naming).
+    if key in ("out_time_us", "out_time_ms"):
+        try:
+            seconds = int(value) / 1_000_000
+        except ValueError:
+            return None
+        return max(0.0, min(1.0, seconds / duration_sec))
+    return None
 
 
 def ffprobe_media(input_path: Path) -> MediaInfo:
@@ -48,12 +130,13 @@ def ffprobe_media(input_path: Path) -> MediaInfo:
         "ffprobe",
         "-v",
         "error",
-        "-select_streams",
-        "v:0",
         "-show_entries",
-        "stream=width,height,r_frame_rate",
+        (
+            "stream=index,codec_type,codec_name,width,height,r_frame_rate,"
+            "channels,channel_layout,sample_rate:stream_tags=rotate:stream_side_data=rotation"
+        ),
         "-show_entries",
-        "format=duration",
+        "format=duration,bit_rate",
         "-of",
         "json",
         str(input_path),
@@ -63,19 +146,175 @@ def ffprobe_media(input_path: Path) -> MediaInfo:
         raise CommandError(proc.stderr)
 
     payload = json.loads(proc.stdout)
-    stream = payload["streams"][0]
-    duration_sec = float(payload["format"].get("duration", 0.0))
+    streams = payload.get("streams", [])
+    video_streams = [s for s in streams if s.get("codec_type") == "video"]
+    audio_streams = [s for s in streams if s.get("codec_type") == "audio"]
+    if not video_streams:
+        raise CommandError(f"No video stream found: {input_path}")
+    stream = video_streams[0]
+    audio = audio_streams[0] if audio_streams else {}
+    fmt = payload.get("format", {})
+    duration_sec = float(fmt.get("duration", 0.0))
     frame_rate = stream.get("r_frame_rate", "30/1")
     num, den = frame_rate.split("/")
-    fps = float(num) / float(den)
+    fps = float(num) / float(den) if float(den) else 0.0
     return MediaInfo(
         duration_sec=duration_sec,
         width=int(stream["width"]),
         height=int(stream["height"]),
         fps=fps,
+        video_codec=str(stream.get("codec_name", "")),
+        audio_codec=str(audio.get("codec_name", "")),
+        audio_stream_count=len(audio_streams),
+        audio_channels=int(audio.get("channels", 0) or 0),
+        audio_channel_layout=str(audio.get("channel_layout", "")),
+        audio_sample_rate=int(audio.get("sample_rate", 0) or 0),
+        bit_rate=int(fmt.get("bit_rate", 0) or 0),
+        keyframe_interval_sec=_probe_keyframe_interval(input_path),
+        rotation=_stream_rotation(stream),
     )
 
 
+def probe_output_streams(path: Path) -> tuple[float, set[str]]:
+    """Container duration and the set of stream types (video/audio/...) of a rendered file."""
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "stream=codec_type:format=duration",
+        "-of",
+        "json",
+        str(path),
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    if proc.returncode != 0:
+        raise CommandError(proc.stderr, returncode=proc.returncode, stderr=proc.stderr)
+    payload = json.loads(proc.stdout or "{}")
+    duration = float(payload.get("format", {}).get("duration", 0.0) or 0.0)
+    kinds = {str(stream.get("codec_type")) for stream in payload.get("streams", [])}
+    return duration, kinds
+
+
+def mp4_moov_before_mdat(path: Path) -> bool:
+    """True if the top-level `moov` box precedes `mdat` (i.e. the file was faststarted)."""
+    total = path.stat().st_size
+    offset = 0
+    with path.open("rb") as fh:
+        while offset + 8 <= total:
+            fh.seek(offset)
+            size, kind = struct.unpack(">I4s", fh.read(8))
+            if size == 1:
+                size = struct.unpack(">Q", fh.read(8))[0]
+            elif size == 0:
+                size = total - offset
+            if kind == b"moov":
+                return True
+            if kind == b"mdat" or size < 8:
+                return False
+            offset += size
+    return False
+
+
+def verify_rendered_output(
+    path: Path,
+    expected_duration_sec: float,
+    tolerance_sec: float = 0.5,
+    expect_audio: bool = False,
+) -> bool:
+    """Cheap container-level check that a rendered clip is complete and playable."""
+    if not path.is_file() or path.stat().st_size == 0:
+        return False
+    try:
+        duration, kinds = probe_output_streams(path)
+    except (OSError, subprocess.TimeoutExpired, ValueError, CommandError):
+        return False
+    if "video" not in kinds or (expect_audio and "audio" not in kinds):
+        return False
+    # Same faststart rule as the review validator, so a resume never reuses a clip it rejects.
+    if path.suffix.lower() == ".mp4" and not mp4_moov_before_mdat(path):
+        return False
+    tolerance = max(tolerance_sec, expected_duration_sec * 0.02)
+    return abs(duration - expected_duration_sec) <= tolerance
+
+
+def _stream_rotation(stream: dict) -> int:
+    rotate = (stream.get("tags") or {}).get("rotate")
+    if rotate is not None:
+        return int(float(rotate)) % 360
+    for side_data in stream.get("side_data_list") or []:
+        if "rotation" in side_data:
+            return int(float(side_data["rotation"])) % 360
+    return 0
+
+
+def _probe_keyframe_interval(input_path: Path, window_sec: float = 60.0) -> float:
+    """Estimate the GOP length from keyframe packets in the first window_sec seconds."""
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-read_intervals",
+        f"%+{window_sec:.0f}",
+        "-show_entries",
+        "packet=pts_time,flags",
+        "-of",
+        "csv=print_section=0",
+        str(input_path),
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        return 0.0
+    keyframes: list[float] = []
+    for line in proc.stdout.splitlines():
+        parts = line.strip().split(",")
+        if len(parts) < 2 or "K" not in parts[1]:
+            continue
+        try:
+            keyframes.append(float(parts[0]))
+        except ValueError:
+            continue
+    keyframes.sort()
+    if len(keyframes) < 2:
+        return 0.0
+    return (keyframes[-1] - keyframes[0]) / (len(keyframes) - 1)
+
+
+def probe_keyframes(input_path: Path) -> list[float]:
+    """List every video keyframe time from packet flags (no decoding)."""
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "packet=pts_time,flags",
+        "-show_entries",
+        "format=start_time",
+        "-of",
+        "json",
+        str(input_path),
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise CommandError(proc.stderr)
+
+    payload = json.loads(proc.stdout)
+    start_time = float(payload.get("format", {}).get("start_time", 0.0) or 0.0)
+    keyframes: list[float] = []
+    for packet in payload.get("packets", []):
+        if "K" not in str(packet.get("flags", "")):
+            continue
+        pts_time = packet.get("pts_time")
+        if pts_time in (None, "N/A"):
+            continue
+        keyframes.append(max(0.0, float(pts_time) - start_time))
+    return keyframes
+
+
 def extract_audio(input_video: Path, output_wav: Path, cancel_event=None) -> None:
     cmd = [
         "ffmpeg",
@@ -92,3 +331,198 @@ def extract_audio(input_video: Path, output_wav: Path, cancel_event=None) -> Non
         str(output_wav),
     ]
     run_command(cmd, cancel_event=cancel_event)
+
+
+def detect_silence(
+    audio_path: Path,
+    noise_db: float,
+    min_silence_sec: float,
+    cancel_event=None,
+) -> tuple[list[tuple[float, float]], float]:
+    """Run a single silencedetect pass over the whole file.
+
+    Returns (silence intervals in absolute seconds, analysed duration).
+    """
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-nostats",
+        "-i",
+        str(audio_path),
+        "-vn",
+        "-af",
+        f"silencedetect=noise={noise_db:.1f}dB:d={min_silence_sec:.2f}",
+        "-f",
+        "null",
+        "-",
+    ]
+    # Only the Duration header and silencedetect lines are needed from the (long) log.
+    lines: list[str] = []
+    run_command(
+        cmd,
+        cancel_event=cancel_event,
+        on_stderr_line=lambda line: (
+            lines.append(line) if "silence_" in line or "Duration:" in line else None
+        ),
+    )
+
+    text = "\n".join(lines)
+    duration = 0.0
+    duration_match = re.search(r"Duration:\s*(\d+):(\d+):([0-9.]+)", text)
+    if duration_match:
+        hours, mins, secs = duration_match.groups()
+        duration = int(hours) * 3600 + int(mins) * 60 + float(secs)
+    return parse_silencedetect(text, duration), duration
+
+
+def parse_silencedetect(text: str, duration: float) -> list[tuple[float, float]]:
+    silences: list[tuple[float, float]] = []
+    current_start: float | None = None
+    for line in text.splitlines():
+        start_match = re.search(r"silence_start:\s*(-?[0-9.]+)", line)
+        if start_match:
+            current_start = max(0.0, float(start_match.group(1)))
+            continue
+        end_match = re.search(r"silence_end:\s*([0-9.]+)", line)
+        if end_match and current_start is not None:
+            end_val = float(end_match.group(1))
+            if duration > 0:
+                end_val = min(duration, end_val)
+            if end_val > current_start:
+                silences.append((current_start, end_val))
+            current_start = None
+    if current_start is not None and current_start < duration:
+        silences.append((current_start, duration))
+    return silences
+
+
+def stream_audio_pcm(
+    input_video: Path,
+    duration_hint_sec: float,
+    cancel_event=None,
+    audio_filter: str | None = None,
+    sample_rate: int = 16000,
+):
+    """Decode mono float32 PCM from ffmpeg's stdout straight into an anonymous memory map.
+
+    Returns (numpy float32 samples, ffmpeg stderr text). `audio_filter` runs inside the same
+    ffmpeg process, so analysis filters such as silencedetect cost no extra decode.
+    """
+    try:
+        import numpy as np
+    except ImportError as exc:  # pragma: no cover
+        raise RuntimeError("numpy is required for streaming audio") from exc
+
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-nostats",
+        "-i",
+        str(input_video),
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        str(sample_rate),
+    ]
+    if audio_filter:
+        cmd += ["-af", audio_filter]
+    cmd += ["-acodec", "pcm_f32le", "-f", "f32le", "pipe:1"]
+
+    capacity = int((max(1.0, duration_hint_sec) + 1.0) * sample_rate) * 4
+    buffer = mmap.mmap(-1, capacity)
+    overflow = bytearray()
+    written = 0
+    stderr_chunks: list[bytes] = []
+
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_chunks.append(proc.stderr.read()),
+        daemon=True,
+    )
+    stderr_reader.start()
+    try:
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                proc.terminate()
+                try:
+                    proc.wait(timeout=3)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                raise CommandError(f"Command cancelled: {' '.join(cmd)}")
+            chunk = proc.stdout.read(1 << 20)
+            if not chunk:
+                break
+            take = min(capacity - written, len(chunk))
+            if take > 0:
+                buffer[written : written + take] = chunk[:take]
+                written += take
+            if take < len(chunk):
+                overflow.extend(chunk[take:])
+        ret = proc.wait()
+        stderr_reader.join(timeout=5)
+        stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+        if ret != 0:
+            raise CommandError(f"Command failed: {' '.join(cmd)}\n{stderr}")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+
+    samples = np.frombuffer(buffer, dtype=np.float32, count=written // 4)
+    if overflow:
+        tail = np.frombuffer(bytes(overflow), dtype=np.float32, count=len(overflow) // 4)
+        samples = np.concatenate([samples, tail])
+    return samples, stderr
+
+
+def _pcm16(samples) -> bytes:
+    """Float samples as little-endian s16, rounded and scaled like ffmpeg's flt->s16."""
+    import numpy as np
+
+    scaled = np.round(np.asarray(samples, dtype=np.float32) * 32768.0)
+    return np.clip(scaled, -32768, 32767).astype("<i2").tobytes()
+
+
+def write_wav(samples, output_wav: Path, sample_rate: int = 16000) -> None:
+    block = sample_rate * 60
+    tmp_path = output_wav.with_suffix(".wav.part")
+    with wave.open(str(tmp_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        for offset in range(0, len(samples), block):
+            wav.writeframes(_pcm16(samples[offset : offset + block]))
+    tmp_path.replace(output_wav)
+
+
+def audio_content_hash(audio_path: Path | None = None, samples=None) -> str:
+    """Digest of the 16-bit mono PCM payload (WAV header excluded).
+
+    In-memory float samples are quantized the way ffmpeg writes s16 (and `write_wav` stores
+    them), so a streamed run and a file-based run of the same audio share cache entries.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    if samples is not None:
+        block = 16000 * 60
+        for offset in range(0, len(samples), block):
+            digest.update(_pcm16(samples[offset : offset + block]))
+        return digest.hexdigest()
+    if audio_path is None:
+        raise ValueError("audio_path or samples is required")
+    with wave.open(str(audio_path), "rb") as wav:
+        while True:
+            frames = wav.readframes(1 << 20)
+            if not frames:
+                break
+            digest.update(frames)
+    return digest.hexdigest()
+
+
+def write_wav_async(samples, output_wav: Path, sample_rate: int = 16000) -> threading.Thread:
+    thread = threading.Thread(
+        target=write_wav,
+        args=(samples, output_wav, sample_rate),
+        daemon=True,
+    )
+    thread.start()
+    return thread
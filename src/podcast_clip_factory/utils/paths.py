@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import re
+import shutil
 from pathlib import Path
 
 
@@ -13,3 +15,22 @@ def sanitize_filename(name: str) -> str:
 def ensure_dir(path: Path) -> Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
+
+
+def file_fingerprint(path: Path) -> tuple[str, int, int, int] | None:
+    """(resolved path, size, mtime_ns, inode), or None when the file is missing."""
+    try:
+        resolved = path.expanduser().resolve()
+        stat = resolved.stat()
+    except OSError:
+        return None
+    return str(resolved), int(stat.st_size), int(stat.st_mtime_ns), int(stat.st_ino)
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, copying only when linking is impossible (e.g. across filesystems)."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
@@ -4,7 +4,8 @@ import time
 
 import pytest
 
-from podcast_clip_factory.utils.media import CommandError, run_command
+from podcast_clip_factory.utils import media
+from podcast_clip_factory.utils.media import CommandError, detect_silence, run_command
 
 
 def test_run_command_can_be_cancelled():
@@ -18,3 +19,52 @@ def test_run_command_can_be_cancelled():
 
     with pytest.raises(CommandError, match="cancelled"):
         run_command([sys.executable, "-c", "import time; time.sleep(5)"], cancel_event=cancel_event)
+
+
+def test_run_command_reports_ffmpeg_progress():
+    fractions = []
+    script = (
+        "print('frame=10'); print('out_time_us=500000'); "
+        "print('progress=continue'); print('progress=end')"
+    )
+
+    run_command(
+        [sys.executable, "-c", script],
+        on_progress=fractions.append,
+        progress_duration_sec=1.0,
+    )
+
+    assert fractions == [0.5, 1.0]
+
+
+def test_run_command_keeps_only_stderr_tail():
+    script = "import sys\nfor i in range(1000): print(f'line{i}', file=sys.stderr)\nsys.exit(3)"
+
+    with pytest.raises(CommandError) as exc_info:
+        run_command([sys.executable, "-c", script], stderr_tail_lines=5)
+
+    message = str(exc_info.value)
+    assert "line999" in message
+    assert "line994" not in message
+
+
+def test_detect_silence_streams_the_log_and_forwards_cancel(monkeypatch, tmp_path):
+    cancel_event = threading.Event()
+    seen = {}
+
+    def fake_run(cmd, cancel_event=None, on_stderr_line=None, **kwargs):
+        seen["cancel_event"] = cancel_event
+        on_stderr_line("  Duration: 01:00:00.00, start: 0.000000, bitrate: 256 kb/s")
+        # Far more log lines than the error tail keeps.
+        for i in range(1500):
+            on_stderr_line(f"[silencedetect @ 0x1] silence_start: {i * 2.0}")
+            on_stderr_line(f"[silencedetect @ 0x1] silence_end: {i * 2.0 + 0.5} | dur: 0.5")
+
+    monkeypatch.setattr(media, "run_command", fake_run)
+
+    intervals, duration = detect_silence(tmp_path / "a.wav", -35.0, 0.4, cancel_event=cancel_event)
+
+    assert seen["cancel_event"] is cancel_event
+    assert duration == 3600.0
+    assert len(intervals) == 1500
+    assert intervals[-1] == (2998.0, 2998.5)
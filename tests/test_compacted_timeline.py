@@ -0,0 +1,49 @@
+import random
+
+from podcast_clip_factory.domain.compacted_timeline import CompactedTimeline
+
+
+def _linear_map(seg_start, seg_end, intervals):
+    mapped = []
+    out_cursor = 0.0
+    for keep_start, keep_end in intervals:
+        overlap_start = max(seg_start, keep_start)
+        overlap_end = min(seg_end, keep_end)
+        if overlap_end > overlap_start:
+            mapped.append(
+                (out_cursor + overlap_start - keep_start, out_cursor + overlap_end - keep_start)
+            )
+        out_cursor += keep_end - keep_start
+    return mapped
+
+
+def test_map_range_matches_linear_walk():
+    rng = random.Random(3)
+    intervals = []
+    cursor = 0.0
+    for _ in range(80):
+        start = cursor + rng.uniform(0.1, 1.0)
+        cursor = start + rng.uniform(0.2, 3.0)
+        intervals.append((start, cursor))
+    timeline = CompactedTimeline(intervals)
+
+    for _ in range(300):
+        start = rng.uniform(0.0, cursor)
+        end = start + rng.uniform(0.0, 10.0)
+        expected = _linear_map(start, end, intervals)
+        actual = timeline.map_range(start, end)
+        assert len(actual) == len(expected)
+        for (a, b), (c, d) in zip(actual, expected, strict=True):
+            assert abs(a - c) < 1e-9 and abs(b - d) < 1e-9
+
+
+def test_map_time_snaps_cut_times_to_resume_point():
+    timeline = CompactedTimeline([(0.0, 5.0), (8.0, 12.0)])
+
+    assert timeline.duration == 9.0
+    assert timeline.map_time(3.0) == 3.0
+    assert timeline.map_time(6.5) == 5.0
+    assert timeline.map_time(9.0) == 6.0
+    assert timeline.map_time(30.0) == 9.0
+    assert not timeline.contains(6.5) and timeline.contains(8.0)
+    assert CompactedTimeline.for_clip(None, 30.0).map_time(12.5) == 12.5
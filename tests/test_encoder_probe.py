@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from podcast_clip_factory.infrastructure.render.encoder_probe import EncoderProbe
+
+
+class _Proc:
+    def __init__(self, code: int, stdout: str = "") -> None:
+        self.returncode = code
+        self.stdout = stdout
+        self.stderr = ""
+
+
+_ENCODERS = " V....D libx264              libx264 H.264 / AVC\n A....D aac  AAC\n"
+
+
+def _fake_ffmpeg(monkeypatch, calls):
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        if "-version" in cmd:
+            return _Proc(0, "ffmpeg version 7.1 Copyright (c)\n")
+        if "-encoders" in cmd:
+            return _Proc(0, _ENCODERS)
+        return _Proc(0 if cmd[cmd.index("-c:v") + 1] == "libx264" else 1)
+
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.encoder_probe.subprocess.run", fake_run
+    )
+
+
+def test_encoder_probe_skips_unavailable_encoder_and_caches(monkeypatch, tmp_path: Path):
+    calls = []
+    _fake_ffmpeg(monkeypatch, calls)
+    cache_path = tmp_path / "encoder_cache.json"
+
+    probe = EncoderProbe(cache_path)
+    assert probe.select(["h264_videotoolbox", "libx264"]) == "libx264"
+    test_encodes = [c for c in calls if "-c:v" in c]
+    assert [c[c.index("-c:v") + 1] for c in test_encodes] == ["libx264"]
+
+    calls.clear()
+    assert EncoderProbe(cache_path).select(["h264_videotoolbox", "libx264"]) == "libx264"
+    assert all("-c:v" not in c and "-encoders" not in c for c in calls)
+
+
+def test_failed_probe_is_retried_after_ttl(monkeypatch, tmp_path: Path):
+    calls = []
+    _fake_ffmpeg(monkeypatch, calls)
+    now = [1000.0]
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.encoder_probe.time.time", lambda: now[0]
+    )
+    cache_path = tmp_path / "encoder_cache.json"
+    EncoderProbe(cache_path, negative_ttl_sec=3600).select(["libx265", "libx264"])
+
+    calls.clear()
+    now[0] += 60
+    EncoderProbe(cache_path, negative_ttl_sec=3600).select(["libx265", "libx264"])
+    assert not any("-encoders" in c for c in calls)
+
+    now[0] += 3600
+    EncoderProbe(cache_path, negative_ttl_sec=3600).select(["libx265", "libx264"])
+    assert any("-encoders" in c for c in calls)
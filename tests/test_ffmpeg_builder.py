@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from podcast_clip_factory.domain.keyframe_index import KeyframeIndex
 from podcast_clip_factory.domain.models import ClipCandidate
 from podcast_clip_factory.infrastructure.render.ffmpeg_builder import FFmpegCommandBuilder
 from podcast_clip_factory.utils.config import RenderConfig
@@ -62,3 +63,98 @@ def test_ffmpeg_command_can_skip_subtitles():
     assert "-filter_complex" in cmd
     assert any("drawtext=" in token for token in cmd)
     assert not any("ass='" in token for token in cmd)
+
+
+def test_ffmpeg_command_seeks_to_keyframe_and_trims_preroll():
+    cfg = RenderConfig(1080, 1920, 1080, 608, 40, "h264_videotoolbox", "aac", "192k")
+    builder = FFmpegCommandBuilder(cfg)
+    candidate = ClipCandidate("c1", 12.5, 72.5, "タイトル", "h", "r", 0.8)
+    index = KeyframeIndex(times=[0.0, 4.0, 8.0, 12.0, 16.0])
+
+    keyframe = index.at_or_before(candidate.start_sec)
+    cmd = builder.build(
+        Path("in.mp4"), Path("out.mp4"), None, candidate, seek_keyframe_sec=keyframe
+    )
+
+    assert keyframe == 12.0
+    assert index.preroll(candidate.start_sec) == 0.5
+    assert cmd[cmd.index("-i") - 4 : cmd.index("-i")] == ["-ss", "12.000000", "-t", "60.500"]
+    assert cmd.count("-ss") == 1
+    assert cmd[cmd.index("-map") + 3] == "[srca]"
+
+    compacted = builder.build(
+        Path("in.mp4"),
+        Path("out.mp4"),
+        None,
+        candidate,
+        speech_intervals=[(0.0, 5.0), (7.0, 12.0)],
+        seek_keyframe_sec=keyframe,
+    )
+    graph = compacted[compacted.index("-filter_complex") + 1]
+    assert "gte(t,0.500000)*lt(t,5.500000)+gte(t,7.500000)*lt(t,12.500000)" in graph
+    assert compacted.count("-ss") == 1
+
+
+def test_downscale_background_blurs_at_reduced_size():
+    cfg = RenderConfig(
+        1080, 1920, 1080, 608, 40, "libx264", "aac", "192k", background_mode="downscale"
+    )
+    candidate = ClipCandidate("c1", 0.0, 30.0, "t", "h", "r", 0.5)
+
+    cmd = FFmpegCommandBuilder(cfg).build_base(Path("in.mp4"), Path("base.mkv"), candidate)
+    graph = cmd[cmd.index("-filter_complex") + 1]
+
+    assert "scale=134:240:force_original_aspect_ratio=increase,crop=134:240,gblur=sigma=5" in graph
+    assert "scale=1080:1920:flags=bilinear[bg]" in graph
+
+
+def test_keyframe_preroll_is_trimmed_before_letterbox_and_subtitles():
+    cfg = RenderConfig(1080, 1920, 1080, 608, 40, "h264_videotoolbox", "aac", "192k")
+    candidate = ClipCandidate("c1", 12.5, 72.5, "タイトル", "h", "r", 0.8)
+    builder = FFmpegCommandBuilder(cfg)
+
+    full = builder.build(
+        Path("in.mp4"), Path("o.mp4"), Path("sub.ass"), candidate, seek_keyframe_sec=12.0
+    )
+    base = builder.build_base(Path("in.mp4"), Path("b.mkv"), candidate, seek_keyframe_sec=12.0)
+
+    for cmd in (full, base):
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        chains = graph.split(";")
+        # Pre-roll frames are dropped and timestamps restart at the clip start before the
+        # blur/scale chain or the subtitles (timed from 0) read the video.
+        assert chains[0] == "[0:v]trim=start=0.500000:duration=60.000000,setpts=PTS-STARTPTS[srcv]"
+        assert chains[1] == (
+            "[0:a]atrim=start=0.500000:duration=60.000000,asetpts=PTS-STARTPTS[srca]"
+        )
+        assert not any("[0:v]" in chain for chain in chains[2:])
+        assert graph.index("[srcv]") < graph.index("gblur")
+        assert "-ss" not in cmd[cmd.index("-i") :]
+
+    graph = full[full.index("-filter_complex") + 1]
+    assert graph.index("setpts=PTS-STARTPTS") < graph.index("ass='sub.ass'")
+
+
+def test_batch_for_source_without_audio_has_no_audio_branches():
+    from podcast_clip_factory.infrastructure.render.ffmpeg_builder import BatchClip
+
+    builder = FFmpegCommandBuilder(
+        RenderConfig(1080, 1920, 1080, 608, 40, "libx264", "aac", "192k")
+    )
+    clips = [
+        BatchClip(Path("a.mp4"), None, ClipCandidate("a", 10, 40, "一", "h", "r", 0.9)),
+        BatchClip(
+            Path("b.mp4"),
+            None,
+            ClipCandidate("b", 50, 80, "二", "h", "r", 0.8),
+            [(0.0, 10.0), (15.0, 30.0)],
+        ),
+    ]
+
+    cmd = builder.build_batch(Path("in.mp4"), clips, seek_sec=10.0, has_audio=False)
+
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert "[0:a]" not in graph
+    assert "srca" not in graph and "atrim" not in graph
+    assert "-c:a" not in cmd
+    assert [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-map"] == ["[c0v]", "[c1v]"]
@@ -0,0 +1,132 @@
+import os
+from pathlib import Path
+from threading import Event
+
+from podcast_clip_factory.application.orchestrator import AppOrchestrator
+from podcast_clip_factory.domain.models import JobRecord, JobStatus, RenderedClip, ReviewDecision
+from podcast_clip_factory.utils.config import (
+    AppConfig,
+    LLMConfig,
+    RenderConfig,
+    Settings,
+    SubtitleConfig,
+    TranscribeConfig,
+)
+
+
+class SignatureRenderer:
+    def __init__(self):
+        self.rendered_ids = []
+
+    def overlay_signature(self, candidate, title_style=None, impact_style=None):
+        return f"{candidate.title}|{candidate.punchline}"
+
+    def render(self, input_video, output_dir, candidates, transcript, **kwargs):
+        clips = []
+        for candidate in candidates:
+            self.rendered_ids.append(candidate.clip_id)
+            path = output_dir / f"{candidate.clip_id}.mp4"
+            path.write_bytes(b"final")
+            clips.append(RenderedClip(candidate.clip_id, candidate.title, 0, 30, path))
+        return clips
+
+
+class DummyExecutor:
+    def __init__(self, settings, renderer):
+        self.settings = settings
+        self.renderer = renderer
+        self.cancel_event = Event()
+
+    def clear_stop(self):
+        pass
+
+    def load_silence_map(self, job_id):
+        return None
+
+
+class DummyRepo:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def save_review_decisions(self, job_id, decisions):
+        pass
+
+    def load_selected_final(self, job_id):
+        return self.rows
+
+    def get_job(self, job_id):
+        return JobRecord(job_id=job_id, input_path=Path("in.mp4"), status=JobStatus.REVIEW_PENDING)
+
+    def update_status(self, job_id, status, error_message=""):
+        pass
+
+
+class DummyStore:
+    def __init__(self, root: Path):
+        self.root = root
+
+    def job_dir(self, job_id):
+        path = self.root / job_id
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def transcript_path(self, job_id):
+        return self.job_dir(job_id) / "transcript_full.json"
+
+    def final_metadata_path(self, job_id):
+        return self.job_dir(job_id) / "final_metadata.json"
+
+    def write_json(self, path, payload):
+        pass
+
+    def load_silence_map(self, job_id):
+        return None
+
+
+class DummyLogger:
+    def info(self, *args, **kwargs):
+        pass
+
+
+def test_finalize_rerenders_only_changed_clips_and_links_unchanged(tmp_path: Path):
+    settings = Settings(
+        app=AppConfig(12, 10, 30, 60, 28, 3, True, 1, default_media_dir=str(tmp_path / "media")),
+        transcribe=TranscribeConfig("mlx", "faster", True, "m", "f"),
+        llm=LLMConfig("gemini", "heuristic", False, 0, True, "g", "", ""),
+        render=RenderConfig(1080, 1920, 1080, 608, 40, "h264_videotoolbox", "aac", "192k"),
+        subtitle=SubtitleConfig(
+            False, "Hiragino Sans", 52, "&H0039C1FF", "&H00FFFFFF", "&H00000000", 220
+        ),
+        root_dir=Path("."),
+    )
+    preview_a = tmp_path / "preview_a.mp4"
+    preview_a.write_bytes(b"preview")
+    preview_b = tmp_path / "preview_b.mp4"
+    preview_b.write_bytes(b"preview")
+    rows = [
+        {"clip_id": "a", "start_sec": 0, "end_sec": 30, "title": "same", "score": 0.9,
+         "video_path": str(preview_a), "render_signature": "same|hit"},
+        {"clip_id": "b", "start_sec": 40, "end_sec": 70, "title": "edited", "score": 0.8,
+         "video_path": str(preview_b), "render_signature": "original|hit"},
+    ]
+    renderer = SignatureRenderer()
+    orch = AppOrchestrator(
+        DummyExecutor(settings, renderer),
+        DummyRepo(rows),
+        DummyStore(tmp_path / "runs"),
+        DummyLogger(),
+    )
+
+    payload = orch.finalize_review(
+        "job1",
+        [ReviewDecision("a", True, "same"), ReviewDecision("b", True, "edited")],
+        impact_texts={"a": "hit", "b": "hit"},
+    )
+
+    assert renderer.rendered_ids == ["b"]
+    exported = {clip["clip_id"]: clip for clip in payload["clips"]}
+    assert not exported["a"]["rerendered"]
+    assert exported["b"]["rerendered"]
+    final_a = Path(exported["a"]["final_path"])
+    assert os.path.samefile(final_a, preview_a)
+    assert Path(exported["b"]["final_path"]).read_bytes() == b"final"
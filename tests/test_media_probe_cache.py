@@ -0,0 +1,39 @@
+import os
+from pathlib import Path
+
+from podcast_clip_factory.domain.models import MediaInfo
+from podcast_clip_factory.infrastructure.storage.media_probe_cache import MediaProbeCache
+
+
+def test_probe_cache_reuses_result_until_file_changes(monkeypatch, tmp_path: Path):
+    video = tmp_path / "in.mp4"
+    video.write_bytes(b"x" * 16)
+    calls = []
+
+    def fake_probe(path):
+        calls.append(path)
+        return MediaInfo(
+            duration_sec=120.0,
+            width=1920,
+            height=1080,
+            fps=29.97,
+            video_codec="h264",
+            audio_codec="aac",
+            audio_stream_count=1,
+            keyframe_interval_sec=2.0,
+        )
+
+    monkeypatch.setattr("podcast_clip_factory.utils.media.ffprobe_media", fake_probe)
+    cache = MediaProbeCache(tmp_path / "runs" / "media_cache.db")
+
+    first = cache.probe(video)
+    second = MediaProbeCache(tmp_path / "runs" / "media_cache.db").probe(video)
+    assert len(calls) == 1
+    assert second == first
+    assert second.video_codec == "h264"
+    assert second.keyframe_interval_sec == 2.0
+
+    video.write_bytes(b"y" * 32)
+    os.utime(video, ns=(1, 1))
+    cache.probe(video)
+    assert len(calls) == 2
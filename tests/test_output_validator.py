@@ -0,0 +1,83 @@
+import struct
+from pathlib import Path
+
+from podcast_clip_factory.domain.models import ClipCandidate, RenderedClip
+from podcast_clip_factory.infrastructure.render.output_validator import RenderedOutputValidator
+from podcast_clip_factory.infrastructure.storage.sqlite_repo import SQLiteJobRepository
+from podcast_clip_factory.utils.media import mp4_moov_before_mdat, verify_rendered_output
+
+
+def _box(kind: bytes, payload: bytes = b"") -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def _write_mp4(path: Path, faststart: bool) -> Path:
+    boxes = [_box(b"moov", b"m" * 16), _box(b"mdat", b"d" * 64)]
+    path.write_bytes(_box(b"ftyp", b"isom") + b"".join(boxes if faststart else boxes[::-1]))
+    return path
+
+
+def test_mp4_moov_before_mdat(tmp_path: Path):
+    assert mp4_moov_before_mdat(_write_mp4(tmp_path / "fast.mp4", faststart=True))
+    assert not mp4_moov_before_mdat(_write_mp4(tmp_path / "slow.mp4", faststart=False))
+
+
+def test_validator_flags_each_problem(monkeypatch, tmp_path: Path):
+    probes = {
+        "good.mp4": (30.1, {"video", "audio"}),
+        "slow.mp4": (30.0, {"video", "audio"}),
+        "short.mp4": (12.0, {"video"}),
+    }
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.output_validator.probe_output_streams",
+        lambda path: probes[path.name],
+    )
+    def clip(name: str, faststart: bool | None) -> RenderedClip:
+        path = tmp_path / f"{name}.mp4"
+        if faststart is not None:
+            _write_mp4(path, faststart)
+        return RenderedClip(name, "t", 0, 30, path, expected_duration_sec=30)
+
+    clips = [clip("good", True), clip("slow", False), clip("short", True), clip("gone", None)]
+
+    results = {r.clip_id: r for r in RenderedOutputValidator(max_workers=2).validate(clips)}
+
+    assert results["good"].ok
+    assert results["slow"].errors == ["moov_not_at_start"]
+    assert "no_audio_stream" in results["short"].errors
+    assert any(e.startswith("duration_mismatch") for e in results["short"].errors)
+    assert results["gone"].errors == ["missing_output"]
+
+
+def test_validations_are_recorded_in_sqlite(tmp_path: Path):
+    repo = SQLiteJobRepository(tmp_path / "jobs.db")
+    job = repo.create_job(tmp_path / "in.mp4")
+    repo.save_candidates(job.job_id, [ClipCandidate("c1", 0, 30, "t", "h", "r", 0.5)])
+    validator = RenderedOutputValidator()
+
+    result = validator.validate_one(RenderedClip("c1", "t", 0, 30, tmp_path / "missing.mp4"))
+    repo.save_validations(job.job_id, [result])
+
+    row = repo.get_review_rows(job.job_id)[0]
+    assert row["validation_status"] == "failed"
+    assert row["validation_errors"] == "missing_output"
+
+
+def test_resume_check_requires_audio_when_source_has_it(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(
+        "podcast_clip_factory.utils.media.probe_output_streams", lambda path: (30.0, {"video"})
+    )
+    path = _write_mp4(tmp_path / "silent.mp4", faststart=True)
+
+    assert verify_rendered_output(path, 30.0)
+    assert not verify_rendered_output(path, 30.0, expect_audio=True)
+
+
+def test_resume_check_rejects_non_faststart_mp4(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(
+        "podcast_clip_factory.utils.media.probe_output_streams",
+        lambda path: (30.0, {"video", "audio"}),
+    )
+
+    assert verify_rendered_output(_write_mp4(tmp_path / "fast.mp4", faststart=True), 30.0)
+    assert not verify_rendered_output(_write_mp4(tmp_path / "slow.mp4", faststart=False), 30.0)
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+from podcast_clip_factory.domain.models import ClipCandidate, ImpactOverlayStyle, TitleOverlayStyle
+from podcast_clip_factory.infrastructure.render.ffmpeg_builder import (
+    BatchClip,
+    FFmpegCommandBuilder,
+)
+from podcast_clip_factory.infrastructure.render.overlay_image_cache import OverlayImageCache
+from podcast_clip_factory.utils.config import RenderConfig
+
+
+def _fake_ffmpeg(monkeypatch):
+    runs = []
+
+    def fake_run(cmd, **kwargs):
+        runs.append(cmd)
+        Path(cmd[-1]).write_bytes(b"png")
+
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.overlay_image_cache.run_command", fake_run
+    )
+    return runs
+
+
+def test_builder_composites_cached_strips_instead_of_drawtext(tmp_path: Path):
+    cache = OverlayImageCache(tmp_path / "overlays")
+    builder = FFmpegCommandBuilder(
+        RenderConfig(1080, 1920, 1080, 608, 40, "libx264", "aac", "192k"), overlay_images=cache
+    )
+    candidate = ClipCandidate("c1", 0, 30, "タイトル", "h", "r", 0.8, punchline="一言")
+
+    cmd = builder.build(Path("in.mp4"), Path("out.mp4"), None, candidate)
+
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    inputs = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-i"]
+    assert "drawtext" not in graph
+    assert "[base][1:v]overlay=0:40[with_title]" in graph
+    assert "[with_title][2:v]overlay=0:1464[base_with_text]" in graph
+    assert inputs[0] == "in.mp4"
+    assert all(Path(path).parent == cache.root for path in inputs[1:])
+    assert len(set(inputs[1:])) == 2
+
+    no_impact = ClipCandidate("c2", 40, 70, "二本目", "h", "r", 0.7)
+    batch = builder.build_batch(
+        Path("in.mp4"),
+        [
+            BatchClip(Path("a.mp4"), None, candidate),
+            BatchClip(Path("b.mp4"), None, no_impact),
+        ],
+        seek_sec=0.0,
+    )
+    graph = batch[batch.index("-filter_complex") + 1]
+    assert batch.count("-i") == 4
+    assert "[c1base][3:v]overlay=0:40[c1with_title]" in graph
+    assert "[c1with_title]null[c1base_with_text]" in graph
+
+
+def test_strips_are_rasterized_once_per_text_and_style(monkeypatch, tmp_path: Path):
+    runs = _fake_ffmpeg(monkeypatch)
+    cache = OverlayImageCache(tmp_path / "overlays")
+    title = TitleOverlayStyle(y=80)
+
+    first = cache.image("タイトル", title, 1080)
+    again = cache.image("タイトル", title, 1080)
+    moved = cache.image("タイトル", TitleOverlayStyle(y=120), 1080)
+    cache.materialize(["ffmpeg", "-i", "in.mp4", "-i", str(first), "out.mp4"])
+
+    assert first == again != moved
+    assert len(runs) == 2
+    assert first.exists() and not list(cache.root.glob("*.partial.png"))
+    assert "s=1080x" in runs[0][runs[0].index("-i") + 1]
+    assert ":y=18:" in runs[0][runs[0].index("-vf") + 1]
+    assert cache.offset(title) == 62
+    assert cache.offset(ImpactOverlayStyle(background=False)) == 1480
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from podcast_clip_factory.application.pipeline_executor import PipelineExecutor
 from podcast_clip_factory.domain.clip_rules import ClipRuleConfig, ClipRuleEngine
 from podcast_clip_factory.domain.models import ClipCandidate, MediaInfo, Transcript, TranscriptSegment
@@ -43,8 +45,9 @@ class DummyTranscriber:
 
 
 class DummyRepo:
-    def __init__(self):
+    def __init__(self, job_status="review_pending"):
         self.statuses = []
+        self.job_status = job_status
 
     def create_job(self, input_path):
         from podcast_clip_factory.domain.models import JobRecord, JobStatus
@@ -60,10 +63,15 @@ class DummyRepo:
     def save_rendered(self, job_id, rendered):
         pass
 
+    def save_validations(self, job_id, validations):
+        pass
+
     def get_job(self, job_id):
         from podcast_clip_factory.domain.models import JobRecord, JobStatus
 
-        return JobRecord(job_id=job_id, input_path=Path("in.mp4"), status=JobStatus.REVIEW_PENDING)
+        return JobRecord(
+            job_id=job_id, input_path=Path("in.mp4"), status=JobStatus(self.job_status)
+        )
 
 
 class DummyStore:
@@ -159,3 +167,441 @@ def test_select_candidates_raises_when_cloud_required():
         assert False, "Expected RuntimeError"
     except RuntimeError as exc:
         assert "Geminiによる候補抽出に失敗" in str(exc)
+
+
+class SampleTranscriber:
+    accepts_samples = True
+
+    def __init__(self):
+        self.samples = None
+
+    def transcribe(self, audio_path, cancel_event=None, samples=None):
+        self.samples = samples
+        return Transcript(segments=[TranscriptSegment(start=0, end=40, text="s")], duration_sec=40)
+
+
+class FailingPathTranscriber:
+    def __init__(self):
+        self.paths = []
+
+    def transcribe(self, audio_path, cancel_event=None):
+        self.paths.append(audio_path)
+        raise RuntimeError("mlx down")
+
+
+def test_transcribe_feeds_streamed_samples_and_writes_wav_only_when_needed(monkeypatch, tmp_path):
+    settings = Settings(
+        app=AppConfig(12, 10, 30, 60, 28, 3, True, 1),
+        transcribe=TranscribeConfig("mlx", "faster", True, "m", "f", stream_audio=True),
+        llm=LLMConfig("gemini", "heuristic", False, 0, True, "g", "", ""),
+        render=RenderConfig(1080, 1920, 1080, 608, 40, "h264_videotoolbox", "aac", "192k"),
+        subtitle=SubtitleConfig(
+            False, "Hiragino Sans", 52, "&H0039C1FF", "&H00FFFFFF", "&H00000000", 220
+        ),
+        root_dir=Path("."),
+    )
+    primary = FailingPathTranscriber()
+    fallback = SampleTranscriber()
+    executor = PipelineExecutor(
+        settings=settings,
+        repo=DummyRepo(),
+        store=DummyStore(),
+        primary_transcriber=primary,
+        fallback_transcriber=fallback,
+        analyzer=FailingAnalyzer(),
+        fallback_analyzer=WorkingAnalyzer(),
+        rule_engine=ClipRuleEngine(ClipRuleConfig(12, 10, 30, 60, 28)),
+        renderer=DummyRenderer(),
+        logger=DummyLogger(),
+    )
+    written = []
+    monkeypatch.setattr(
+        "podcast_clip_factory.application.pipeline_executor.write_wav",
+        lambda samples, path: (written.append(path), path.write_bytes(b"RIFF")),
+    )
+    samples = object()
+    audio_path = tmp_path / "audio.wav"
+
+    transcript = executor._transcribe(audio_path, audio_samples=samples)
+
+    assert transcript.segments[0].text == "s"
+    assert fallback.samples is samples
+    assert primary.paths == [audio_path]
+    assert written == [audio_path]
+
+
+class IdentifiedTranscriber(DummyTranscriber):
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+        self.calls = 0
+
+    def cache_identity(self):
+        return {"name": "dummy", "model": self.model, "word_timestamps": True}
+
+    def transcribe(self, audio_path, cancel_event=None):
+        self.calls += 1
+        return super().transcribe(audio_path)
+
+
+def test_transcript_cache_skips_transcription_for_same_audio_and_model(tmp_path):
+    import wave
+
+    from podcast_clip_factory.infrastructure.storage.transcript_cache import TranscriptCache
+
+    settings = Settings(
+        app=AppConfig(12, 10, 30, 60, 28, 3, True, 1),
+        transcribe=TranscribeConfig("mlx", "faster", True, "m", "f"),
+        llm=LLMConfig("gemini", "heuristic", False, 0, True, "g", "", ""),
+        render=RenderConfig(1080, 1920, 1080, 608, 40, "h264_videotoolbox", "aac", "192k"),
+        subtitle=SubtitleConfig(
+            False, "Hiragino Sans", 52, "&H0039C1FF", "&H00FFFFFF", "&H00000000", 220
+        ),
+        root_dir=Path("."),
+    )
+    audio_path = tmp_path / "audio.wav"
+    with wave.open(str(audio_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b"\x01\x00" * 1600)
+    cache = TranscriptCache(tmp_path / "cache", max_bytes=1024 * 1024)
+    logs = []
+
+    def run(model):
+        primary = IdentifiedTranscriber(model)
+        executor = PipelineExecutor(
+            settings=settings,
+            repo=DummyRepo(),
+            store=DummyStore(),
+            primary_transcriber=primary,
+            fallback_transcriber=IdentifiedTranscriber("fallback"),
+            analyzer=FailingAnalyzer(),
+            fallback_analyzer=WorkingAnalyzer(),
+            rule_engine=ClipRuleEngine(ClipRuleConfig(12, 10, 30, 60, 28)),
+            renderer=DummyRenderer(),
+            logger=DummyLogger(),
+            transcript_cache=cache,
+        )
+        transcript = executor._transcribe(audio_path, on_log=logs.append)
+        return primary.calls, transcript
+
+    assert run("large")[0] == 1
+    calls, transcript = run("large")
+    assert calls == 0
+    assert transcript.segments[0].text == "t"
+    assert run("small")[0] == 1
+    assert [line for line in logs if "キャッシュ" in line] == [
+        "文字起こしキャッシュ: ミス",
+        "文字起こしキャッシュ: ヒット (mlx-whisper) 再利用します",
+        "文字起こしキャッシュ: ミス",
+    ]
+
+
+def test_transcript_cache_evicts_least_recently_used(tmp_path):
+    import os
+
+    from podcast_clip_factory.infrastructure.storage.transcript_cache import TranscriptCache
+
+    transcript = Transcript([TranscriptSegment(start=0, end=40, text="x" * 200)], duration_sec=40)
+    cache = TranscriptCache(tmp_path, max_bytes=700)
+    cache.put("a", transcript)
+    os.utime(tmp_path / "a.json", (1, 1))
+    cache.put("b", transcript)
+    os.utime(tmp_path / "b.json", (2, 2))
+    assert cache.get("a") is not None
+    cache.put("c", transcript)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_failed_revalidation_render_keeps_original_outputs(tmp_path):
+    from podcast_clip_factory.domain.models import ClipValidation, RenderedClip
+
+    class FailingRenderer:
+        def render(self, input_video, output_dir, candidates, transcript, **kwargs):
+            raise RuntimeError("encoder crashed")
+
+    class RejectingValidator:
+        def validate(self, clips, expect_audio=True):
+            return [ClipValidation(c.clip_id, False, errors=["moov_not_at_start"]) for c in clips]
+
+    class ValidationRepo(DummyRepo):
+        def save_validations(self, job_id, validations):
+            self.validations = validations
+
+    settings = Settings(
+        app=AppConfig(12, 10, 30, 60, 28, 3, True, 1),
+        transcribe=TranscribeConfig("mlx", "faster", True, "m", "f"),
+        llm=LLMConfig("gemini", "heuristic", False, 0, True, "g", "", ""),
+        render=RenderConfig(1080, 1920, 1080, 608, 40, "h264_videotoolbox", "aac", "192k"),
+        subtitle=SubtitleConfig(
+            False, "Hiragino Sans", 52, "&H0039C1FF", "&H00FFFFFF", "&H00000000", 220
+        ),
+        root_dir=Path("."),
+    )
+    repo = ValidationRepo()
+    executor = PipelineExecutor(
+        settings=settings,
+        repo=repo,
+        store=DummyStore(),
+        primary_transcriber=DummyTranscriber(),
+        fallback_transcriber=DummyTranscriber(),
+        analyzer=WorkingAnalyzer(),
+        fallback_analyzer=WorkingAnalyzer(),
+        rule_engine=ClipRuleEngine(ClipRuleConfig(12, 10, 30, 60, 28)),
+        renderer=FailingRenderer(),
+        logger=DummyLogger(),
+        validator=RejectingValidator(),
+    )
+    video = tmp_path / "f1.mp4"
+    video.write_bytes(b"slow start")
+    candidate = ClipCandidate("f1", 0, 40, "ok", "hook", "r", 0.5)
+    progress = []
+
+    rendered = executor._validate_rendered(
+        input_video=Path("in.mp4"),
+        job_id="j1",
+        candidates=[candidate],
+        rendered=[RenderedClip("f1", "ok", 0, 40, video)],
+        transcript=Transcript([], duration_sec=40),
+        expect_audio=True,
+        on_progress=lambda message, value: progress.append(value),
+        on_log=None,
+    )
+
+    assert rendered[0].video_path == video
+    assert video.read_bytes() == b"slow start"
+    assert [v.ok for v in repo.validations] == [False]
+    assert progress and min(progress) >= 0.96
+
+
+def test_resume_renders_saved_candidates_into_the_job_directory(monkeypatch, tmp_path):
+    from podcast_clip_factory.infrastructure.storage.artifact_store import ArtifactStore
+
+    class RecordingRenderer:
+        def __init__(self):
+            self.calls = []
+
+        def render(self, input_video, output_dir, candidates, transcript, **kwargs):
+            self.calls.append((output_dir, candidates, kwargs.get("reuse")))
+            return []
+
+    settings = Settings(
+        app=AppConfig(12, 10, 30, 60, 28, 3, True, 1),
+        transcribe=TranscribeConfig("mlx", "faster", True, "m", "f"),
+        llm=LLMConfig("gemini", "heuristic", False, 0, True, "g", "", ""),
+        render=RenderConfig(1080, 1920, 1080, 608, 40, "h264_videotoolbox", "aac", "192k"),
+        subtitle=SubtitleConfig(
+            False, "Hiragino Sans", 52, "&H0039C1FF", "&H00FFFFFF", "&H00000000", 220
+        ),
+        root_dir=Path("."),
+    )
+    store = ArtifactStore(tmp_path / "runs")
+    candidate = ClipCandidate("f1", 0, 40, "ok", "hook", "r", 0.5, punchline="一言")
+    store.save_candidates("j1", [candidate], "gemini")
+    store.save_transcript(
+        "j1", Transcript([TranscriptSegment(start=0, end=40, text="t")], duration_sec=40)
+    )
+    renderer = RecordingRenderer()
+    repo = DummyRepo(job_status="rendering")
+    executor = PipelineExecutor(
+        settings=settings,
+        repo=repo,
+        store=store,
+        primary_transcriber=DummyTranscriber(),
+        fallback_transcriber=DummyTranscriber(),
+        analyzer=FailingAnalyzer(),
+        fallback_analyzer=WorkingAnalyzer(),
+        rule_engine=ClipRuleEngine(ClipRuleConfig(12, 10, 30, 60, 28)),
+        renderer=renderer,
+        logger=DummyLogger(),
+    )
+    monkeypatch.setattr(
+        "podcast_clip_factory.application.pipeline_executor.ffprobe_media",
+        lambda path: MediaInfo(duration_sec=40, width=1920, height=1080, fps=30),
+    )
+
+    result = executor.resume("j1")
+
+    output_dir, candidates, reuse = renderer.calls[0]
+    assert output_dir == store.output_dir("j1")
+    assert candidates == [candidate]
+    assert reuse is True
+    assert repo.statuses[-1] == "review_pending"
+    assert result.candidates == [candidate]
+
+
+def test_resume_refuses_jobs_stopped_before_selection(tmp_path):
+    from podcast_clip_factory.infrastructure.storage.artifact_store import ArtifactStore
+
+    settings = Settings(
+        app=AppConfig(12, 10, 30, 60, 28, 3, True, 1),
+        transcribe=TranscribeConfig("mlx", "faster", True, "m", "f"),
+        llm=LLMConfig("gemini", "heuristic", False, 0, True, "g", "", ""),
+        render=RenderConfig(1080, 1920, 1080, 608, 40, "h264_videotoolbox", "aac", "192k"),
+        subtitle=SubtitleConfig(
+            False, "Hiragino Sans", 52, "&H0039C1FF", "&H00FFFFFF", "&H00000000", 220
+        ),
+        root_dir=Path("."),
+    )
+    repo = DummyRepo(job_status="failed")
+    executor = PipelineExecutor(
+        settings=settings,
+        repo=repo,
+        store=ArtifactStore(tmp_path / "runs"),
+        primary_transcriber=DummyTranscriber(),
+        fallback_transcriber=DummyTranscriber(),
+        analyzer=FailingAnalyzer(),
+        fallback_analyzer=WorkingAnalyzer(),
+        rule_engine=ClipRuleEngine(ClipRuleConfig(12, 10, 30, 60, 28)),
+        renderer=DummyRenderer(),
+        logger=DummyLogger(),
+    )
+
+    with pytest.raises(RuntimeError, match="再開できません"):
+        executor.resume("j1")
+    assert repo.statuses == ["failed"]
+
+    repo.statuses, repo.job_status = [], "completed"
+    with pytest.raises(RuntimeError, match="再開できる状態ではありません"):
+        executor.resume("j1")
+    assert repo.statuses == []
+
+
+def test_resume_drops_a_silence_map_detected_with_other_settings(tmp_path):
+    from podcast_clip_factory.domain.silence_map import SilenceMap
+    from podcast_clip_factory.infrastructure.storage.artifact_store import ArtifactStore
+
+    settings = Settings(
+        app=AppConfig(12, 10, 30, 60, 28, 3, True, 1),
+        transcribe=TranscribeConfig("mlx", "faster", True, "m", "f"),
+        llm=LLMConfig("gemini", "heuristic", False, 0, True, "g", "", ""),
+        render=RenderConfig(1080, 1920, 1080, 608, 40, "h264_videotoolbox", "aac", "192k"),
+        subtitle=SubtitleConfig(
+            False, "Hiragino Sans", 52, "&H0039C1FF", "&H00FFFFFF", "&H00000000", 220
+        ),
+        root_dir=Path("."),
+    )
+    store = ArtifactStore(tmp_path / "runs")
+    executor = PipelineExecutor(
+        settings=settings,
+        repo=DummyRepo(job_status="failed"),
+        store=store,
+        primary_transcriber=DummyTranscriber(),
+        fallback_transcriber=DummyTranscriber(),
+        analyzer=WorkingAnalyzer(),
+        fallback_analyzer=WorkingAnalyzer(),
+        rule_engine=ClipRuleEngine(ClipRuleConfig(12, 10, 30, 60, 28)),
+        renderer=DummyRenderer(),
+        logger=DummyLogger(),
+    )
+
+    store.save_silence_map("j1", SilenceMap([(1.0, 2.0)], -50.0, 0.35, 40.0))
+    assert executor.load_silence_map("j1") is None
+    store.save_silence_map("j1", SilenceMap([(1.0, 2.0)], -35.0, 0.35, 40.0))
+    assert executor.load_silence_map("j1").intervals == [(1.0, 2.0)]
+
+
+def test_revalidation_rerender_replaces_the_failing_clip_in_place(monkeypatch, tmp_path):
+    from podcast_clip_factory.domain.models import ClipValidation
+    from podcast_clip_factory.infrastructure.render.ffmpeg_builder import FFmpegCommandBuilder
+    from podcast_clip_factory.infrastructure.render.local_renderer import LocalFFmpegRenderer
+    from podcast_clip_factory.infrastructure.render.subtitle_generator import SubtitleGenerator
+
+    runs = []
+
+    def fake_run(cmd, **kwargs):
+        runs.append(Path(cmd[-1]).name)
+        Path(cmd[-1]).write_bytes(b"retry" if runs[3:] else b"first")
+
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.local_renderer.run_command", fake_run
+    )
+
+    class RejectOnceValidator:
+        def __init__(self):
+            self.calls = 0
+
+        def validate(self, clips, expect_audio=True):
+            self.calls += 1
+            return [
+                ClipValidation(c.clip_id, not (c.clip_id == "c2" and self.calls == 1))
+                for c in clips
+            ]
+
+    class OutputStore(DummyStore):
+        def output_dir(self, job_id):
+            return tmp_path / "out"
+
+    subtitle = SubtitleConfig(
+        True, "Hiragino Sans", 52, "&H0039C1FF", "&H00FFFFFF", "&H00000000", 220
+    )
+    render = RenderConfig(
+        1080, 1920, 1080, 608, 40, "libx264", "aac", "192k", keyframe_seek=False
+    )
+    render.preview_enabled = False
+    settings = Settings(
+        app=AppConfig(12, 10, 30, 60, 28, 3, True, 1, enable_silence_compaction=False),
+        transcribe=TranscribeConfig("mlx", "faster", True, "m", "f"),
+        llm=LLMConfig("gemini", "heuristic", False, 0, True, "g", "", ""),
+        render=render,
+        subtitle=subtitle,
+        root_dir=Path("."),
+    )
+    renderer = LocalFFmpegRenderer(
+        app_config=settings.app,
+        command_builder=FFmpegCommandBuilder(settings.render),
+        subtitle_generator=SubtitleGenerator(subtitle),
+        enable_subtitles=True,
+    )
+    executor = PipelineExecutor(
+        settings=settings,
+        repo=DummyRepo(),
+        store=OutputStore(),
+        primary_transcriber=DummyTranscriber(),
+        fallback_transcriber=DummyTranscriber(),
+        analyzer=WorkingAnalyzer(),
+        fallback_analyzer=WorkingAnalyzer(),
+        rule_engine=ClipRuleEngine(ClipRuleConfig(12, 10, 30, 60, 28)),
+        renderer=renderer,
+        logger=DummyLogger(),
+        validator=RejectOnceValidator(),
+    )
+    source = tmp_path / "in.mp4"
+    source.write_bytes(b"source")
+    transcript = Transcript(
+        [TranscriptSegment(start=i * 10.0, end=i * 10.0 + 8, text=f"t{i}") for i in range(20)],
+        duration_sec=200,
+    )
+    candidates = [
+        ClipCandidate("c1", 0, 40, "一本目", "h", "r", 0.9),
+        ClipCandidate("c2", 60, 100, "二本目", "h", "r", 0.8),
+        ClipCandidate("c3", 120, 160, "三本目", "h", "r", 0.7),
+    ]
+    rendered = renderer.render(source, tmp_path / "out", candidates, transcript)
+    subtitles = tmp_path / "out" / "subtitles"
+    before = {path.name: path.read_bytes() for path in subtitles.glob("*.ass")}
+
+    result = executor._validate_rendered(
+        input_video=source,
+        job_id="j1",
+        candidates=candidates,
+        rendered=rendered,
+        transcript=transcript,
+        expect_audio=False,
+        on_progress=None,
+        on_log=None,
+    )
+
+    clips_dir = tmp_path / "out" / "clips"
+    assert runs[3:] == ["clip_02_二本目.partial.mp4"]
+    assert result[1].video_path == clips_dir / "clip_02_二本目.mp4"
+    assert result[1].video_path.read_bytes() == b"retry"
+    assert sorted(path.name for path in clips_dir.glob("*.mp4")) == [
+        "clip_01_一本目.mp4",
+        "clip_02_二本目.mp4",
+        "clip_03_三本目.mp4",
+    ]
+    assert {path.name: path.read_bytes() for path in subtitles.glob("*.ass")} == before
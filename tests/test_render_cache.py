@@ -0,0 +1,283 @@
+from pathlib import Path
+
+from podcast_clip_factory.domain.models import ClipCandidate, Transcript
+from podcast_clip_factory.infrastructure.render.ffmpeg_builder import FFmpegCommandBuilder
+from podcast_clip_factory.infrastructure.render.local_renderer import LocalFFmpegRenderer
+from podcast_clip_factory.infrastructure.render.render_cache import RenderCache
+from podcast_clip_factory.infrastructure.render.subtitle_generator import SubtitleGenerator
+from podcast_clip_factory.utils.config import AppConfig, RenderConfig, SubtitleConfig
+
+
+def _renderer(
+    cache: RenderCache | None, base_layer_cache: RenderCache | None = None
+) -> LocalFFmpegRenderer:
+    app = AppConfig(12, 10, 30, 60, 28, 1, True, 1, enable_silence_compaction=False)
+    render = RenderConfig(
+        1080, 1920, 1080, 608, 40, "libx264", "aac", "192k", keyframe_seek=False
+    )
+    subtitle = SubtitleConfig(
+        False, "Hiragino Sans", 52, "&H0039C1FF", "&H00FFFFFF", "&H00000000", 220
+    )
+    return LocalFFmpegRenderer(
+        app_config=app,
+        command_builder=FFmpegCommandBuilder(render),
+        subtitle_generator=SubtitleGenerator(subtitle),
+        enable_subtitles=False,
+        render_cache=cache,
+        base_layer_cache=base_layer_cache,
+    )
+
+
+def test_identical_render_is_served_from_cache(monkeypatch, tmp_path: Path):
+    source = tmp_path / "in.mp4"
+    source.write_bytes(b"source")
+    runs = []
+
+    def fake_run(cmd, **kwargs):
+        runs.append(cmd)
+        Path(cmd[-1]).write_bytes(b"rendered")
+
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.local_renderer.run_command", fake_run
+    )
+    renderer = _renderer(RenderCache(tmp_path / "render_cache", max_bytes=1024))
+    candidate = ClipCandidate("c1", 10, 50, "タイトル", "h", "r", 0.9, punchline="一言")
+    transcript = Transcript(segments=[], duration_sec=600)
+
+    first = renderer.render(source, tmp_path / "output", [candidate], transcript)
+    second = renderer.render(source, tmp_path / "final_render", [candidate], transcript)
+    changed = renderer.render(
+        source,
+        tmp_path / "final_render",
+        [ClipCandidate("c1", 10, 50, "別タイトル", "h", "r", 0.9, punchline="一言")],
+        transcript,
+    )
+
+    assert len(runs) == 2
+    assert not first[0].cache_hit
+    assert second[0].cache_hit
+    assert second[0].video_path.read_bytes() == b"rendered"
+    assert not changed[0].cache_hit
+
+
+def test_render_cache_evicts_least_recently_used(tmp_path: Path):
+    cache = RenderCache(tmp_path / "render_cache", max_bytes=10)
+    for name in ("a", "b", "c"):
+        src = tmp_path / f"{name}.mp4"
+        src.write_bytes(b"12345")
+        cache.store(name, src)
+
+    assert not cache.fetch("a", tmp_path / "a_out.mp4")
+    assert cache.fetch("c", tmp_path / "c_out.mp4")
+
+
+def test_title_change_reuses_cached_base_layer(monkeypatch, tmp_path: Path):
+    source = tmp_path / "in.mp4"
+    source.write_bytes(b"source")
+    runs = []
+
+    def fake_run(cmd, **kwargs):
+        runs.append(cmd)
+        Path(cmd[-1]).write_bytes(b"layer")
+
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.local_renderer.run_command", fake_run
+    )
+    renderer = _renderer(
+        None, base_layer_cache=RenderCache(tmp_path / "base_cache", 1024, suffix=".mkv")
+    )
+    transcript = Transcript(segments=[], duration_sec=600)
+    for title in ("タイトル", "別タイトル", "三つ目"):
+        candidate = ClipCandidate("c1", 10, 50, title, "h", "r", 0.9, punchline="一言")
+        renderer.render(source, tmp_path / "output", [candidate], transcript)
+
+    # First render: one single-pass encode. The first edit builds the base layer; later
+    # edits only composite over the cached one.
+    outputs = [Path(cmd[-1]).suffix for cmd in runs]
+    assert outputs == [".mp4", ".mkv", ".mp4", ".mp4"]
+    assert "drawtext" not in runs[1][runs[1].index("-filter_complex") + 1]
+    assert not list((tmp_path / "output" / "base_layers").glob("*.mkv"))
+
+
+def test_default_config_first_finalize_is_one_encode_per_clip(monkeypatch, tmp_path: Path):
+    from podcast_clip_factory.domain.silence_map import SilenceMap
+    from podcast_clip_factory.utils.config import load_settings
+
+    source = tmp_path / "in.mp4"
+    source.write_bytes(b"source")
+    encodes = []
+
+    def fake_run(cmd, **kwargs):
+        encodes.append(cmd)
+        Path(cmd[-1]).write_bytes(b"rendered")
+
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.local_renderer.run_command", fake_run
+    )
+    settings = load_settings(Path(__file__).resolve().parents[1])
+    assert settings.render.preview_enabled and settings.app.base_layer_cache_max_gb > 0
+    renderer = LocalFFmpegRenderer(
+        app_config=settings.app,
+        command_builder=FFmpegCommandBuilder(settings.render),
+        subtitle_generator=SubtitleGenerator(settings.subtitle),
+        enable_subtitles=False,
+        render_cache=RenderCache(tmp_path / "render_cache", max_bytes=1024),
+        base_layer_cache=RenderCache(
+            tmp_path / "base_cache", 1024, suffix=FFmpegCommandBuilder.BASE_LAYER_SUFFIX
+        ),
+    )
+    candidates = [
+        ClipCandidate("c1", 10, 50, "一本目", "h", "r", 0.9, punchline="一言"),
+        ClipCandidate("c2", 100, 140, "二本目", "h", "r", 0.8, punchline="二言"),
+    ]
+    transcript = Transcript(segments=[], duration_sec=600)
+    silences = SilenceMap([], settings.app.silence_detect_noise_db, 0.35, 600)
+
+    preview_dir, final_dir = tmp_path / "output", tmp_path / "final_render"
+    renderer.render(
+        source, preview_dir, candidates, transcript, silence_map=silences, profile="preview"
+    )
+    encodes.clear()
+    renderer.render(source, final_dir, candidates, transcript, silence_map=silences)
+
+    assert [Path(cmd[-1]).suffix for cmd in encodes] == [".mp4", ".mp4"]
+
+
+def test_nearby_clips_share_one_batched_ffmpeg(monkeypatch, tmp_path: Path):
+    source = tmp_path / "in.mp4"
+    source.write_bytes(b"source")
+    runs = []
+
+    def fake_run(cmd, **kwargs):
+        runs.append(cmd)
+        for arg in cmd:
+            if arg.endswith(".mp4") and arg != str(source):
+                Path(arg).write_bytes(b"rendered")
+
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.local_renderer.run_command", fake_run
+    )
+    renderer = _renderer(None)
+    renderer.app_config.render_batch_max_clips = 2
+    candidates = [
+        ClipCandidate("c1", 10, 40, "一本目", "h", "r", 0.9),
+        ClipCandidate("c2", 900, 930, "遠い", "h", "r", 0.8),
+        ClipCandidate("c3", 50, 80, "二本目", "h", "r", 0.7),
+    ]
+
+    rendered = renderer.render(
+        source, tmp_path / "output", candidates, Transcript(segments=[], duration_sec=1000)
+    )
+
+    assert [clip.clip_id for clip in rendered] == ["c1", "c2", "c3"]
+    assert len(runs) == 2
+    batched = next(cmd for cmd in runs if cmd.count("-map") == 4)
+    graph = batched[batched.index("-filter_complex") + 1]
+    assert "[0:v]split=2[bv0][bv1]" in graph
+    assert "[bv1]select='gte(t,40.000000)*lt(t,70.000000)'" in graph
+    assert all(clip.video_path.exists() for clip in rendered)
+
+
+def test_batched_cache_hit_keeps_the_group_preroll(monkeypatch, tmp_path: Path):
+    source = tmp_path / "in.mp4"
+    source.write_bytes(b"source")
+    runs = []
+
+    def fake_run(cmd, **kwargs):
+        runs.append(cmd)
+        for arg in cmd:
+            if arg.endswith(".mp4") and arg != str(source):
+                Path(arg).write_bytes(b"rendered")
+
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.local_renderer.run_command", fake_run
+    )
+    renderer = _renderer(RenderCache(tmp_path / "render_cache", max_bytes=1024))
+    renderer.app_config.render_batch_max_clips = 2
+    candidates = [
+        ClipCandidate("c1", 10, 40, "一本目", "h", "r", 0.9),
+        ClipCandidate("c3", 50, 80, "二本目", "h", "r", 0.7),
+    ]
+    transcript = Transcript(segments=[], duration_sec=1000)
+
+    first = renderer.render(source, tmp_path / "output", candidates, transcript)
+    second = renderer.render(source, tmp_path / "final_render", candidates, transcript)
+
+    assert len(runs) == 1
+    assert all(clip.cache_hit for clip in second)
+    assert [clip.preroll_sec for clip in second] == [clip.preroll_sec for clip in first]
+    assert second[1].preroll_sec == 40.0
+
+
+def test_preview_profile_renders_small_fast_and_signs_differently(monkeypatch, tmp_path: Path):
+    source = tmp_path / "in.mp4"
+    source.write_bytes(b"source")
+    runs = []
+
+    def fake_run(cmd, **kwargs):
+        runs.append(cmd)
+        Path(cmd[-1]).write_bytes(b"rendered")
+
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.local_renderer.run_command", fake_run
+    )
+    renderer = _renderer(None, base_layer_cache=RenderCache(tmp_path / "base", max_bytes=1024))
+    candidate = ClipCandidate("c1", 10, 50, "タイトル", "h", "r", 0.9, punchline="一言")
+
+    preview = renderer.render(
+        source,
+        tmp_path / "output",
+        [candidate],
+        Transcript(segments=[], duration_sec=600),
+        profile="preview",
+    )
+
+    # Previews skip the base-layer pass: one encode, no intermediate.
+    assert len(runs) == 1
+    assert not (tmp_path / "output" / "base_layers").exists()
+    graph = runs[0][runs[0].index("-filter_complex") + 1]
+    assert "crop=540:960" in graph
+    assert "fontsize=28" in graph
+    assert runs[0][runs[0].index("-preset") + 1] == "ultrafast"
+    assert preview[0].overlay_signature != renderer.overlay_signature(candidate)
+    assert renderer.command_builder.config.video_width == 1080
+
+
+def test_rerender_resumes_from_verified_outputs(monkeypatch, tmp_path: Path):
+    source = tmp_path / "in.mp4"
+    source.write_bytes(b"source")
+    runs = []
+    crash_titles = {"二本目"}
+
+    def fake_run(cmd, **kwargs):
+        runs.append(cmd)
+        output = Path(cmd[-1])
+        assert output.name.endswith(".partial.mp4")
+        output.write_bytes(b"half")
+        if any(title in cmd[cmd.index("-filter_complex") + 1] for title in crash_titles):
+            raise RuntimeError("killed")
+        output.write_bytes(b"rendered")
+
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.local_renderer.run_command", fake_run
+    )
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.local_renderer.verify_rendered_output",
+        lambda path, duration, expect_audio=False: path.read_bytes() == b"rendered",
+    )
+    candidates = [
+        ClipCandidate("c1", 10, 40, "一本目", "h", "r", 0.9),
+        ClipCandidate("c2", 100, 130, "二本目", "h", "r", 0.8),
+    ]
+    transcript = Transcript(segments=[], duration_sec=600)
+
+    first = _renderer(None).render(source, tmp_path / "output", candidates, transcript)
+    crash_titles.clear()
+    runs.clear()
+    second = _renderer(None).render(source, tmp_path / "output", candidates, transcript)
+
+    clips_dir = tmp_path / "output" / "clips"
+    assert [clip.clip_id for clip in first] == ["c1"]
+    assert len(runs) == 1 and "二本目" in runs[0][runs[0].index("-filter_complex") + 1]
+    assert [clip.cache_hit for clip in second] == [True, False]
+    assert not list(clips_dir.glob("*.partial.mp4"))
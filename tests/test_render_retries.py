@@ -0,0 +1,160 @@
+from pathlib import Path
+
+import pytest
+
+from podcast_clip_factory.domain.models import ClipCandidate, Transcript
+from podcast_clip_factory.infrastructure.render.ffmpeg_builder import FFmpegCommandBuilder
+from podcast_clip_factory.infrastructure.render.local_renderer import LocalFFmpegRenderer
+from podcast_clip_factory.infrastructure.render.render_failures import (
+    RenderAttempt,
+    classify_render_failure,
+)
+from podcast_clip_factory.infrastructure.render.subtitle_generator import SubtitleGenerator
+from podcast_clip_factory.utils.config import AppConfig, RenderConfig, SubtitleConfig
+from podcast_clip_factory.utils.media import CommandError
+
+
+def _renderer(max_render_retries: int) -> LocalFFmpegRenderer:
+    app = AppConfig(
+        12, 10, 30, 60, 28, 1, True, max_render_retries, enable_silence_compaction=False
+    )
+    render = RenderConfig(
+        1080, 1920, 1080, 608, 40, "h264_videotoolbox", "aac", "192k", keyframe_seek=False
+    )
+    subtitle = SubtitleConfig(
+        False, "Hiragino Sans", 52, "&H0039C1FF", "&H00FFFFFF", "&H00000000", 220
+    )
+    renderer = LocalFFmpegRenderer(
+        app_config=app,
+        command_builder=FFmpegCommandBuilder(render),
+        subtitle_generator=SubtitleGenerator(subtitle),
+        enable_subtitles=False,
+    )
+    renderer.RETRY_DELAY_SEC = 0.0
+    return renderer
+
+
+def test_classify_render_failure():
+    def classify(returncode: int, stderr: str) -> str:
+        return classify_render_failure(CommandError("Command failed", returncode, stderr))
+
+    assert classify(1, "Unknown encoder 'h264_videotoolbox'") == "encoder"
+    assert classify(1, "Cannot find a valid font for the family Hiragino") == "font"
+    assert classify(-9, "") == "oom"
+    assert classify(1, "av_interleaved_write_frame(): No space left on device") == "io"
+    assert classify(1, "Invalid data found when processing input") == "unknown"
+    assert classify_render_failure(CommandError("Command cancelled: ffmpeg")) == "cancelled"
+
+
+_VIDEOTOOLBOX_BANNER = """ffmpeg version 7.0 Copyright (c) 2000-2024 the FFmpeg developers
+  configuration: --enable-videotoolbox --enable-libass --enable-libfreetype
+Fontconfig error: Cannot load default config file: No such file: (null)
+Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'in.mp4':
+  Duration: 01:02:03.04, start: 0.000000, bitrate: 4120 kb/s
+  Stream #0:0[0x1](und): Video: h264 (High) (avc1 / 0x31637661), yuv420p, 1920x1080, 30 fps
+  Stream #0:1[0x2](und): Audio: aac (LC) (mp4a / 0x6134706D), 48000 Hz, stereo, fltp
+Stream mapping:
+  Stream #0:0 (h264) -> select:default
+  gblur:default -> Stream #0:0 (h264_videotoolbox)
+  Stream #0:1 (aac) -> atrim:default
+  concat:default -> Stream #0:1 (aac)
+Press [q] to stop, [?] for help
+"""
+
+
+def test_classify_ignores_encoder_names_in_the_banner():
+    def classify(stderr: str) -> str:
+        return classify_render_failure(CommandError("Command failed", 1, stderr))
+
+    assert classify(
+        _VIDEOTOOLBOX_BANNER + "[ass @ 0x1] Invalid data found when processing input"
+    ) == "unknown"
+    assert classify(
+        _VIDEOTOOLBOX_BANNER + "[ass @ 0x1] Cannot find a valid font for the family Hiragino"
+    ) == "font"
+    assert classify(
+        _VIDEOTOOLBOX_BANNER
+        + "[h264_videotoolbox @ 0x2] Error: cannot create compression session: -12908\n"
+        + "[h264_videotoolbox @ 0x2] VTCompressionSessionCreate failed\n"
+        + "Error while opening encoder for output stream #0:0"
+    ) == "encoder"
+    assert classify(
+        _VIDEOTOOLBOX_BANNER + "[mp4 @ 0x3] Error initializing output stream 0:1 -- muxer failed"
+    ) == "unknown"
+
+
+def test_permission_denied_is_not_retried():
+    stderr = _VIDEOTOOLBOX_BANNER + "out/clips/clip_01.partial.mp4: Permission denied"
+    failure = classify_render_failure(CommandError("Command failed", 1, stderr))
+
+    assert failure == "fatal"
+    assert classify_render_failure(PermissionError(13, "Permission denied")) == "fatal"
+    assert RenderAttempt().degrade(failure, "h264_videotoolbox") is None
+
+
+def test_attempt_degrades_per_failure_class():
+    attempt = RenderAttempt()
+
+    assert attempt.degrade("encoder", "libx264") is None
+    assert attempt.degrade("encoder", "h264_videotoolbox").software_codec
+    font_overrides = attempt.degrade("font", "libx264").overrides(None, None, 4)
+    assert font_overrides["title_style"].font_name == "Sans"
+    assert attempt.degrade("oom", "libx264").overrides(None, None, 4)["threads"] == 1
+    assert attempt.degrade("io", "libx264") == attempt
+
+
+def test_font_failure_retries_with_fallback_font_and_keeps_partial_results(
+    monkeypatch, tmp_path: Path
+):
+    source = tmp_path / "in.mp4"
+    source.write_bytes(b"source")
+    runs = []
+
+    def fake_run(cmd, **kwargs):
+        runs.append(cmd)
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        if "壊れる" in graph:
+            raise CommandError("Command failed", 1, "Invalid data found when processing input")
+        if "font='Sans'" not in graph:
+            raise CommandError("Command failed", 1, "Cannot find a valid font for the family")
+        Path(cmd[-1]).write_bytes(b"rendered")
+
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.local_renderer.run_command", fake_run
+    )
+    renderer = _renderer(max_render_retries=2)
+    candidates = [
+        ClipCandidate("c1", 10, 40, "一本目", "h", "r", 0.9),
+        ClipCandidate("c2", 100, 130, "壊れる", "h", "r", 0.8),
+    ]
+
+    rendered = renderer.render(
+        source, tmp_path / "output", candidates, Transcript(segments=[], duration_sec=600)
+    )
+
+    assert [clip.clip_id for clip in rendered] == ["c1"]
+    assert rendered[0].video_path.read_bytes() == b"rendered"
+
+
+def test_render_raises_when_every_clip_fails(monkeypatch, tmp_path: Path):
+    source = tmp_path / "in.mp4"
+    source.write_bytes(b"source")
+    runs = []
+
+    def fake_run(cmd, **kwargs):
+        runs.append(cmd)
+        raise CommandError("Command failed", 1, "Unknown encoder 'h264_videotoolbox'")
+
+    monkeypatch.setattr(
+        "podcast_clip_factory.infrastructure.render.local_renderer.run_command", fake_run
+    )
+    renderer = _renderer(max_render_retries=3)
+
+    with pytest.raises(CommandError):
+        renderer.render(
+            source,
+            tmp_path / "output",
+            [ClipCandidate("c1", 10, 40, "一本目", "h", "r", 0.9)],
+            Transcript(segments=[], duration_sec=600),
+        )
+    assert [cmd[cmd.index("-c:v") + 1] for cmd in runs] == ["h264_videotoolbox", "libx264"]
@@ -0,0 +1,47 @@
+from podcast_clip_factory.infrastructure.render.render_scheduler import (
+    RenderScheduler,
+    available_memory_mb,
+)
+
+
+def test_plan_orders_longest_first_and_budgets_threads():
+    scheduler = RenderScheduler(cpu_count=8, available_memory_mb=64_000)
+
+    schedule = scheduler.plan([20.0, 60.0, 35.0])
+
+    assert schedule.order == [1, 2, 0]
+    assert schedule.workers == 3
+    assert schedule.threads_per_job == 2
+
+
+def test_plan_limits_pool_by_free_memory_and_cap():
+    low_memory = RenderScheduler(cpu_count=16, available_memory_mb=2_500, memory_per_job_mb=1_000)
+    capped = RenderScheduler(max_parallelism=2, cpu_count=16, available_memory_mb=64_000)
+
+    assert low_memory.plan([1.0] * 6).workers == 2
+    assert low_memory.plan([1.0] * 6, memory_weights=[3, 1]).workers == 1
+    schedule = capped.plan([1.0] * 6)
+    assert schedule.workers == 2
+    assert schedule.threads_per_job == 8
+
+
+def test_hardware_encoder_and_subtitles_adjust_cost():
+    scheduler = RenderScheduler()
+
+    assert scheduler.clip_cost(50.0, "h264_videotoolbox", False) < scheduler.clip_cost(
+        50.0, "libx264", False
+    )
+    assert scheduler.clip_cost(50.0, "libx264", True) > scheduler.clip_cost(50.0, "libx264", False)
+
+
+def test_available_memory_reads_memavailable_not_memfree(tmp_path):
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text(
+        "MemTotal:       32768000 kB\n"
+        "MemFree:          512000 kB\n"
+        "MemAvailable:   20480000 kB\n"
+        "Buffers:          100000 kB\n",
+        encoding="ascii",
+    )
+
+    assert available_memory_mb(str(meminfo)) == 20_000
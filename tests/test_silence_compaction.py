@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from podcast_clip_factory.domain.models import ClipCandidate, Transcript, TranscriptSegment
+from podcast_clip_factory.domain.silence_map import SilenceMap
 from podcast_clip_factory.infrastructure.render.ffmpeg_builder import FFmpegCommandBuilder
 from podcast_clip_factory.infrastructure.render.local_renderer import LocalFFmpegRenderer
 from podcast_clip_factory.infrastructure.render.subtitle_generator import SubtitleGenerator
@@ -79,7 +80,42 @@ def test_build_speech_intervals_compacts_gaps():
     assert intervals[-1][1] <= 60.0
 
 
-def test_ffmpeg_builder_uses_concat_when_speech_intervals_given():
+def test_silence_map_slice_is_clip_relative():
+    silence_map = SilenceMap(
+        intervals=[(50.0, 58.0), (4.0, 12.0), (100.0, 130.0), (10.0, 14.0)],
+        noise_db=-35.0,
+        min_silence_sec=0.35,
+    )
+    assert silence_map.intervals == [(4.0, 14.0), (50.0, 58.0), (100.0, 130.0)]
+    assert silence_map.slice(40.0, 100.0) == [(10.0, 18.0)]
+    assert silence_map.slice(110.0, 140.0) == [(0.0, 20.0)]
+    assert silence_map.slice(14.0, 50.0) == []
+
+
+def test_build_speech_intervals_uses_episode_silence_map():
+    renderer = _renderer()
+    candidate = ClipCandidate("c1", 100, 160, "t", "h", "r", 0.9)
+    transcript = Transcript(segments=[], duration_sec=600)
+    silence_map = SilenceMap(
+        intervals=[(104.0, 112.0), (120.0, 136.0)],
+        noise_db=-35.0,
+        min_silence_sec=0.35,
+    )
+
+    def _unexpected(_video, _candidate):
+        raise AssertionError("per-clip silencedetect should not run")
+
+    renderer._detect_silence_ranges = _unexpected  # type: ignore[method-assign]
+    intervals = renderer._build_speech_intervals(
+        Path("in.mp4"), candidate, transcript, silence_map=silence_map
+    )
+    assert intervals is not None
+    assert intervals[0][0] == 0.0
+    assert intervals[1][0] < 12.0 < intervals[1][1]
+    assert intervals[-1][1] == 60.0
+
+
+def test_ffmpeg_builder_uses_select_when_speech_intervals_given():
     render = RenderConfig(1080, 1920, 1080, 608, 40, "h264_videotoolbox", "aac", "192k")
     builder = FFmpegCommandBuilder(render)
     candidate = ClipCandidate(
@@ -100,6 +136,71 @@ def test_ffmpeg_builder_uses_concat_when_speech_intervals_given():
         speech_intervals=[(0.0, 5.0), (7.0, 12.0)],
     )
     graph = cmd[cmd.index("-filter_complex") + 1]
-    assert "concat=n=2:v=1:a=1[srcv][srca]" in graph
+    assert (
+        "[0:v]select='gte(t,0.000000)*lt(t,5.000000)+gte(t,7.000000)*lt(t,12.000000)',"
+        "setpts=N/FRAME_RATE/TB[srcv]" in graph
+    )
+    assert "[0:a]asplit=2[aseg0][aseg1]" in graph
+    assert "[aseg1]atrim=start=7.000000:end=12.000000,asetpts=PTS-STARTPTS[akeep1]" in graph
+    assert "[akeep0][akeep1]concat=n=2:v=0:a=1[srca]" in graph
     assert r"\n" in graph
     assert cmd[cmd.index("-map") + 3] == "[srca]"
+
+
+def test_many_cuts_stay_a_single_select_chain():
+    render = RenderConfig(1080, 1920, 1080, 608, 40, "libx264", "aac", "192k")
+    builder = FFmpegCommandBuilder(render)
+    candidate = ClipCandidate("c1", 0, 60, "title", "hook", "reason", 0.8)
+    intervals = [(i * 1.0, i * 1.0 + 0.6) for i in range(55)]
+
+    cmd = builder.build(
+        Path("in.mp4"), Path("out.mp4"), None, candidate, speech_intervals=intervals
+    )
+
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert graph.count("gte(t,") == 55
+    assert graph.count("select=") == 1
+    assert "[0:v]trim" not in graph
+    assert graph.count("atrim=") == 55
+
+
+def test_many_cuts_keep_audio_and_video_the_same_length():
+    import random
+    import re
+
+    from podcast_clip_factory.domain.compacted_timeline import align_to_frames
+
+    render = RenderConfig(1080, 1920, 1080, 608, 40, "libx264", "aac", "192k")
+    builder = FFmpegCommandBuilder(render)
+    rng = random.Random(7)
+    for fps in (30.0, 30000 / 1001, 25.0):
+        start = rng.uniform(100.0, 2000.0)
+        candidate = ClipCandidate("c1", start, start + 60, "title", "hook", "reason", 0.8)
+        raw = [(i + rng.uniform(0.0, 0.3), i + rng.uniform(0.5, 0.95)) for i in range(60)]
+        intervals = align_to_frames(raw, fps, origin_sec=start)
+
+        cmd = builder.build(
+            Path("in.mp4"),
+            Path("out.mp4"),
+            None,
+            candidate,
+            speech_intervals=intervals,
+            frame_rate=fps,
+        )
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        video_ranges = [
+            (float(a), float(b))
+            for a, b in re.findall(r"gte\(t,([\d.-]+)\)\*lt\(t,([\d.-]+)\)", graph)
+        ]
+        audio_ranges = [
+            (float(a), float(b))
+            for a, b in re.findall(r"atrim=start=([\d.]+):end=([\d.]+)", graph)
+        ]
+        # Source frames at k / fps, seen by the filter relative to the accurate -ss position.
+        frame_times = [k / fps - start for k in range(int(start * fps), int((start + 61) * fps))]
+        kept_frames = sum(1 for t in frame_times if any(a <= t < b for a, b in video_ranges))
+        audio_sec = sum(b - a for a, b in audio_ranges)
+
+        assert len(video_ranges) == len(audio_ranges) == 60
+        assert abs(kept_frames / fps - audio_sec) < 1e-4
+        assert abs(audio_sec - sum(b - a for a, b in intervals)) < 1e-4
@@ -1,4 +1,9 @@
-from podcast_clip_factory.domain.models import ClipCandidate, Transcript, TranscriptSegment
+from podcast_clip_factory.domain.models import (
+    ClipCandidate,
+    Transcript,
+    TranscriptSegment,
+    WordToken,
+)
 from podcast_clip_factory.infrastructure.render.subtitle_generator import SubtitleGenerator
 from podcast_clip_factory.utils.config import SubtitleConfig
 
@@ -38,3 +43,29 @@ def test_subtitle_lines_are_remapped_after_compaction():
     # "b" overlaps second kept interval [8-9], mapped to [5-6]
     assert lines[1][0] == 5.0
     assert lines[1][1] == 6.0
+
+
+def test_karaoke_tags_follow_compacted_word_timing():
+    gen = _generator()
+    gen.config.karaoke = True
+    candidate = ClipCandidate("c1", 100, 120, "t", "h", "r", 0.9)
+    transcript = Transcript(
+        segments=[
+            TranscriptSegment(
+                start=101.0,
+                end=109.0,
+                text="あい",
+                words=[WordToken("あ", 101.0, 102.0), WordToken("い", 107.0, 108.5)],
+            )
+        ],
+        duration_sec=200.0,
+    )
+    # Source 3-6 s of the clip is cut, so "い" starts 3 s earlier in the output.
+    lines = gen._build_dialogue_lines(
+        candidate, transcript, speech_intervals=[(0.0, 3.0), (6.0, 20.0)]
+    )
+
+    assert lines == [
+        (1.0, 3.0, r"{\kf100}あ"),
+        (3.0, 6.0, r"{\k100}{\kf150}い"),
+    ]
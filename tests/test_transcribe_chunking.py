@@ -0,0 +1,52 @@
+from podcast_clip_factory.domain.models import TranscriptSegment, WordToken
+from podcast_clip_factory.infrastructure.transcriber.chunking import merge_chunks, plan_chunks
+
+
+def test_plan_chunks_cuts_at_nearby_silence_midpoints():
+    chunks = plan_chunks(1800.0, [(590.0, 594.0), (1230.0, 1232.0)], target_sec=600.0)
+
+    assert [(c.start, c.end) for c in chunks] == [(0.0, 592.0), (592.0, 1231.0), (1231.0, 1800.0)]
+    # Silence cuts need no overlap: nothing is spoken at the boundary.
+    assert all(c.audio_start == c.start and c.audio_end == c.end for c in chunks)
+
+
+def test_plan_chunks_hard_cut_reads_overlap_on_both_sides():
+    chunks = plan_chunks(1300.0, [(100.0, 101.0)], target_sec=600.0, overlap_sec=2.0)
+
+    assert [(c.start, c.end) for c in chunks] == [(0.0, 600.0), (600.0, 1300.0)]
+    assert (chunks[0].audio_start, chunks[0].audio_end) == (0.0, 602.0)
+    assert (chunks[1].audio_start, chunks[1].audio_end) == (598.0, 1300.0)
+
+
+def test_plan_chunks_keeps_short_audio_whole():
+    assert len(plan_chunks(800.0, [], target_sec=600.0)) == 1
+
+
+def test_merge_chunks_offsets_and_deduplicates_overlap():
+    chunks = plan_chunks(1300.0, [], target_sec=600.0, overlap_sec=2.0)
+    first = [
+        TranscriptSegment(590.0, 595.0, "before", [WordToken("before", 590.0, 595.0)]),
+        TranscriptSegment(598.5, 601.5, "straddle"),
+    ]
+    # Chunk 2 audio starts at 598 s, so its times are relative to that.
+    second = [
+        TranscriptSegment(0.5, 3.5, "straddle"),
+        TranscriptSegment(5.0, 8.0, "after", [WordToken("after", 5.0, 8.0)]),
+    ]
+
+    merged = merge_chunks(chunks, [first, second])
+
+    assert [seg.text for seg in merged] == ["before", "straddle", "after"]
+    assert (merged[1].start, merged[1].end) == (598.5, 601.5)
+    assert (merged[2].start, merged[2].end) == (603.0, 606.0)
+    assert (merged[2].words[0].start, merged[2].words[0].end) == (603.0, 606.0)
+
+
+def test_non_wav_audio_duration_comes_from_ffprobe(monkeypatch, tmp_path):
+    from podcast_clip_factory.infrastructure.transcriber import faster_whisper
+
+    audio = tmp_path / "episode.m4a"
+    audio.write_bytes(b"not a wav")
+    monkeypatch.setattr(faster_whisper, "probe_output_streams", lambda path: (1800.0, {"audio"}))
+
+    assert faster_whisper._audio_duration(audio, None) == 1800.0
@@ -0,0 +1,46 @@
+import random
+
+from podcast_clip_factory.domain.models import Transcript, TranscriptSegment, WordToken
+from podcast_clip_factory.domain.transcript_index import TranscriptIndex
+
+
+def test_overlapping_matches_linear_scan_with_overlapping_segments():
+    rng = random.Random(7)
+    segments = []
+    for i in range(300):
+        start = i * 2.0 + rng.uniform(-1.5, 1.5)
+        segments.append(TranscriptSegment(start, start + rng.uniform(0.1, 9.0), f"s{i}"))
+    index = TranscriptIndex(segments)
+
+    for _ in range(200):
+        start = rng.uniform(-5, 620)
+        end = start + rng.uniform(0.0, 60.0)
+        expected = sorted(
+            (seg for seg in segments if seg.start < end and seg.end > start),
+            key=lambda seg: seg.start,
+        )
+        assert index.overlapping(start, end) == expected
+
+
+def test_words_between_and_text_between():
+    segments = [
+        TranscriptSegment(
+            0.0, 2.0, " こんにちは ", [WordToken("こん", 0.0, 0.8), WordToken("にちは", 0.8, 1.9)]
+        ),
+        TranscriptSegment(2.5, 4.0, "世界", [WordToken("世界", 2.5, 3.9)]),
+    ]
+    index = TranscriptIndex(segments)
+
+    assert [word.word for word in index.words_between(0.85, 3.0)] == ["にちは", "世界"]
+    assert index.words_between(1.9, 2.5) == []
+    assert index.text_between(1.0, 3.0) == "こんにちは 世界"
+
+
+def test_transcript_index_is_cached_and_rebuilt_when_segments_change():
+    transcript = Transcript(segments=[TranscriptSegment(0.0, 1.0, "a")])
+    first = transcript.index
+    assert transcript.index is first
+
+    transcript.segments.append(TranscriptSegment(1.0, 2.0, "b"))
+    assert transcript.index is not first
+    assert [seg.text for seg in transcript.index.overlapping(1.5, 3.0)] == ["b"]
@@ -0,0 +1,109 @@
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from podcast_clip_factory.infrastructure.storage.transcript_checkpoint import TranscriptCheckpoint
+from podcast_clip_factory.infrastructure.transcriber.faster_whisper import (
+    FasterWhisperOptions,
+    FasterWhisperTranscriber,
+)
+from podcast_clip_factory.utils.media import audio_content_hash, write_wav
+
+
+class LazyModel:
+    """Mimics faster-whisper: segments are produced only as the iterator is pulled."""
+
+    def __init__(self):
+        self.decoded = 0
+        self.decode_args = {}
+
+    def transcribe(self, audio, word_timestamps, vad_filter, **decode_args):
+        self.decode_args = decode_args
+
+        def segments():
+            for i in range(3):
+                self.decoded += 1
+                words = [SimpleNamespace(word=f" w{i}", start=i * 2.0, end=i * 2.0 + 1.0)]
+                yield SimpleNamespace(start=i * 2.0, end=i * 2.0 + 1.5, text=f" s{i} ", words=words)
+
+        return segments(), SimpleNamespace(language="en")
+
+
+def test_transcribe_stream_yields_segments_as_they_are_decoded():
+    transcriber = FasterWhisperTranscriber("small")
+    model = LazyModel()
+    transcriber._model = model
+
+    stream = transcriber.transcribe_stream(Path("missing.wav"), samples=[0.0] * 16000)
+    first = next(iter(stream))
+
+    assert (first.text, model.decoded) == ("s0", 1)
+    assert stream.language == "en"
+    stream.close()
+
+
+def test_transcribe_checkpoints_each_segment(tmp_path):
+    transcriber = FasterWhisperTranscriber("small")
+    transcriber._model = LazyModel()
+    checkpoint = TranscriptCheckpoint(tmp_path / "transcript_partial.jsonl").open()
+    seen = []
+
+    def on_segment(segment):
+        checkpoint.append(segment)
+        seen.append(len(TranscriptCheckpoint.load(checkpoint.path)))
+
+    transcript = transcriber.transcribe(
+        Path("missing.wav"), samples=[0.0] * 16000, on_segment=on_segment
+    )
+    checkpoint.close()
+
+    assert seen == [1, 2, 3]
+    assert checkpoint.transcribed_until == 5.5
+    assert [seg.text for seg in transcript.segments] == ["s0", "s1", "s2"]
+    assert TranscriptCheckpoint.load(checkpoint.path)[2].words[0].word == "w2"
+
+
+def test_checkpoint_load_ignores_torn_last_line(tmp_path):
+    path = tmp_path / "transcript_partial.jsonl"
+    path.write_text(
+        '{"start": 0.0, "end": 1.0, "text": "a", "words": []}\n{"start": 1.0, "end"',
+        encoding="utf-8",
+    )
+
+    assert [seg.text for seg in TranscriptCheckpoint.load(path)] == ["a"]
+
+
+def test_batched_options_reach_decoder_and_cache_identity():
+    default = FasterWhisperTranscriber("small")
+    batched = FasterWhisperTranscriber(
+        "small", options=FasterWhisperOptions(batch_size=16, beam_size=1, cpu_threads=8)
+    )
+    model = LazyModel()
+    batched._model = model
+
+    batched.transcribe(Path("missing.wav"), samples=[0.0] * 16000)
+
+    assert model.decode_args == {"beam_size": 1, "batch_size": 16}
+    assert batched.cache_identity() != default.cache_identity()
+    assert "cpu_threads" not in batched.cache_identity()
+
+
+def test_streamed_samples_and_ffmpeg_wav_share_content_hash(tmp_path):
+    # numpy ships with faster-whisper, which the streamed path needs anyway.
+    np = pytest.importorskip("numpy")
+    # ffmpeg's s16 WAV and its f32le stream of the same source: samples are s / 32768.
+    pcm = np.array([-32768, -32767, -1, 0, 1, 12345, 32767], dtype="<i2")
+    wav_path = tmp_path / "audio.wav"
+    with wave.open(str(wav_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(pcm.tobytes())
+    samples = pcm.astype(np.float32) / 32768.0
+    written = tmp_path / "written.wav"
+    write_wav(samples, written)
+
+    assert audio_content_hash(samples=samples) == audio_content_hash(wav_path)
+    assert audio_content_hash(written) == audio_content_hash(wav_path)
@@ -0,0 +1,111 @@
+import time
+from threading import Event, Thread
+
+import pytest
+
+from podcast_clip_factory.domain.models import TranscriptSegment, WordToken
+from podcast_clip_factory.infrastructure.transcriber.streaming import SegmentStream
+from podcast_clip_factory.infrastructure.transcriber.worker import (
+    TranscriptionWorkerClient,
+    TranscriptionWorkerServer,
+    WorkerUnavailableError,
+)
+
+
+class FakeEngine:
+    def __init__(self, segment_count=3, delay=0.0):
+        self.loads = 0
+        self.models = {}
+        self.segment_count = segment_count
+        self.delay = delay
+
+    def __call__(self, request, cancel_event):
+        if request["model"] not in self.models:
+            self.loads += 1
+            self.models[request["model"]] = object()
+
+        def segments():
+            for i in range(self.segment_count):
+                if cancel_event.is_set():
+                    raise RuntimeError("transcription cancelled")
+                time.sleep(self.delay)
+                yield TranscriptSegment(i, i + 1.0, f"s{i}", [WordToken(f"w{i}", i, i + 0.5)])
+
+        stream = SegmentStream()
+        stream.language = "ja"
+        return stream.bind(segments())
+
+
+@pytest.fixture
+def worker(tmp_path):
+    engine = FakeEngine()
+    server = TranscriptionWorkerServer(
+        tmp_path / "w.sock", idle_timeout_sec=0, engines={"fake": engine}
+    )
+    thread = Thread(target=server.serve, daemon=True)
+    thread.start()
+    client = TranscriptionWorkerClient(tmp_path / "w.sock", autostart=False)
+    yield client, engine
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+def test_worker_streams_segments_and_keeps_model_loaded(worker, tmp_path):
+    client, engine = worker
+
+    first = client.transcribe_stream("fake", "large", tmp_path / "a.wav").collect()
+    second = client.transcribe_stream("fake", "large", tmp_path / "b.wav").collect()
+
+    assert [seg.text for seg in first.segments] == ["s0", "s1", "s2"]
+    assert second.segments[2].words[0].word == "w2"
+    assert engine.loads == 1
+    assert client.ping()["engines"] == ["fake"]
+
+
+def test_worker_cancel_stops_job_but_serves_next(worker, tmp_path):
+    client, engine = worker
+    engine.segment_count, engine.delay = 200, 0.02
+    cancel = Event()
+    seen = []
+
+    def on_segment(segment):
+        seen.append(segment)
+        if len(seen) == 2:
+            cancel.set()
+
+    stream = client.transcribe_stream("fake", "large", tmp_path / "a.wav", cancel_event=cancel)
+    with pytest.raises(RuntimeError, match="cancelled"):
+        stream.collect(on_segment=on_segment)
+
+    engine.segment_count, engine.delay = 1, 0.0
+    transcript = client.transcribe_stream("fake", "large", tmp_path / "b.wav").collect()
+    assert [seg.text for seg in transcript.segments] == ["s0"]
+    assert engine.loads == 1
+
+
+def test_client_without_worker_reports_unavailable(tmp_path):
+    client = TranscriptionWorkerClient(tmp_path / "none.sock", autostart=False)
+
+    with pytest.raises(WorkerUnavailableError):
+        client.transcribe_stream("fake", "large", tmp_path / "a.wav")
+
+
+def test_second_server_does_not_steal_live_socket(worker, tmp_path):
+    client, _ = worker
+
+    with pytest.raises(WorkerUnavailableError):
+        TranscriptionWorkerServer(tmp_path / "w.sock", idle_timeout_sec=0, engines={})
+
+    assert client.ping()["engines"] == ["fake"]
+
+
+def test_stale_socket_is_replaced(tmp_path):
+    (tmp_path / "w.sock").write_text("")
+    server = TranscriptionWorkerServer(tmp_path / "w.sock", idle_timeout_sec=0, engines={})
+    thread = Thread(target=server.serve, daemon=True)
+    thread.start()
+    client = TranscriptionWorkerClient(tmp_path / "w.sock", autostart=False)
+
+    assert client.ping() is not None
+    server.shutdown()
+    thread.join(timeout=5)